@@ -4,25 +4,28 @@ Debug script to test .env.local validation for both templates
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from managers.template_manager import TemplateManager
+from debug_validation import is_glob, match_core_patterns
+from managers.template_manager import TemplateManager, load_yaml
+
+@lru_cache(maxsize=None)
+def _discover_cached():
+    """Discover templates once per run and index them by name."""
+    template_manager = TemplateManager()
+    templates = {t.name: t for t in template_manager.discover_templates()}
+    return template_manager, templates
 
 def debug_template_validation(template_name):
     print(f"\n=== Debugging {template_name} template validation ===")
     
-    template_manager = TemplateManager()
-    
     # Get template metadata
-    templates = template_manager.discover_templates()
-    template = None
-    for t in templates:
-        if t.name == template_name:
-            template = t
-            break
+    template_manager, templates = _discover_cached()
+    template = templates.get(template_name)
     
     if not template:
         print(f"❌ Template {template_name} not found")
@@ -38,16 +41,14 @@ def debug_template_validation(template_name):
     
     if env_local_path.exists():
         print(f"📏 File size: {env_local_path.stat().st_size} bytes")
-        with open(env_local_path, 'r') as f:
-            content = f.read()
-            print(f"📝 Content preview: {content[:100]}...")
+        with open(env_local_path, 'rb') as f:
+            preview = f.read(200).decode('utf-8', 'replace')[:100]
+            print(f"📝 Content preview: {preview}...")
     
     # Check template.yaml core files
-    import yaml
     template_yaml_path = template.template_path / "template.yaml"
     if template_yaml_path.exists():
-        with open(template_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(template_yaml_path)
         
         core_files = config.get("template_files", {}).get("core", [])
         print(f"📋 Core files in template.yaml: {len(core_files)} files")
@@ -64,6 +65,14 @@ def debug_template_validation(template_name):
         
         # Let's manually check the validation logic
         print("\n🔍 Manual validation check:")
+
+        glob_entries = [
+            f for f in core_files
+            if 'env' in f.lower() and is_glob(f)
+            and not (template.template_path / f).exists()
+        ]
+        pattern_matches = match_core_patterns(template.template_path, glob_entries)
+
         for file_path in core_files:
             if 'env' in file_path.lower():
                 full_path = template.template_path / file_path
@@ -81,17 +90,16 @@ def debug_template_validation(template_name):
                     print(f"    ✅ Directory match")
                     continue
 
-                # For files, check if any file in the template matches the pattern
-                found_match = False
-                for template_file in template.template_path.rglob("*"):
-                    if template_file.is_file():
-                        rel_path = template_file.relative_to(template.template_path)
-                        if str(rel_path) == file_path or file_path.rstrip("/") in str(rel_path):
-                            found_match = True
-                            print(f"    ✅ Pattern match: {rel_path}")
-                            break
+                # Literal paths are fully answered by the checks above
+                if not is_glob(file_path):
+                    print(f"    ❌ No match found")
+                    continue
 
-                if not found_match:
+                # For files, check if any file in the template matches the pattern
+                matches = pattern_matches[file_path]
+                if matches:
+                    print(f"    ✅ Pattern match: {matches[0]}")
+                else:
                     print(f"    ❌ No match found")
 
 if __name__ == "__main__":
@@ -4,16 +4,50 @@ Debug script to check GitHub repositories and muppet discovery.
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from integrations.github import GitHubClient
 from services.muppet_lifecycle_service import MuppetLifecycleService
 
+# Repeated debug runs within the TTL are served from disk to spare rate limits
+CACHE_DIR = Path.home() / ".cache" / "muppets" / "github"
+CACHE_TTL = int(os.getenv("MUPPETS_GH_TTL", "300"))
+
+
+async def cached_github_call(organization, endpoint, fetch):
+    """Return a cached GitHub response for (organization, endpoint), or fetch and store it."""
+    key = hashlib.sha256(f"{organization}:{endpoint}".encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.json"
+
+    try:
+        if time.time() - cache_file.stat().st_mtime < CACHE_TTL:
+            raw = cache_file.read_bytes()
+            print(f"(served from cache: {cache_file})")
+            return orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        pass
+
+    data = await fetch()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(orjson.dumps(data) if orjson else json.dumps(data).encode())
+    except OSError as e:
+        print(f"⚠️ Could not write GitHub cache: {e}")
+    return data
+
 
 async def main():
     """Debug GitHub repository discovery."""
@@ -34,7 +68,12 @@ async def main():
         
         # Get all repositories
         print("Fetching all repositories...")
-        repos = await client._fetch_repositories() if client._client else client._get_mock_repositories()
+        if client._client:
+            repos = await cached_github_call(
+                client.organization, "graphql/repositories", client.fetch_repositories_graphql
+            )
+        else:
+            repos = await client.fetch_repositories_graphql()
         print(f"Total repositories found: {len(repos)}\n")
         
         # Show all repositories
@@ -46,22 +85,17 @@ async def main():
         print()
         
         # Filter for muppet repositories
-        muppet_repos = []
-        for repo in repos:
-            topics = repo.get('topics', [])
-            if 'muppet' in topics:
-                muppet_repos.append(repo)
+        muppet_repos = [r for r in repos if 'muppet' in (r.get('topics') or ())]
         
         print(f"Muppet repositories (with 'muppet' topic): {len(muppet_repos)}")
         for repo in muppet_repos:
-            topics = repo.get('topics', [])
-            print(f"  - {repo['name']} - Topics: {topics}")
+            print(f"  - {repo['name']} - Topics: {repo['topics']}")
         
         print()
         
         # Test muppet discovery
         print("Testing muppet discovery...")
-        muppets = await client.discover_muppets()
+        muppets = await client.discover_muppets(repositories=repos)
         print(f"Discovered muppets: {len(muppets)}")
         for muppet in muppets:
             print(f"  - {muppet.name} ({muppet.template}) - Status: {muppet.status.value}")
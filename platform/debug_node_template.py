@@ -4,6 +4,7 @@
 Debug script to test node-express template validation
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -12,6 +13,16 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from managers.template_manager import TemplateManager
 
+def walk_files(root, prefix=""):
+    """Yield (relative path, DirEntry) for every file under root using cached dirent types."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            rel_path = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path, f"{rel_path}/")
+            elif entry.is_file(follow_symlinks=False):
+                yield rel_path, entry
+
 def main():
     print("🔍 Debugging node-express template validation...")
     
@@ -28,9 +39,8 @@ def main():
     
     if node_template_dir.exists():
         print("\nFiles in node-express template:")
-        for file in sorted(node_template_dir.rglob("*")):
-            if file.is_file():
-                print(f"  {file.relative_to(node_template_dir)}")
+        for rel_path, _ in sorted(walk_files(node_template_dir), key=lambda item: item[0]):
+            print(f"  {rel_path}")
     
     # Try to discover templates
     print("\n🔍 Discovering templates...")
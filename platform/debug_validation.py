@@ -4,9 +4,51 @@
 Debug script to test the template validation logic
 """
 
+import os
+from collections import defaultdict
+from fnmatch import fnmatch
+from itertools import chain
 from pathlib import Path
 import yaml
 
+# Same loader selection as TemplateManager (libyaml when available)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+GLOB_CHARS = "*?["
+
+
+def is_glob(file_path):
+    """Return True if a core entry contains glob metacharacters."""
+    return any(c in file_path for c in GLOB_CHARS)
+
+
+def match_core_patterns(template_path, patterns):
+    """
+    Match glob-style core entries against the template tree in a single walk.
+
+    Patterns are indexed by their literal file suffix (e.g. ".ts" for
+    "src/*.ts") so each file is only tested against patterns that could match
+    it; directory patterns and wildcard suffixes are tested against every file.
+
+    Returns a dict mapping each pattern to its matching relative paths.
+    """
+    by_suffix = defaultdict(list)
+    for pattern in patterns:
+        suffix = "" if pattern.endswith("/") else os.path.splitext(pattern)[1]
+        by_suffix["" if is_glob(suffix) else suffix].append(pattern)
+    any_suffix = by_suffix.pop("", [])
+
+    matches = {pattern: [] for pattern in patterns}
+    for root, _, files in os.walk(template_path):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), template_path)
+            candidates = by_suffix.get(os.path.splitext(name)[1], ())
+            for pattern in chain(candidates, any_suffix):
+                stripped = pattern.rstrip("/")
+                if fnmatch(rel_path, stripped) or fnmatch(rel_path, stripped + "/*"):
+                    matches[pattern].append(rel_path)
+    return matches
+
 def debug_validation():
     print("🔍 Debugging template validation logic...")
     
@@ -25,13 +67,19 @@ def debug_validation():
     
     # Load config
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_LOADER)
     
     template_files_config = config.get("template_files", {})
     core_files = template_files_config.get("core", [])
     
     print(f"\nCore files from template.yaml: {core_files}")
     
+    # Resolve every glob entry that is not a literal path in one tree walk
+    glob_entries = [
+        f for f in core_files if is_glob(f) and not (template_path / f).exists()
+    ]
+    pattern_matches = match_core_patterns(template_path, glob_entries)
+    
     # Test the validation logic
     missing_core_files = []
     for file_path in core_files:
@@ -41,15 +89,16 @@ def debug_validation():
         print(f"  Full path: {full_path}")
         print(f"  Full path exists: {full_path.exists()}")
         
-        if not full_path.exists():
+        if not full_path.exists() and not is_glob(file_path):
+            # A literal path that does not exist cannot match anything else
+            print(f"  ❌ No matching files found for pattern: {file_path}")
+            missing_core_files.append(file_path)
+        elif not full_path.exists():
             print("  ❌ Direct path check failed, trying glob pattern...")
             
-            # Test the complex glob logic
-            matching_files = []
-            for p in template_path.rglob("*"):
-                if file_path.rstrip("/") in str(p):
-                    matching_files.append(p)
-                    print(f"    Found matching file: {p}")
+            matching_files = [template_path / rel for rel in pattern_matches[file_path]]
+            for p in matching_files:
+                print(f"    Found matching file: {p}")
             
             if not matching_files:
                 print(f"  ❌ No matching files found for pattern: {file_path}")
@@ -10,10 +10,16 @@ import asyncio
 import json
 import logging
 import os
+import sys
 from typing import Any, Dict
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -21,12 +27,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Response bodies are decoded with orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _pretty(obj: Any) -> str:
+    """Pretty-print a response for display, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 class InteractiveTester:
     """Interactive testing interface for manual platform testing."""
 
     def __init__(self):
-        self.platform_url = os.getenv("PLATFORM_URL", "http://localhost:8000")
-        self.test_muppets = []
+        # Environment read once up front; later checks use this snapshot
+        self._env = {
+            k: os.environ.get(k)
+            for k in ("INTEGRATION_MODE", "GITHUB_TOKEN", "AWS_REGION", "PLATFORM_URL")
+        }
+        self.platform_url = self._env["PLATFORM_URL"] or "http://localhost:8000"
+        # muppet name -> {"template": ..., "repo": ...} for muppets created this session
+        self.test_muppets: Dict[str, Dict[str, Any]] = {}
         self.session = None
 
     async def initialize(self):
@@ -35,20 +58,27 @@ class InteractiveTester:
         logger.info("=" * 50)
 
         # Check if we're in real integration mode
-        integration_mode = os.getenv("INTEGRATION_MODE", "mock")
-        logger.info(f"Integration Mode: {integration_mode}")
-        logger.info(f"Platform URL: {self.platform_url}")
+        integration_mode = self._env["INTEGRATION_MODE"] or "mock"
+        logger.info("Integration Mode: %s", integration_mode)
+        logger.info("Platform URL: %s", self.platform_url)
 
         if integration_mode != "real":
             logger.warning(
                 "⚠️  Not in real integration mode. Set INTEGRATION_MODE=real for full testing."
             )
 
-        # Create HTTP session with longer timeout for muppet operations
+        # Create HTTP session with longer timeout for muppet operations and a
+        # keep-alive pool so menu actions reuse an open connection
         timeout = aiohttp.ClientTimeout(total=120)  # 2 minute timeout
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
-        # Verify platform connectivity
+        # Verify platform connectivity (this also warms the pooled connection)
         await self._verify_platform_connectivity()
 
         # Verify external service connectivity
@@ -61,17 +91,18 @@ class InteractiveTester:
         try:
             async with self.session.get(f"{self.platform_url}/health") as response:
                 if response.status == 200:
-                    health_data = await response.json()
+                    health_data = await response.json(loads=_json_loads)
                     logger.info(
-                        f"✅ Platform service is running: {health_data.get('status', 'unknown')}"
+                        "✅ Platform service is running: %s",
+                        health_data.get("status", "unknown"),
                     )
                 else:
                     raise Exception(
                         f"Health check failed with status {response.status}"
                     )
         except Exception as e:
-            logger.error(f"❌ Cannot connect to platform service at {self.platform_url}")
-            logger.error(f"   Error: {e}")
+            logger.error("❌ Cannot connect to platform service at %s", self.platform_url)
+            logger.error("   Error: %s", e)
             logger.error("   Please start the platform service with:")
             logger.error(
                 "   cd platform && python3 -m uvicorn src.main:app --reload --host 0.0.0.0 --port 8000"
@@ -83,15 +114,13 @@ class InteractiveTester:
         logger.info("🔍 Verifying external service connectivity...")
 
         # Test GitHub connectivity
-        github_token = os.getenv("GITHUB_TOKEN")
-        if github_token:
+        if self._env["GITHUB_TOKEN"]:
             logger.info("✅ GitHub token configured")
         else:
             logger.warning("⚠️  GitHub token not configured")
 
         # Test AWS connectivity
-        aws_region = os.getenv("AWS_REGION", "us-west-2")
-        logger.info(f"✅ AWS region: {aws_region}")
+        logger.info("✅ AWS region: %s", self._env["AWS_REGION"] or "us-west-2")
 
     async def _execute_mcp_tool(
         self, tool_name: str, arguments: Dict[str, Any]
@@ -104,58 +133,68 @@ class InteractiveTester:
                 f"{self.platform_url}/mcp/tools/execute",
                 json=payload,
                 headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(
-                    total=120
-                ),  # 2 minute timeout for long operations
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=_json_loads)
                 else:
                     error_text = await response.text()
-                    raise Exception(f"HTTP {response.status}: {error_text}")
-        except Exception as e:
-            logger.error(f"❌ Failed to execute tool {tool_name}: {e}")
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=error_text,
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("❌ Failed to execute tool %s: %s", tool_name, e)
             raise
 
+    async def _ainput(self, prompt: str) -> str:
+        """Read a stripped line from stdin without blocking the event loop."""
+        return (await asyncio.to_thread(input, prompt)).strip()
+
+    _MENU = (
+        "\n" + "=" * 50 + "\n"
+        "🎭 Muppet Platform Interactive Tester\n"
+        + "=" * 50 + "\n"
+        "1. List available templates\n"
+        "2. Create a test muppet\n"
+        "3. Get muppet status\n"
+        "4. List all muppets\n"
+        "5. Test pipeline management\n"
+        "6. Test steering documentation\n"
+        "7. Run cleanup (manual deletion instructions)\n"
+        "8. Exit\n"
+        + "-" * 50 + "\n"
+    )
+
     async def run_interactive_session(self):
         """Run the interactive testing session."""
+        actions = {
+            "1": self._test_list_templates,
+            "2": self._test_create_muppet,
+            "3": self._test_get_muppet_status,
+            "4": self._test_list_muppets,
+            "5": self._test_pipeline_management,
+            "6": self._test_steering_docs,
+            "7": self._show_manual_deletion_instructions,
+        }
         while True:
-            print("\n" + "=" * 50)
-            print("🎭 Muppet Platform Interactive Tester")
-            print("=" * 50)
-            print("1. List available templates")
-            print("2. Create a test muppet")
-            print("3. Get muppet status")
-            print("4. List all muppets")
-            print("5. Test pipeline management")
-            print("6. Test steering documentation")
-            print("7. Run cleanup (manual deletion instructions)")
-            print("8. Exit")
-            print("-" * 50)
-
-            choice = input("Select an option (1-8): ").strip()
+            sys.stdout.write(self._MENU)
+            sys.stdout.flush()
+
+            choice = await self._ainput("Select an option (1-8): ")
+            if choice == "8":
+                break
+
+            action = actions.get(choice)
+            if action is None:
+                print("❌ Invalid choice. Please select 1-8.")
+                continue
 
             try:
-                if choice == "1":
-                    await self._test_list_templates()
-                elif choice == "2":
-                    await self._test_create_muppet()
-                elif choice == "3":
-                    await self._test_get_muppet_status()
-                elif choice == "4":
-                    await self._test_list_muppets()
-                elif choice == "5":
-                    await self._test_pipeline_management()
-                elif choice == "6":
-                    await self._test_steering_docs()
-                elif choice == "7":
-                    await self._show_manual_deletion_instructions()
-                elif choice == "8":
-                    break
-                else:
-                    print("❌ Invalid choice. Please select 1-8.")
+                await action()
             except Exception as e:
-                logger.error(f"❌ Test failed: {e}")
+                logger.error("❌ Test failed: %s", e)
                 print(f"Error: {e}")
 
     async def _test_list_templates(self):
@@ -169,21 +208,21 @@ class InteractiveTester:
                 print(f"   - {template['name']}: {template['description']}")
         else:
             print("❌ No templates found or error occurred")
-            print(f"Response: {json.dumps(response, indent=2)}")
+            print(f"Response: {_pretty(response)}")
 
     async def _test_create_muppet(self):
         """Test creating a muppet."""
         print("\n🎭 Testing: Create Muppet")
 
-        muppet_name = input(
+        muppet_name = await self._ainput(
             "Enter muppet name (or press Enter for 'test-manual-muppet'): "
-        ).strip()
+        )
         if not muppet_name:
             muppet_name = "test-manual-muppet"
 
-        template = input(
+        template = await self._ainput(
             "Enter template name (or press Enter for 'java-micronaut'): "
-        ).strip()
+        )
         if not template:
             template = "java-micronaut"
 
@@ -194,9 +233,10 @@ class InteractiveTester:
         )
 
         if response.get("success"):
+            repo_url = response.get("repository", {}).get("url")
             print(f"✅ Muppet created successfully!")
-            print(f"   Repository: {response.get('repository', {}).get('url', 'N/A')}")
-            self.test_muppets.append(muppet_name)
+            print(f"   Repository: {repo_url or 'N/A'}")
+            self.test_muppets[muppet_name] = {"template": template, "repo": repo_url}
         else:
             print(
                 f"❌ Failed to create muppet: {response.get('error', 'Unknown error')}"
@@ -208,16 +248,17 @@ class InteractiveTester:
 
         if self.test_muppets:
             print("Available test muppets:")
-            for i, muppet in enumerate(self.test_muppets, 1):
-                print(f"   {i}. {muppet}")
+            names = list(self.test_muppets)
+            for i, (muppet, info) in enumerate(self.test_muppets.items(), 1):
+                print(f"   {i}. {muppet} ({info['template']})")
 
-            choice = input("Select muppet number or enter custom name: ").strip()
-            if choice.isdigit() and 1 <= int(choice) <= len(self.test_muppets):
-                muppet_name = self.test_muppets[int(choice) - 1]
+            choice = await self._ainput("Select muppet number or enter custom name: ")
+            if choice.isdigit() and 1 <= int(choice) <= len(names):
+                muppet_name = names[int(choice) - 1]
             else:
                 muppet_name = choice
         else:
-            muppet_name = input("Enter muppet name: ").strip()
+            muppet_name = await self._ainput("Enter muppet name: ")
 
         if not muppet_name:
             print("❌ No muppet name provided")
@@ -252,7 +293,7 @@ class InteractiveTester:
                 )
         else:
             print("❌ No muppets found or error occurred")
-            print(f"Response: {json.dumps(response, indent=2)}")
+            print(f"Response: {_pretty(response)}")
 
     async def _show_manual_deletion_instructions(self):
         """Show instructions for manual muppet deletion."""
@@ -279,12 +320,13 @@ class InteractiveTester:
 
         if self.test_muppets:
             print("Current test muppets that may need cleanup:")
-            for muppet in self.test_muppets:
+            for muppet, info in self.test_muppets.items():
+                repo_url = info["repo"] or f"https://github.com/muppet-platform/{muppet}"
                 print(f"   - {muppet}")
-                print(f"     GitHub: https://github.com/muppet-platform/{muppet}")
+                print(f"     GitHub: {repo_url}")
             print()
             print("Example deletion commands for test muppets:")
-            for muppet in self.test_muppets:
+            for muppet in self.test_muppets.keys():
                 print(f"   gh repo delete muppet-platform/{muppet} --yes")
         else:
             print("No test muppets tracked in this session.")
@@ -293,7 +335,7 @@ class InteractiveTester:
         print(
             "⚠️  **Important:** Always verify what you're deleting before running commands!"
         )
-        input("Press Enter to continue...")
+        await self._ainput("Press Enter to continue...")
 
     async def _test_pipeline_management(self):
         """Test pipeline management tools."""
@@ -302,12 +344,12 @@ class InteractiveTester:
         print("2. Update muppet pipelines")
         print("3. Rollback muppet pipelines")
 
-        choice = input("Select pipeline test (1-3): ").strip()
+        choice = await self._ainput("Select pipeline test (1-3): ")
 
         if choice == "1":
-            template_type = input(
+            template_type = await self._ainput(
                 "Enter template type (or press Enter for 'java-micronaut'): "
-            ).strip()
+            )
             if not template_type:
                 template_type = "java-micronaut"
 
@@ -315,13 +357,13 @@ class InteractiveTester:
                 "list_workflow_versions", {"template_type": template_type}
             )
             print(f"Workflow versions for {template_type}:")
-            print(json.dumps(response, indent=2))
+            print(_pretty(response))
 
         elif choice in ["2", "3"]:
-            muppet_name = input("Enter muppet name: ").strip()
-            workflow_version = input(
+            muppet_name = await self._ainput("Enter muppet name: ")
+            workflow_version = await self._ainput(
                 "Enter workflow version (e.g., 'java-micronaut-v1.2.3'): "
-            ).strip()
+            )
 
             if not muppet_name or not workflow_version:
                 print("❌ Both muppet name and workflow version are required")
@@ -351,15 +393,15 @@ class InteractiveTester:
         print("1. List steering docs")
         print("2. Update shared steering")
 
-        choice = input("Select steering test (1-2): ").strip()
+        choice = await self._ainput("Select steering test (1-2): ")
 
         if choice == "1":
-            muppet_name = input("Enter muppet name (optional): ").strip()
+            muppet_name = await self._ainput("Enter muppet name (optional): ")
             args = {"muppet_name": muppet_name} if muppet_name else {}
 
             response = await self._execute_mcp_tool("list_steering_docs", args)
             print("Steering documentation:")
-            print(json.dumps(response, indent=2))
+            print(_pretty(response))
 
         elif choice == "2":
             response = await self._execute_mcp_tool("update_shared_steering", {})
@@ -386,7 +428,7 @@ async def main():
     except KeyboardInterrupt:
         print("\n👋 Testing session interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Testing session failed: {e}")
+        logger.error("❌ Testing session failed: %s", e)
         return 1
     finally:
         await tester.cleanup()
@@ -7,57 +7,246 @@ It translates MCP protocol calls to HTTP API requests.
 """
 
 import asyncio
+import importlib.util
 import json
 import sys
-import httpx
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+import threading
+import time
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# Number of MCP commands processed concurrently
+MAX_IN_FLIGHT = 8
+
+# Tool calls arriving within BATCH_WINDOW seconds share one request
+MAX_BATCH = 16
+BATCH_WINDOW = 0.005
+
+# Seconds to reuse /health and /tools/list responses
+HEALTH_TTL = 10.0
+TOOLS_TTL = 60.0
+
+# Characters of an error response body included in error results
+ERROR_DETAIL_LIMIT = 512
+
+
+def http_error(response) -> dict:
+    """Describe an HTTP error response without parsing its body."""
+    return {
+        "error": f"HTTP {response.status_code}",
+        "detail": response.text[:ERROR_DETAIL_LIMIT],
+    }
 
 
 class MCPHTTPBridge:
     """Bridge between MCP protocol and HTTP API."""
     
     def __init__(self, base_url: str):
+        # httpx is imported here rather than at module level so the usage
+        # path does not pay for it
+        import httpx
+        
         self.base_url = base_url.rstrip('/')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # One pooled client for the whole session; HTTP/2 multiplexes calls
+        # over a single connection when h2 is installed
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Ask for JSON so error responses are not HTML pages
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        # Tool calls are coalesced into /tools/execute_batch requests; the
+        # flag flips to False once the server shows it lacks that route
+        self._batch_queue: asyncio.Queue = asyncio.Queue()
+        self._batch_task = None
+        # In-flight _send_batch tasks, cancelled on close()
+        self._send_tasks: set = set()
+        self._supports_batch = True
+        # path -> (fetched_at, response body) for read-only endpoints
+        self._cache: dict = {}
+        # Failures reported as error results: transport/HTTP errors and
+        # undecodable bodies. Anything else, including cancellation, propagates.
+        self._request_errors = (httpx.HTTPError, ValueError)
+    
+    async def _get_cached(self, path: str, ttl: float):
+        """GET a JSON endpoint, reusing a successful response for ttl seconds.
+
+        HTTP error responses are returned as an error dict and not cached.
+        """
+        cached = self._cache.get(path)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        try:
+            response = await self.client.get(path)
+        except self._request_errors:
+            self._cache.pop(path, None)
+            raise
+        if response.status_code >= 400:
+            self._cache.pop(path, None)
+            return http_error(response)
+        data = json_loads(response.content)
+        self._cache[path] = (time.monotonic(), data)
+        return data
+    
+    async def close(self):
+        """Stop the batching and send tasks and close the HTTP client."""
+        tasks = [*self._send_tasks]
+        if self._batch_task:
+            tasks.append(self._batch_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.client.aclose()
     
     async def list_tools(self):
         """List available tools from HTTP API."""
         try:
-            response = await self.client.get(f"{self.base_url}/tools/list")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_cached("/tools/list", TOOLS_TTL)
+            if "error" in data:
+                print(f"Error listing tools: {data}", file=sys.stderr)
             return data.get("tools", [])
-        except Exception as e:
+        except self._request_errors as e:
             print(f"Error listing tools: {e}", file=sys.stderr)
             return []
     
     async def execute_tool(self, tool_name: str, arguments: dict):
-        """Execute a tool via HTTP API."""
+        """Execute a tool via HTTP API, batching it with concurrent calls."""
+        if not self._supports_batch:
+            return await self._execute_single(tool_name, arguments)
+        
+        if self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._batch_loop())
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((tool_name, arguments, future))
+        return await future
+    
+    async def _batch_loop(self):
+        """Collect queued calls for up to BATCH_WINDOW or MAX_BATCH items and send them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            # Send in the background so the next batch can start filling
+            task = asyncio.create_task(self._send_batch(batch))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+    
+    async def _send_batch(self, batch: list):
+        """Send a batch of calls and resolve each caller's future.
+
+        Every future is resolved, with an error result if the send fails
+        or is cancelled, so no tools/call waits forever.
+        """
+        results = []
+        try:
+            if len(batch) == 1 or not self._supports_batch:
+                results = await asyncio.gather(
+                    *(self._execute_single(tool, args) for tool, args, _ in batch)
+                )
+            else:
+                results = await self._execute_batch(batch)
+        except Exception as e:
+            print(f"Error executing tool batch: {e}", file=sys.stderr)
+            results = [{"error": str(e)}] * len(batch)
+        finally:
+            for i, (_, _, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(
+                        results[i] if i < len(results) else {"error": "Bridge closed"}
+                    )
+    
+    async def _execute_batch(self, batch: list) -> list:
+        """Execute several tools in one /tools/execute_batch request."""
+        payload = {
+            "batch": [
+                {"tool": tool, "arguments": args, "id": i}
+                for i, (tool, args, _) in enumerate(batch)
+            ]
+        }
+        try:
+            response = await self.client.post("/tools/execute_batch", json=payload)
+            if response.status_code in (404, 405):
+                # Older server without the batch route: remember and fall back
+                self._supports_batch = False
+                return await asyncio.gather(
+                    *(self._execute_single(tool, args) for tool, args, _ in batch)
+                )
+            if response.status_code >= 400:
+                error = http_error(response)
+                print(f"Error executing tool batch: {error}", file=sys.stderr)
+                return [error] * len(batch)
+            by_id = {
+                item["id"]: item
+                for item in json_loads(response.content)["results"]
+            }
+        except (*self._request_errors, KeyError, TypeError) as e:
+            print(f"Error executing tool batch: {e}", file=sys.stderr)
+            return [{"error": str(e)}] * len(batch)
+        
+        results = []
+        for i, (tool, _, _) in enumerate(batch):
+            item = by_id.get(i, {})
+            if "error" in item or "result" not in item:
+                error = item.get("error", "Missing result in batch response")
+                print(f"Error executing tool {tool}: {error}", file=sys.stderr)
+                results.append({"error": error})
+            else:
+                results.append(item["result"])
+        return results
+    
+    async def _execute_single(self, tool_name: str, arguments: dict):
+        """Execute a single tool via /tools/execute."""
         try:
             payload = {
                 "tool": tool_name,
                 "arguments": arguments
             }
-            response = await self.client.post(
-                f"{self.base_url}/tools/execute",
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            response = await self.client.post("/tools/execute", json=payload)
+            if response.status_code >= 400:
+                error = http_error(response)
+                print(f"Error executing tool {tool_name}: {error}", file=sys.stderr)
+                return error
+            return json_loads(response.content)
+        except self._request_errors as e:
             print(f"Error executing tool {tool_name}: {e}", file=sys.stderr)
             return {"error": str(e)}
     
     async def health_check(self):
         """Check if the HTTP API is healthy."""
         try:
-            response = await self.client.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            health = await self._get_cached("/health", HEALTH_TTL)
+        except self._request_errors as e:
             print(f"Health check failed: {e}", file=sys.stderr)
             return {"status": "unhealthy", "error": str(e)}
+        if "error" in health:
+            return {"status": "unhealthy", **health}
+        return health
 
 
 async def main():
@@ -68,55 +257,100 @@ async def main():
     
     base_url = sys.argv[1]
     bridge = MCPHTTPBridge(base_url)
-    
-    # Test connection
-    health = await bridge.health_check()
+    try:
+        await run_bridge(bridge, base_url)
+    finally:
+        await bridge.close()
+
+
+def build_handlers(bridge: MCPHTTPBridge, tools: list) -> dict:
+    """Map each supported MCP method to the coroutine that serves it."""
+
+    async def list_tools(command: dict) -> dict:
+        return {"tools": tools}
+
+    async def call_tool(command: dict) -> dict:
+        params = command.get("params", {})
+        return await bridge.execute_tool(
+            params.get("name"), params.get("arguments", {})
+        )
+
+    return {"tools/list": list_tools, "tools/call": call_tool}
+
+
+async def handle_command(handlers: dict, line: str) -> dict:
+    """Execute one JSON command line and return its result."""
+    try:
+        command = json_loads(line)
+    except json.JSONDecodeError:
+        return {"error": "Invalid JSON"}
+
+    method = command.get("method")
+    handler = handlers.get(method)
+    if handler is None:
+        result = {"error": f"Unknown method: {method}"}
+    else:
+        result = await handler(command)
+
+    # Results are written as they complete; echo the id so callers can match them.
+    # Handlers may return any JSON value, so only objects are merged, and the
+    # command id wins over any "id" of the result's own.
+    if "id" in command:
+        if isinstance(result, dict):
+            result = {**result, "id": command["id"]}
+        else:
+            result = {"id": command["id"], "result": result}
+    return result
+
+
+def read_stdin(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue):
+    """Forward stdin lines to the event loop until EOF or 'quit'."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        if line == "quit":
+            break
+        loop.call_soon_threadsafe(lines.put_nowait, line)
+    loop.call_soon_threadsafe(lines.put_nowait, None)
+
+
+async def command_worker(handlers: dict, lines: asyncio.Queue):
+    """Process queued command lines until the end-of-input marker."""
+    while (line := await lines.get()) is not None:
+        result = await handle_command(handlers, line)
+        print(json_dumps(result))
+    # Put the marker back so the remaining workers stop too
+    lines.put_nowait(None)
+
+
+async def run_bridge(bridge: MCPHTTPBridge, base_url: str):
+    """Check the HTTP API and process MCP commands from stdin."""
+    # Test connection and list available tools concurrently
+    health, tools = await asyncio.gather(bridge.health_check(), bridge.list_tools())
     if health.get("status") != "healthy":
         print(f"MCP HTTP API is not healthy: {health}", file=sys.stderr)
         sys.exit(1)
     
     print(f"Connected to Muppet Platform at {base_url}", file=sys.stderr)
     print(f"Available tools: {health.get('tools_available', 0)}", file=sys.stderr)
-    
-    # List available tools
-    tools = await bridge.list_tools()
     print(f"Tools: {[tool['name'] for tool in tools]}", file=sys.stderr)
     
-    # Simple interactive mode for testing
-    while True:
-        try:
-            line = input().strip()
-            if not line:
-                continue
-                
-            if line == "quit":
-                break
-                
-            # Parse JSON command
-            try:
-                command = json.loads(line)
-                if command.get("method") == "tools/list":
-                    result = {"tools": tools}
-                elif command.get("method") == "tools/call":
-                    params = command.get("params", {})
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    result = await bridge.execute_tool(tool_name, arguments)
-                else:
-                    result = {"error": f"Unknown method: {command.get('method')}"}
-                
-                print(json.dumps(result))
-                
-            except json.JSONDecodeError:
-                print(json.dumps({"error": "Invalid JSON"}))
-                
-        except EOFError:
-            break
-        except KeyboardInterrupt:
-            break
-    
-    await bridge.client.aclose()
+    # Read stdin on a daemon thread so a blocked read never holds up shutdown,
+    # and let several commands be in flight on the shared client at once
+    handlers = build_handlers(bridge, tools)
+    lines: asyncio.Queue = asyncio.Queue()
+    reader = threading.Thread(
+        target=read_stdin, args=(asyncio.get_running_loop(), lines), daemon=True
+    )
+    reader.start()
+    await asyncio.gather(
+        *(command_worker(handlers, lines) for _ in range(MAX_IN_FLIGHT))
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -6,13 +6,19 @@ environment variable support, and default values.
 """
 
 import os
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 
 import boto3
 from pydantic import Field, computed_field, field_validator
 from pydantic_settings import BaseSettings
 
+# Allowed values for validated settings
+_VALID_VISIBILITIES = frozenset({"public", "private", "internal"})
+_VALID_PROTOCOLS = frozenset({"stdio", "http", "websocket"})
+_VALID_INTEGRATION_MODES = frozenset({"mock", "local", "real"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class AWSConfig(BaseSettings):
     """AWS-specific configuration settings."""
@@ -30,6 +36,21 @@ class AWSConfig(BaseSettings):
     availability_zones: List[str] = Field(
         default=["us-west-2a", "us-west-2b"], description="Availability zones"
     )
+    max_parallel_requests: int = Field(
+        default_factory=lambda: max(64, 4 * (os.cpu_count() or 1)),
+        description="Connection pool size for each AWS service client",
+    )
+    io_workers: int = Field(
+        default_factory=lambda: 5 * (os.cpu_count() or 1),
+        description="Threads dedicated to blocking AWS API calls",
+    )
+    ssm_max_concurrency: int = Field(
+        default=40, description="Maximum concurrent Parameter Store requests"
+    )
+    parameter_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds to cache Parameter Store reads (0 disables caching)",
+    )
 
     @computed_field
     def account_id(self) -> str:
@@ -74,11 +95,22 @@ class GitHubConfig(BaseSettings):
     dismiss_stale_reviews: bool = Field(
         default=True, description="Dismiss stale reviews"
     )
+    max_concurrency: int = Field(
+        default=10, description="Maximum concurrent GitHub API requests per client"
+    )
+    cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds to cache repository, tag and file reads (0 disables caching)",
+    )
+    immutable_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds to cache file reads at a commit SHA (0 disables caching)",
+    )
 
     @field_validator("visibility")
     @classmethod
     def validate_visibility(cls, v):
-        if v not in ["public", "private", "internal"]:
+        if v not in _VALID_VISIBILITIES:
             raise ValueError("visibility must be public, private, or internal")
         return v
 
@@ -120,7 +152,7 @@ class MCPConfig(BaseSettings):
     @field_validator("protocol")
     @classmethod
     def validate_protocol(cls, v):
-        if v not in ["stdio", "http", "websocket"]:
+        if v not in _VALID_PROTOCOLS:
             raise ValueError("protocol must be stdio, http, or websocket")
         return v
 
@@ -158,9 +190,10 @@ class Settings(BaseSettings):
     @field_validator("integration_mode")
     @classmethod
     def validate_integration_mode(cls, v):
-        valid_modes = ["mock", "local", "real"]
-        if v not in valid_modes:
-            raise ValueError(f"integration_mode must be one of {valid_modes}")
+        if v not in _VALID_INTEGRATION_MODES:
+            raise ValueError(
+                f"integration_mode must be one of {sorted(_VALID_INTEGRATION_MODES)}"
+            )
         return v
 
     # Component configurations
@@ -169,16 +202,39 @@ class Settings(BaseSettings):
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
     mcp: MCPConfig = Field(default_factory=MCPConfig)
 
+    @cached_property
+    def cors_origin_list(self) -> Tuple[str, ...]:
+        """CORS origins parsed once from the comma-separated setting."""
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
+        if v.upper() not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {sorted(_VALID_LOG_LEVELS)}")
         return v.upper()
 
 
-@lru_cache()
+# Process-wide settings instance, built on first access. reset_settings()
+# discards it so the next get_settings() call re-reads the environment.
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+    """Get the shared application settings."""
+    if _settings is None:
+        return _load_settings()
+    return _settings
+
+
+def _load_settings() -> Settings:
+    """Build the shared settings instance from the environment."""
+    global _settings
+    _settings = Settings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Discard the shared settings so they are rebuilt on next access."""
+    global _settings
+    _settings = None
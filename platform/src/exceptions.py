@@ -7,6 +7,10 @@ messages, and structured error handling.
 
 from typing import Any, Dict, Optional
 
+# Shared details for exceptions raised without any. It must never be mutated;
+# use PlatformException.ensure_details() to get a dict that can be written to.
+_EMPTY: Dict[str, Any] = {}
+
 
 class PlatformException(Exception):
     """
@@ -27,7 +31,19 @@ class PlatformException(Exception):
         self.message = message
         self.error_type = error_type
         self.status_code = status_code
-        self.details = details or {}
+        self.details = _EMPTY if details is None else details
+
+    def ensure_details(self) -> Dict[str, Any]:
+        """
+        Get a details dict owned by this exception, safe to mutate.
+
+        Returns:
+            The exception's details, replacing the shared empty default
+            with a fresh dict first if necessary
+        """
+        if self.details is _EMPTY:
+            self.details = {}
+        return self.details
 
 
 class ValidationError(PlatformException):
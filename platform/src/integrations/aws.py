@@ -6,17 +6,206 @@ Parameter Store, ECS, and other AWS APIs.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import atexit
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
-from ..config import get_settings
+from ..config import AWSConfig, get_settings
 from ..exceptions import AWSError
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# GetParameters accepts at most 10 names per request
+GET_PARAMETERS_MAX_NAMES = 10
+
+# Seconds a get_parameter call waits for others to share its request
+PARAMETER_BATCH_WINDOW = 0.005
+
+# Pages of get_parameters_by_path results fetched ahead of the consumer
+PARAMETER_PAGE_PREFETCH = 2
+
+# DescribeServices accepts at most 10 services per request
+DESCRIBE_SERVICES_MAX = 10
+
+# Seconds to reuse the result of ECSClient.get_active_deployments
+ACTIVE_DEPLOYMENTS_TTL = 10.0
+
+# Seconds to reuse ECR repository descriptions
+REPOSITORY_CACHE_TTL = 60.0
+
+
+# ClientError codes that mean the requested resource does not exist. ECR
+# reports RepositoryNotFoundException; RepositoryNotFound is kept for
+# compatible endpoints that use the short form.
+_ECS_SERVICE_NOT_FOUND_CODES = frozenset(
+    {"ClusterNotFoundException", "ServiceNotFoundException"}
+)
+_ECR_REPOSITORY_NOT_FOUND_CODES = frozenset(
+    {"RepositoryNotFoundException", "RepositoryNotFound"}
+)
+
+
+def _aws_error(
+    e: ClientError, action: str, service: str, details: Dict[str, Any]
+) -> AWSError:
+    """
+    Wrap a boto3 ClientError in an AWSError carrying its error code.
+
+    Args:
+        e: The ClientError raised by boto3
+        action: What was being done, e.g. "get parameter"
+        service: AWS service name for the error
+        details: Context to include alongside the error code
+
+    Returns:
+        AWSError to raise
+    """
+    error = e.response["Error"]
+    return AWSError(
+        message=f"Failed to {action}: {error['Message']}",
+        service=service,
+        details={**details, "error_code": error["Code"]},
+    )
+
+
+# Mock-mode values for parameters whose name contains the given fragment,
+# checked in order; other names get a generated placeholder
+_MOCK_PARAMETER_VALUES = (
+    ("terraform/modules", "1.0.0"),
+    ("github/token", "mock-github-token"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _mock_parameter(name: str) -> str:
+    """Get the mock-mode value for a parameter, memoized per name."""
+    for fragment, value in _MOCK_PARAMETER_VALUES:
+        if fragment in name:
+            return value
+    return f"mock-value-for-{name}"
+
+
+# Thread pool for blocking boto3 calls, created on first use. It is kept
+# separate from the event loop's default executor, which is shared with
+# every other library and capped at min(32, cpu_count + 4) threads.
+_aws_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_aws_executor() -> ThreadPoolExecutor:
+    """Get the thread pool used for AWS calls, creating it if needed."""
+    global _aws_executor
+    if _aws_executor is None:
+        _aws_executor = ThreadPoolExecutor(
+            max_workers=get_settings().aws.io_workers,
+            thread_name_prefix="aws-io",
+        )
+    return _aws_executor
+
+
+def shutdown_aws_executor() -> None:
+    """Shut down the AWS thread pool; it is recreated if used again."""
+    global _aws_executor
+    if _aws_executor is not None:
+        _aws_executor.shutdown(wait=False)
+        _aws_executor = None
+
+
+atexit.register(shutdown_aws_executor)
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking boto3 call without stalling the event loop.
+
+    All AWS calls in this module go through here so the transport used for
+    them can be changed in one place. Arguments are bound with
+    functools.partial rather than a per-call closure.
+
+    Args:
+        func: Callable performing the boto3 request
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's result
+    """
+    if args or kwargs:
+        func = functools.partial(func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_get_aws_executor(), func)
+
+
+def _boto_config(aws_settings: AWSConfig, service_name: str) -> Config:
+    """
+    Build the botocore configuration shared by the service clients.
+
+    The connection pool is sized for concurrent calls so connections are
+    reused instead of re-handshaked, and adaptive retries back off on
+    throttling. Requests are tagged with a per-service user agent suffix so
+    the platform's traffic can be told apart in CloudTrail.
+
+    Args:
+        aws_settings: AWS settings to size the pool from
+        service_name: AWS service the client is for, e.g. "ecs"
+
+    Returns:
+        Client configuration
+    """
+    return Config(
+        max_pool_connections=aws_settings.max_parallel_requests,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        tcp_keepalive=True,
+        user_agent_extra=f"muppet/{service_name}",
+    )
+
+
+# One boto3 session for every client so credentials and endpoint data are
+# resolved once. botocore keeps a separate connection pool per client
+# endpoint, so pools themselves cannot be shared. Sessions are not
+# thread-safe, so client creation is locked.
+_boto_session: Optional[boto3.session.Session] = None
+_boto_session_lock = threading.Lock()
+
+
+def _create_client(service_name: str, **kwargs: Any) -> Any:
+    """
+    Create a boto3 client from the shared session.
+
+    Args:
+        service_name: AWS service name, e.g. "ssm"
+        **kwargs: Client options such as region_name and config
+
+    Returns:
+        boto3 service client
+    """
+    global _boto_session
+    with _boto_session_lock:
+        if _boto_session is None:
+            _boto_session = boto3.session.Session(region_name=get_settings().aws.region)
+        return _boto_session.client(service_name, **kwargs)
+
 
 class ParameterStoreClient:
     """
@@ -30,11 +219,35 @@ class ParameterStoreClient:
         self.settings = get_settings()
         self.region = self.settings.aws.region
         self.parameter_prefix = "/muppet-platform"
+        self._prefix_slash = self.parameter_prefix + "/"
+        self._prefix_slash_len = len(self._prefix_slash)
         self.integration_mode = self.settings.integration_mode
 
+        # Concurrent get_parameter calls are coalesced into GetParameters
+        # requests; the queue belongs to the event loop that created it
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_fetches: Set[asyncio.Task] = set()
+
+        # Read cache: key -> (expires_at, value). Concurrent misses for the
+        # same key share one in-flight fetch. Writes bump the generation so
+        # fetches started before them are not cached.
+        self.cache_ttl = self.settings.aws.parameter_cache_ttl
+        self._cache: Dict[Tuple[str, str, bool], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, str, bool], asyncio.Future] = {}
+        self._cache_generation = 0
+
+        # Caps concurrent SSM requests so fan-out stays within the account's
+        # Parameter Store throughput instead of tripping ThrottlingException
+        self._ssm_slots = asyncio.Semaphore(self.settings.aws.ssm_max_concurrency)
+
         try:
             # Configure boto3 client based on integration mode
-            client_config = {"region_name": self.region}
+            client_config = {
+                "region_name": self.region,
+                "config": _boto_config(self.settings.aws, "ssm"),
+            }
 
             # Use custom endpoint for LocalStack in local mode
             if self.integration_mode == "local" and self.settings.aws_endpoint_url:
@@ -51,7 +264,7 @@ class ParameterStoreClient:
                     f"Initialized Parameter Store client in MOCK mode for region: {self.region}"
                 )
 
-            self.ssm_client = boto3.client("ssm", **client_config)
+            self.ssm_client = _create_client("ssm", **client_config)
 
         except NoCredentialsError:
             if self.integration_mode == "real":
@@ -93,44 +306,31 @@ class ParameterStoreClient:
             AWSError: If Parameter Store operation fails
         """
         try:
-            full_name = f"{self.parameter_prefix}/{name.lstrip('/')}"
+            full_name = self._prefix_slash + name.lstrip("/")
             logger.debug(f"Getting parameter: {full_name}")
 
             if not self.ssm_client:
                 # Mock mode
                 logger.info(f"MOCK: Would get parameter {full_name}")
-                # Return mock values for common parameters
-                if "terraform/modules" in name:
-                    return "1.0.0"
-                elif "github/token" in name:
-                    return "mock-github-token"
-                else:
-                    return f"mock-value-for-{name}"
-
-            # Use asyncio to run the synchronous boto3 call
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.ssm_client.get_parameter(
-                    Name=full_name, WithDecryption=decrypt
-                ),
-            )
-
-            value = response["Parameter"]["Value"]
-            logger.debug(f"Retrieved parameter: {full_name}")
+                return _mock_parameter(name)
+
+            value = await self._cached(
+                ("parameter", full_name, decrypt),
+                lambda: self._get_parameter_batched(full_name, decrypt),
+            )
+
+            if value is None:
+                logger.debug(f"Parameter not found: {full_name}")
+            else:
+                logger.debug(f"Retrieved parameter: {full_name}")
             return value
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "ParameterNotFound":
+            if e.response["Error"]["Code"] == "ParameterNotFound":
                 logger.debug(f"Parameter not found: {full_name}")
                 return None
-            else:
-                logger.error(f"AWS error getting parameter {name}: {e}")
-                raise AWSError(
-                    message=f"Failed to get parameter: {e.response['Error']['Message']}",
-                    service="ssm",
-                    details={"parameter": name, "error_code": error_code},
-                )
+            logger.error(f"AWS error getting parameter {name}: {e}")
+            raise _aws_error(e, "get parameter", "ssm", {"parameter": name})
         except Exception as e:
             logger.error(f"Failed to get parameter {name}: {e}")
             raise AWSError(
@@ -139,6 +339,241 @@ class ParameterStoreClient:
                 details={"parameter": name},
             )
 
+    async def _ssm_call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking SSM call once a concurrency slot is free."""
+        async with self._ssm_slots:
+            return await _run_blocking(func, *args, **kwargs)
+
+    async def _cached(
+        self, key: Tuple[str, str, bool], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Return a cached read, or fetch it once for all concurrent callers.
+
+        Args:
+            key: Cache key of (kind, full name or path, flag)
+            fetch: Coroutine factory performing the uncached read
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        future = self._inflight.get(key)
+        if future is None:
+            generation = self._cache_generation
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+
+            def store(done: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                if (
+                    self.cache_ttl > 0
+                    and generation == self._cache_generation
+                    and not done.cancelled()
+                    and done.exception() is None
+                    and done.result() is not None
+                ):
+                    self._cache[key] = (
+                        time.monotonic() + self.cache_ttl,
+                        done.result(),
+                    )
+
+            future.add_done_callback(store)
+
+        # Shield the shared fetch so one cancelled caller does not fail the rest
+        return await asyncio.shield(future)
+
+    def _invalidate(self, full_name: str) -> None:
+        """
+        Drop cached reads that may include a parameter that just changed.
+
+        Args:
+            full_name: Fully prefixed name of the written parameter
+        """
+        self._cache_generation += 1
+        for key in list(self._cache):
+            kind, name, _ = key
+            if kind == "parameter":
+                stale = name == full_name
+            else:
+                stale = full_name.startswith(name.rstrip("/") + "/")
+            if stale:
+                del self._cache[key]
+
+    async def _get_parameter_batched(
+        self, full_name: str, decrypt: bool
+    ) -> Optional[str]:
+        """
+        Queue a parameter read to be sent with other concurrent reads.
+
+        Args:
+            full_name: Fully prefixed parameter name
+            decrypt: Whether to decrypt SecureString parameters
+
+        Returns:
+            Parameter value or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        if self._batch_loop is not loop:
+            self._batch_loop = loop
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = None
+
+        future = loop.create_future()
+        self._batch_queue.put_nowait((full_name, decrypt, future))
+        if self._batch_task is None:
+            self._batch_task = loop.create_task(self._drain_parameter_batches())
+        return await future
+
+    async def _drain_parameter_batches(self) -> None:
+        """
+        Collect queued reads for up to PARAMETER_BATCH_WINDOW and send them.
+
+        Runs until the queue is empty so no task outlives the pending reads.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._batch_queue
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = loop.time() + PARAMETER_BATCH_WINDOW
+            while len(batch) < GET_PARAMETERS_MAX_NAMES:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Decrypted and plain reads cannot share a request
+            for decrypt in (False, True):
+                requests = [(n, f) for n, d, f in batch if d == decrypt]
+                if requests:
+                    task = loop.create_task(
+                        self._fetch_parameter_batch(requests, decrypt)
+                    )
+                    self._batch_fetches.add(task)
+                    task.add_done_callback(self._batch_fetches.discard)
+        self._batch_task = None
+
+    async def _fetch_parameter_batch(
+        self, requests: List[Tuple[str, asyncio.Future]], decrypt: bool
+    ) -> None:
+        """
+        Fetch a batch of parameters with one GetParameters call.
+
+        Args:
+            requests: (full name, future) pairs awaiting a value
+            decrypt: Whether to decrypt SecureString parameters
+        """
+        names = list(dict.fromkeys(name for name, _ in requests))
+        try:
+            response = await self._ssm_call(
+                self.ssm_client.get_parameters, Names=names, WithDecryption=decrypt
+            )
+        except Exception as e:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Names listed under InvalidParameters do not exist and resolve to None
+        values = {p["Name"]: p["Value"] for p in response.get("Parameters", [])}
+        for name, future in requests:
+            if not future.done():
+                future.set_result(values.get(name))
+
+    async def _iter_parameters(
+        self, full_path: str, recursive: bool
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Yield (relative name, value) pairs under a path as pages arrive.
+
+        A background task fetches pages on the AWS thread pool, staying at
+        most PARAMETER_PAGE_PREFETCH pages ahead of the consumer.
+
+        Args:
+            full_path: Fully prefixed parameter path
+            recursive: Whether to retrieve parameters recursively
+
+        Raises:
+            ClientError: If a Parameter Store call fails
+        """
+        pages = iter(
+            self.ssm_client.get_paginator("get_parameters_by_path").paginate(
+                Path=full_path, Recursive=recursive, WithDecryption=True
+            )
+        )
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PARAMETER_PAGE_PREFETCH)
+        end = object()
+
+        async def produce_pages():
+            try:
+                while True:
+                    page = await self._ssm_call(next, pages, end)
+                    await queue.put(page)
+                    if page is end:
+                        return
+            except Exception as e:
+                await queue.put(e)
+
+        producer = asyncio.create_task(produce_pages())
+        try:
+            while (page := await queue.get()) is not end:
+                if isinstance(page, Exception):
+                    raise page
+                prefix = self._prefix_slash
+                prefix_len = self._prefix_slash_len
+                for param in page.get("Parameters", []):
+                    # Remove the full prefix to get relative name
+                    name = param["Name"]
+                    if name.startswith(prefix):
+                        yield name[prefix_len:], param["Value"]
+                    else:
+                        yield name.lstrip("/"), param["Value"]
+        finally:
+            producer.cancel()
+
+    async def _collect_parameters(
+        self, full_path: str, recursive: bool
+    ) -> Dict[str, str]:
+        """Read every parameter under a path into a dict."""
+        return {
+            name: value
+            async for name, value in self._iter_parameters(full_path, recursive)
+        }
+
+    async def iter_parameters_by_path(
+        self, path: str, recursive: bool = True
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Iterate over parameters by path prefix without loading them all.
+
+        Pages are fetched in the background while earlier ones are consumed.
+        Results are not cached; use get_parameters_by_path for cached reads.
+
+        Args:
+            path: Parameter path prefix
+            recursive: Whether to retrieve parameters recursively
+
+        Yields:
+            (parameter name relative to the platform prefix, value) pairs
+
+        Raises:
+            AWSError: If Parameter Store operation fails
+        """
+        full_path = self._prefix_slash + path.lstrip("/")
+        logger.debug(f"Iterating parameters by path: {full_path}")
+        try:
+            async for item in self._iter_parameters(full_path, recursive):
+                yield item
+        except ClientError as e:
+            logger.error(f"AWS error getting parameters by path {path}: {e}")
+            raise _aws_error(e, "get parameters by path", "ssm", {"path": path})
+
     async def get_parameters_by_path(
         self, path: str, recursive: bool = True
     ) -> Dict[str, str]:
@@ -156,28 +591,14 @@ class ParameterStoreClient:
             AWSError: If Parameter Store operation fails
         """
         try:
-            full_path = f"{self.parameter_prefix}/{path.lstrip('/')}"
+            full_path = self._prefix_slash + path.lstrip("/")
             logger.debug(f"Getting parameters by path: {full_path}")
 
-            parameters = {}
-
-            # Use asyncio to run the synchronous boto3 paginator
-            def get_parameters_sync():
-                paginator = self.ssm_client.get_paginator("get_parameters_by_path")
-                params = {}
-                for page in paginator.paginate(
-                    Path=full_path, Recursive=recursive, WithDecryption=True
-                ):
-                    for param in page.get("Parameters", []):
-                        # Remove the full prefix to get relative name
-                        relative_name = param["Name"][
-                            len(self.parameter_prefix) :
-                        ].lstrip("/")
-                        params[relative_name] = param["Value"]
-                return params
-
-            parameters = await asyncio.get_event_loop().run_in_executor(
-                None, get_parameters_sync
+            parameters = dict(
+                await self._cached(
+                    ("path", full_path, recursive),
+                    lambda: self._collect_parameters(full_path, recursive),
+                )
             )
 
             logger.debug(
@@ -187,11 +608,7 @@ class ParameterStoreClient:
 
         except ClientError as e:
             logger.error(f"AWS error getting parameters by path {path}: {e}")
-            raise AWSError(
-                message=f"Failed to get parameters by path: {e.response['Error']['Message']}",
-                service="ssm",
-                details={"path": path, "error_code": e.response["Error"]["Code"]},
-            )
+            raise _aws_error(e, "get parameters by path", "ssm", {"path": path})
         except Exception as e:
             logger.error(f"Failed to get parameters by path {path}: {e}")
             raise AWSError(
@@ -223,20 +640,19 @@ class ParameterStoreClient:
             AWSError: If Parameter Store operation fails
         """
         try:
-            full_name = f"{self.parameter_prefix}/{name.lstrip('/')}"
+            full_name = self._prefix_slash + name.lstrip("/")
             logger.debug(f"Storing parameter: {full_name}")
 
-            # Use asyncio to run the synchronous boto3 call
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.ssm_client.put_parameter(
-                    Name=full_name,
-                    Value=value,
-                    Type=parameter_type,
-                    Overwrite=overwrite,
-                ),
+            # Run the synchronous boto3 call off the event loop
+            await self._ssm_call(
+                self.ssm_client.put_parameter,
+                Name=full_name,
+                Value=value,
+                Type=parameter_type,
+                Overwrite=overwrite,
             )
 
+            self._invalidate(full_name)
             logger.debug(f"Stored parameter: {full_name}")
             return True
 
@@ -248,13 +664,8 @@ class ParameterStoreClient:
                     service="ssm",
                     details={"parameter": name, "error_code": error_code},
                 )
-            else:
-                logger.error(f"AWS error storing parameter {name}: {e}")
-                raise AWSError(
-                    message=f"Failed to store parameter: {e.response['Error']['Message']}",
-                    service="ssm",
-                    details={"parameter": name, "error_code": error_code},
-                )
+            logger.error(f"AWS error storing parameter {name}: {e}")
+            raise _aws_error(e, "store parameter", "ssm", {"parameter": name})
         except Exception as e:
             logger.error(f"Failed to store parameter {name}: {e}")
             raise AWSError(
@@ -277,29 +688,22 @@ class ParameterStoreClient:
             AWSError: If Parameter Store operation fails
         """
         try:
-            full_name = f"{self.parameter_prefix}/{name.lstrip('/')}"
+            full_name = self._prefix_slash + name.lstrip("/")
             logger.debug(f"Deleting parameter: {full_name}")
 
-            # Use asyncio to run the synchronous boto3 call
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.ssm_client.delete_parameter(Name=full_name)
-            )
+            # Run the synchronous boto3 call off the event loop
+            await self._ssm_call(self.ssm_client.delete_parameter, Name=full_name)
 
+            self._invalidate(full_name)
             logger.debug(f"Deleted parameter: {full_name}")
             return True
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "ParameterNotFound":
+            if e.response["Error"]["Code"] == "ParameterNotFound":
                 logger.debug(f"Parameter not found for deletion: {full_name}")
                 return False
-            else:
-                logger.error(f"AWS error deleting parameter {name}: {e}")
-                raise AWSError(
-                    message=f"Failed to delete parameter: {e.response['Error']['Message']}",
-                    service="ssm",
-                    details={"parameter": name, "error_code": error_code},
-                )
+            logger.error(f"AWS error deleting parameter {name}: {e}")
+            raise _aws_error(e, "delete parameter", "ssm", {"parameter": name})
         except Exception as e:
             logger.error(f"Failed to delete parameter {name}: {e}")
             raise AWSError(
@@ -309,6 +713,40 @@ class ParameterStoreClient:
             )
 
 
+@dataclass(frozen=True, slots=True)
+class ServiceInfo:
+    """
+    ECS service summary.
+
+    Holds the fields the platform reads from a describe_services entry.
+    """
+
+    service_name: str
+    service_arn: str
+    status: str
+    running_count: int
+    desired_count: int
+    task_definition: str
+    created_at: Optional[datetime] = None
+    platform_version: Optional[str] = None
+    launch_type: str = "FARGATE"
+
+    @classmethod
+    def from_response(cls, service: Dict[str, Any]) -> "ServiceInfo":
+        """Build a summary from a describe_services entry."""
+        return cls(
+            service_name=service["serviceName"],
+            service_arn=service["serviceArn"],
+            status=service["status"],
+            running_count=service["runningCount"],
+            desired_count=service["desiredCount"],
+            task_definition=service["taskDefinition"],
+            created_at=service.get("createdAt"),
+            platform_version=service.get("platformVersion"),
+            launch_type=service.get("launchType", "FARGATE"),
+        )
+
+
 class ECSClient:
     """
     Amazon ECS client for service discovery and management.
@@ -320,9 +758,15 @@ class ECSClient:
         self.settings = get_settings()
         self.region = self.settings.aws.region
         self.cluster_name = self.settings.aws.fargate_cluster_name
+        # (expires_at, deployments) from the last get_active_deployments call
+        self._active_deployments: Optional[Tuple[float, Dict[str, str]]] = None
 
         try:
-            self.ecs_client = boto3.client("ecs", region_name=self.region)
+            self.ecs_client = _create_client(
+                "ecs",
+                region_name=self.region,
+                config=_boto_config(self.settings.aws, "ecs"),
+            )
             logger.info(f"Initialized ECS client for cluster: {self.cluster_name}")
         except NoCredentialsError:
             logger.error("AWS credentials not found")
@@ -339,69 +783,86 @@ class ECSClient:
                 details={"region": self.region},
             )
 
-    async def list_services(self) -> List[Dict[str, Any]]:
+    async def _describe_all_services(self, **filters: Any) -> List[Dict[str, Any]]:
         """
-        List all services in the ECS cluster.
+        Describe every service in the cluster matching the list filters.
+
+        Args:
+            **filters: Extra list_services filters, e.g. schedulingStrategy
 
         Returns:
-            List of service information dictionaries
+            Raw describe_services entries
 
         Raises:
-            AWSError: If ECS operation fails
+            ClientError: If an ECS call fails
         """
-        try:
-            logger.debug(f"Listing services in cluster: {self.cluster_name}")
-
-            # Use asyncio to run the synchronous boto3 calls
-            def list_services_sync():
-                # Get list of service ARNs
-                response = self.ecs_client.list_services(cluster=self.cluster_name)
-                service_arns = response.get("serviceArns", [])
 
-                if not service_arns:
-                    return []
-
-                # Get detailed service information
-                services_response = self.ecs_client.describe_services(
-                    cluster=self.cluster_name, services=service_arns
+        # Page through every service ARN; list_services returns at most
+        # 100 per call and silently truncates without a paginator
+        def list_service_arns_sync():
+            paginator = self.ecs_client.get_paginator("list_services")
+            return [
+                arn
+                for page in paginator.paginate(
+                    cluster=self.cluster_name,
+                    PaginationConfig={"PageSize": 100},
+                    **filters,
                 )
+                for arn in page.get("serviceArns", [])
+            ]
+
+        service_arns = await _run_blocking(list_service_arns_sync)
+
+        # describe_services takes at most 10 services; fetch chunks in parallel
+        chunks = [
+            service_arns[i : i + DESCRIBE_SERVICES_MAX]
+            for i in range(0, len(service_arns), DESCRIBE_SERVICES_MAX)
+        ]
+        responses = await asyncio.gather(
+            *(
+                _run_blocking(
+                    self.ecs_client.describe_services,
+                    cluster=self.cluster_name,
+                    services=chunk,
+                )
+                for chunk in chunks
+            )
+        )
+        return [
+            service
+            for response in responses
+            for service in response.get("services", [])
+        ]
+
+    async def list_services(self) -> List[ServiceInfo]:
+        """
+        List all services in the ECS cluster.
 
-                services = []
-                for service in services_response.get("services", []):
-                    service_info = {
-                        "serviceName": service["serviceName"],
-                        "serviceArn": service["serviceArn"],
-                        "status": service["status"],
-                        "runningCount": service["runningCount"],
-                        "desiredCount": service["desiredCount"],
-                        "taskDefinition": service["taskDefinition"],
-                        "createdAt": service.get("createdAt"),
-                        "platformVersion": service.get("platformVersion"),
-                        "launchType": service.get("launchType", "FARGATE"),
-                    }
-                    services.append(service_info)
+        Returns:
+            List of service summaries
 
-                return services
+        Raises:
+            AWSError: If ECS operation fails
+        """
+        try:
+            logger.debug(f"Listing services in cluster: {self.cluster_name}")
 
-            services = await asyncio.get_event_loop().run_in_executor(
-                None, list_services_sync
-            )
+            services = [
+                ServiceInfo.from_response(service)
+                for service in await self._describe_all_services()
+            ]
 
             logger.debug(f"Found {len(services)} services")
             return services
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "ClusterNotFoundException":
+            if e.response["Error"]["Code"] == "ClusterNotFoundException":
                 logger.warning(f"ECS cluster not found: {self.cluster_name}")
                 return []
-            else:
-                logger.error(f"AWS error listing ECS services: {e}")
-                raise AWSError(
-                    message=f"Failed to list ECS services: {e.response['Error']['Message']}",
-                    service="ecs",
-                    details={"cluster": self.cluster_name, "error_code": error_code},
-                )
+            logger.error(f"AWS error listing ECS services: {e}")
+            raise _aws_error(
+                e, "list ECS services", "ecs", {"cluster": self.cluster_name}
+            )
         except Exception as e:
             logger.error(f"Failed to list ECS services: {e}")
             raise AWSError(
@@ -410,7 +871,7 @@ class ECSClient:
                 details={"cluster": self.cluster_name},
             )
 
-    async def get_service(self, service_name: str) -> Optional[Dict[str, Any]]:
+    async def get_service(self, service_name: str) -> Optional[ServiceInfo]:
         """
         Get information about a specific service.
 
@@ -426,33 +887,16 @@ class ECSClient:
         try:
             logger.debug(f"Getting service: {service_name}")
 
-            # Use asyncio to run the synchronous boto3 call
-            def get_service_sync():
-                response = self.ecs_client.describe_services(
-                    cluster=self.cluster_name, services=[service_name]
-                )
-
-                services = response.get("services", [])
-                if not services:
-                    return None
-
-                service = services[0]
-                return {
-                    "serviceName": service["serviceName"],
-                    "serviceArn": service["serviceArn"],
-                    "status": service["status"],
-                    "runningCount": service["runningCount"],
-                    "desiredCount": service["desiredCount"],
-                    "taskDefinition": service["taskDefinition"],
-                    "createdAt": service.get("createdAt"),
-                    "platformVersion": service.get("platformVersion"),
-                    "launchType": service.get("launchType", "FARGATE"),
-                }
-
-            service_info = await asyncio.get_event_loop().run_in_executor(
-                None, get_service_sync
+            # Run the synchronous boto3 call off the event loop
+            response = await _run_blocking(
+                self.ecs_client.describe_services,
+                cluster=self.cluster_name,
+                services=[service_name],
             )
 
+            services = response.get("services", [])
+            service_info = ServiceInfo.from_response(services[0]) if services else None
+
             if service_info:
                 logger.debug(f"Found service: {service_name}")
             else:
@@ -461,17 +905,11 @@ class ECSClient:
             return service_info
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code in ["ClusterNotFoundException", "ServiceNotFoundException"]:
+            if e.response["Error"]["Code"] in _ECS_SERVICE_NOT_FOUND_CODES:
                 logger.debug(f"Service not found: {service_name}")
                 return None
-            else:
-                logger.error(f"AWS error getting ECS service {service_name}: {e}")
-                raise AWSError(
-                    message=f"Failed to get ECS service: {e.response['Error']['Message']}",
-                    service="ecs",
-                    details={"service": service_name, "error_code": error_code},
-                )
+            logger.error(f"AWS error getting ECS service {service_name}: {e}")
+            raise _aws_error(e, "get ECS service", "ecs", {"service": service_name})
         except Exception as e:
             logger.error(f"Failed to get ECS service {service_name}: {e}")
             raise AWSError(
@@ -480,6 +918,38 @@ class ECSClient:
                 details={"service": service_name},
             )
 
+    async def list_active_service_arns(self) -> Dict[str, str]:
+        """
+        Map the names of running replica services to their ARNs.
+
+        Unlike list_services, only the fields needed to decide whether a
+        service is running are read from each describe_services entry.
+
+        Returns:
+            Dictionary mapping service names to service ARNs
+
+        Raises:
+            AWSError: If ECS operation fails
+        """
+        try:
+            services = await self._describe_all_services(schedulingStrategy="REPLICA")
+            return {
+                service["serviceName"]: service["serviceArn"]
+                for service in services
+                if service["status"] == "ACTIVE"
+                and service["runningCount"] > 0
+                and service["desiredCount"] > 0
+            }
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ClusterNotFoundException":
+                logger.warning(f"ECS cluster not found: {self.cluster_name}")
+                return {}
+            logger.error(f"AWS error listing active ECS services: {e}")
+            raise _aws_error(
+                e, "list active ECS services", "ecs", {"cluster": self.cluster_name}
+            )
+
     async def get_active_deployments(self) -> Dict[str, str]:
         """
         Get mapping of active muppet deployments.
@@ -493,19 +963,21 @@ class ECSClient:
         try:
             logger.debug("Getting active deployments")
 
-            services = await self.list_services()
-            deployments = {}
-
-            for service in services:
-                if (
-                    service["status"] == "ACTIVE"
-                    and service["runningCount"] > 0
-                    and service["desiredCount"] > 0
-                ):
-                    deployments[service["serviceName"]] = service["serviceArn"]
+            # The state manager polls this; reuse a recent answer
+            if (
+                self._active_deployments is not None
+                and self._active_deployments[0] > time.monotonic()
+            ):
+                return dict(self._active_deployments[1])
+
+            deployments = await self.list_active_service_arns()
+            self._active_deployments = (
+                time.monotonic() + ACTIVE_DEPLOYMENTS_TTL,
+                deployments,
+            )
 
             logger.debug(f"Found {len(deployments)} active deployments")
-            return deployments
+            return dict(deployments)
 
         except Exception as e:
             logger.error(f"Failed to get active deployments: {e}")
@@ -526,9 +998,18 @@ class ECRClient:
     def __init__(self):
         self.settings = get_settings()
         self.region = self.settings.aws.region
+        # name -> (expires_at, repository) from recent create/describe calls
+        self._repositories: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Serializes create_repository per name so concurrent callers
+        # share one CreateRepository request
+        self._create_locks: Dict[str, asyncio.Lock] = {}
 
         try:
-            self.ecr_client = boto3.client("ecr", region_name=self.region)
+            self.ecr_client = _create_client(
+                "ecr",
+                region_name=self.region,
+                config=_boto_config(self.settings.aws, "ecr"),
+            )
             logger.info(f"Initialized ECR client for region: {self.region}")
         except NoCredentialsError:
             logger.error("AWS credentials not found")
@@ -545,12 +1026,34 @@ class ECRClient:
                 details={"region": self.region},
             )
 
+    def _cached_repository(self, repository_name: str) -> Optional[Dict[str, Any]]:
+        """Return a recently seen repository description, if any."""
+        entry = self._repositories.get(repository_name)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._repositories[repository_name]
+            return None
+        return entry[1]
+
+    def _remember_repositories(self, repositories: List[Dict[str, Any]]) -> None:
+        """Cache repository descriptions by name."""
+        expires_at = time.monotonic() + REPOSITORY_CACHE_TTL
+        for repository in repositories:
+            self._repositories[repository["repositoryName"]] = (
+                expires_at,
+                repository,
+            )
+
     async def describe_repositories(
         self, repository_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Describe ECR repositories.
 
+        Named lookups are answered from the repository cache when every
+        name was seen in the last REPOSITORY_CACHE_TTL seconds.
+
         Args:
             repository_names: List of repository names to describe (optional)
 
@@ -563,36 +1066,35 @@ class ECRClient:
         try:
             logger.debug(f"Describing ECR repositories: {repository_names}")
 
-            def describe_repos_sync():
-                kwargs = {}
-                if repository_names:
-                    kwargs["repositoryNames"] = repository_names
+            if repository_names:
+                cached = [self._cached_repository(name) for name in repository_names]
+                if all(cached):
+                    return cached
 
-                response = self.ecr_client.describe_repositories(**kwargs)
-                return response.get("repositories", [])
+            kwargs = {}
+            if repository_names:
+                kwargs["repositoryNames"] = repository_names
 
-            repositories = await asyncio.get_event_loop().run_in_executor(
-                None, describe_repos_sync
+            response = await _run_blocking(
+                self.ecr_client.describe_repositories, **kwargs
             )
+            repositories = response.get("repositories", [])
+            self._remember_repositories(repositories)
 
             logger.debug(f"Found {len(repositories)} repositories")
             return repositories
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "RepositoryNotFound":
+            if e.response["Error"]["Code"] in _ECR_REPOSITORY_NOT_FOUND_CODES:
                 logger.debug(f"Repositories not found: {repository_names}")
                 return []
-            else:
-                logger.error(f"AWS error describing ECR repositories: {e}")
-                raise AWSError(
-                    message=f"Failed to describe ECR repositories: {e.response['Error']['Message']}",
-                    service="ecr",
-                    details={
-                        "repositories": repository_names,
-                        "error_code": error_code,
-                    },
-                )
+            logger.error(f"AWS error describing ECR repositories: {e}")
+            raise _aws_error(
+                e,
+                "describe ECR repositories",
+                "ecr",
+                {"repositories": repository_names},
+            )
         except Exception as e:
             logger.error(f"Failed to describe ECR repositories: {e}")
             raise AWSError(
@@ -603,7 +1105,11 @@ class ECRClient:
 
     async def create_repository(self, repository_name: str) -> Dict[str, Any]:
         """
-        Create an ECR repository.
+        Create an ECR repository, or return it if it already exists.
+
+        Concurrent calls for the same name share one request, and a
+        repository seen in the last REPOSITORY_CACHE_TTL seconds is
+        returned without calling ECR.
 
         Args:
             repository_name: Name of the repository to create
@@ -614,40 +1120,41 @@ class ECRClient:
         Raises:
             AWSError: If ECR operation fails
         """
+        lock = self._create_locks.setdefault(repository_name, asyncio.Lock())
+        async with lock:
+            cached = self._cached_repository(repository_name)
+            if cached is not None:
+                logger.debug(f"ECR repository already known: {repository_name}")
+                return cached
+            return await self._create_repository(repository_name)
+
+    async def _create_repository(self, repository_name: str) -> Dict[str, Any]:
+        """Send CreateRepository, describing the repository if it exists."""
         try:
             logger.info(f"Creating ECR repository: {repository_name}")
 
-            def create_repo_sync():
-                response = self.ecr_client.create_repository(
-                    repositoryName=repository_name,
-                    imageScanningConfiguration={"scanOnPush": True},
-                    encryptionConfiguration={"encryptionType": "AES256"},
-                )
-                return response["repository"]
-
-            repository = await asyncio.get_event_loop().run_in_executor(
-                None, create_repo_sync
+            response = await _run_blocking(
+                self.ecr_client.create_repository,
+                repositoryName=repository_name,
+                imageScanningConfiguration={"scanOnPush": True},
+                encryptionConfiguration={"encryptionType": "AES256"},
             )
+            repository = response["repository"]
+            self._remember_repositories([repository])
 
             logger.info(f"Created ECR repository: {repository_name}")
             return repository
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "RepositoryAlreadyExistsException":
+            if e.response["Error"]["Code"] == "RepositoryAlreadyExistsException":
                 logger.info(f"ECR repository already exists: {repository_name}")
                 # Return existing repository info
                 repositories = await self.describe_repositories([repository_name])
                 return repositories[0] if repositories else {}
-            else:
-                logger.error(
-                    f"AWS error creating ECR repository {repository_name}: {e}"
-                )
-                raise AWSError(
-                    message=f"Failed to create ECR repository: {e.response['Error']['Message']}",
-                    service="ecr",
-                    details={"repository": repository_name, "error_code": error_code},
-                )
+            logger.error(f"AWS error creating ECR repository {repository_name}: {e}")
+            raise _aws_error(
+                e, "create ECR repository", "ecr", {"repository": repository_name}
+            )
         except Exception as e:
             logger.error(f"Failed to create ECR repository {repository_name}: {e}")
             raise AWSError(
@@ -670,36 +1177,27 @@ class ECRClient:
         Raises:
             AWSError: If ECR operation fails
         """
+        self._repositories.pop(repository_name, None)
         try:
             logger.info(f"Deleting ECR repository: {repository_name}")
 
-            def delete_repo_sync():
-                self.ecr_client.delete_repository(
-                    repositoryName=repository_name, force=force
-                )
-                return True
-
-            success = await asyncio.get_event_loop().run_in_executor(
-                None, delete_repo_sync
+            await _run_blocking(
+                self.ecr_client.delete_repository,
+                repositoryName=repository_name,
+                force=force,
             )
 
             logger.info(f"Deleted ECR repository: {repository_name}")
-            return success
+            return True
 
         except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "RepositoryNotFoundException":
+            if e.response["Error"]["Code"] in _ECR_REPOSITORY_NOT_FOUND_CODES:
                 logger.info(f"ECR repository not found for deletion: {repository_name}")
                 return False
-            else:
-                logger.error(
-                    f"AWS error deleting ECR repository {repository_name}: {e}"
-                )
-                raise AWSError(
-                    message=f"Failed to delete ECR repository: {e.response['Error']['Message']}",
-                    service="ecr",
-                    details={"repository": repository_name, "error_code": error_code},
-                )
+            logger.error(f"AWS error deleting ECR repository {repository_name}: {e}")
+            raise _aws_error(
+                e, "delete ECR repository", "ecr", {"repository": repository_name}
+            )
         except Exception as e:
             logger.error(f"Failed to delete ECR repository {repository_name}: {e}")
             raise AWSError(
@@ -709,17 +1207,23 @@ class ECRClient:
             )
 
 
-# Global client instances
+# Global client instances, created once under their lock. Construction
+# resolves credentials and builds connection pools, so it runs off the loop.
 _parameter_store_client = None
 _ecs_client = None
 _ecr_client = None
+_parameter_store_client_lock = asyncio.Lock()
+_ecs_client_lock = asyncio.Lock()
+_ecr_client_lock = asyncio.Lock()
 
 
 async def get_parameter_store_client() -> ParameterStoreClient:
     """Get a shared Parameter Store client instance."""
     global _parameter_store_client
     if _parameter_store_client is None:
-        _parameter_store_client = ParameterStoreClient()
+        async with _parameter_store_client_lock:
+            if _parameter_store_client is None:
+                _parameter_store_client = await _run_blocking(ParameterStoreClient)
     return _parameter_store_client
 
 
@@ -727,7 +1231,9 @@ async def get_ecs_client() -> ECSClient:
     """Get a shared ECS client instance."""
     global _ecs_client
     if _ecs_client is None:
-        _ecs_client = ECSClient()
+        async with _ecs_client_lock:
+            if _ecs_client is None:
+                _ecs_client = await _run_blocking(ECSClient)
     return _ecs_client
 
 
@@ -735,5 +1241,42 @@ async def get_ecr_client() -> ECRClient:
     """Get a shared ECR client instance."""
     global _ecr_client
     if _ecr_client is None:
-        _ecr_client = ECRClient()
+        async with _ecr_client_lock:
+            if _ecr_client is None:
+                _ecr_client = await _run_blocking(ECRClient)
     return _ecr_client
+
+
+async def warmup() -> None:
+    """
+    Create the shared AWS clients and make one cheap call with each.
+
+    The first request to a service resolves credentials, discovers the
+    endpoint and opens a TLS connection. Doing that at startup keeps the
+    cost off the first user request. Failures are logged and ignored; the
+    clients retry on their own when next used.
+    """
+
+    async def warm(name: str, get_client, call) -> None:
+        try:
+            client = await get_client()
+            await call(client)
+            logger.info(f"Warmed up AWS {name} client")
+        except Exception as e:
+            logger.warning(f"AWS {name} client warmup failed: {e}")
+
+    async def warm_ssm(client: ParameterStoreClient) -> None:
+        if client.ssm_client is not None:
+            await _run_blocking(client.ssm_client.describe_parameters, MaxResults=1)
+
+    async def warm_ecs(client: ECSClient) -> None:
+        await _run_blocking(client.ecs_client.list_clusters, maxResults=1)
+
+    async def warm_ecr(client: ECRClient) -> None:
+        await _run_blocking(client.ecr_client.describe_repositories, maxResults=1)
+
+    await asyncio.gather(
+        warm("ssm", get_parameter_store_client, warm_ssm),
+        warm("ecs", get_ecs_client, warm_ecs),
+        warm("ecr", get_ecr_client, warm_ecr),
+    )
@@ -5,8 +5,16 @@ This module provides functionality to interact with GitHub repositories,
 discover muppets, and manage repository metadata.
 """
 
+import asyncio
+import base64
+import importlib.util
+import json
+import random
+import re
+import time
+import traceback
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 try:
     import httpx
@@ -15,6 +23,13 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..config import get_settings
 from ..exceptions import GitHubError
 from ..logging_config import get_logger
@@ -22,6 +37,257 @@ from ..models import Muppet
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Media type that makes the contents API return the file itself
+GITHUB_RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+# Retry policy for rate-limited and transient GitHub responses
+GITHUB_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_JITTER = 1.0
+# Waits longer than this are not worth holding a request for; the
+# response is returned to the caller instead
+MAX_RETRY_DELAY = 60.0
+_RETRY_STATUSES = frozenset({429})
+# Gateway errors are only retried for reads; a write may already have
+# been applied when the gateway gave up on it
+_IDEMPOTENT_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"get", "head"})
+
+# Responses that no retry or later request in the same push can recover from
+_AUTH_FAILURE_STATUSES = frozenset({401, 403})
+
+# Content larger than this is base64-encoded in a worker thread so large
+# files do not stall the event loop
+ENCODE_IN_THREAD_BYTES = 1024 * 1024
+
+# Largest base64 content committed through createCommitOnBranch; bigger
+# pushes go through the REST blob and tree endpoints
+GRAPHQL_COMMIT_MAX_BYTES = 40 * 1024 * 1024
+
+# A repository created moments ago may not have its initial commit yet;
+# missing branch refs are retried with exponential backoff
+BRANCH_REF_ATTEMPTS = 3
+BRANCH_REF_RETRY_DELAY = 0.5
+
+# Query parameters for every organization repository page; the page
+# number is appended per request
+REPOSITORY_PAGE_SIZE = 100
+REPOSITORY_LIST_PARAMS = (
+    ("type", "all"),
+    ("sort", "updated"),
+    ("direction", "desc"),
+    ("per_page", REPOSITORY_PAGE_SIZE),
+)
+
+# Seconds a full repository listing answers get_repository lookups
+REPOSITORY_SNAPSHOT_TTL = 30.0
+
+# The search API returns at most SEARCH_MAX_RESULTS matches per query
+SEARCH_PER_PAGE = 100
+SEARCH_MAX_RESULTS = 1000
+
+# Page number of the rel="last" entry in a GitHub Link header
+_LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# A full commit SHA; content at such a ref never changes
+_COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
+
+# Anything the tree API rejects in a path: backslashes, NUL and line breaks,
+# relative components, empty components and leading or trailing slashes
+_INVALID_PATH_PATTERN = re.compile(r"[\\\0\r\n]|\.\.|//|\A/|/\Z")
+
+# Tree entries sent per create-tree request when a full tree is rejected;
+# each batch builds on the previous tree, so one commit still results
+TREE_BATCH_SIZE = 500
+
+# Longest file path accepted in a tree entry
+MAX_FILE_PATH_LENGTH = 4096
+
+# Files committed with the executable mode (100755)
+_EXECUTABLE_SUFFIXES = (".sh", "gradlew")
+_EXECUTABLE_DIR = "/bin/"
+
+# Fields and values accepted in a git tree entry
+_TREE_ENTRY_FIELDS = ("path", "mode", "type", "sha")
+_VALID_TREE_MODES = frozenset({"100644", "100755", "040000", "120000", "160000"})
+_VALID_TREE_TYPES = frozenset({"blob", "tree", "commit"})
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_body(payload: Any) -> Dict[str, Any]:
+    """
+    Return request arguments sending payload as a JSON body.
+
+    Large push payloads are serialized with orjson when it is installed,
+    falling back to httpx's own json= encoding.
+    """
+    if ORJSON_AVAILABLE:
+        return {
+            "content": orjson.dumps(payload),
+            "headers": {"Content-Type": "application/json"},
+        }
+    return {"json": payload}
+
+
+def _b64encode(content: Union[str, bytes]) -> str:
+    """Base64-encode file content for the GitHub API; text is sent as UTF-8."""
+    if isinstance(content, str):
+        content = content.encode()
+    return base64.b64encode(content).decode("ascii")
+
+
+def _blob_payload(content: Union[str, bytes]) -> Dict[str, str]:
+    """Build a git blob request body; text is sent as-is, binary as base64."""
+    if isinstance(content, str):
+        return {"content": content, "encoding": "utf-8"}
+    return {"content": _b64encode(content), "encoding": "base64"}
+
+
+def _commit_additions(
+    files: List[Tuple[str, Union[str, bytes]]],
+) -> List[Dict[str, str]]:
+    """Build createCommitOnBranch file additions with base64 contents."""
+    return [
+        {"path": file_path, "contents": _b64encode(content)}
+        for file_path, content in files
+    ]
+
+
+def _is_auth_failure(error: Optional[BaseException]) -> bool:
+    """Return True if error is a GitHubError for a 401 or 403 response."""
+    return (
+        isinstance(error, GitHubError)
+        and error.details.get("status_code") in _AUTH_FAILURE_STATUSES
+    )
+
+
+def _retry_delay(response: Any, attempt: int, method: str) -> Optional[float]:
+    """
+    Return how long to wait before retrying a response, or None if it
+    should not be retried.
+
+    Args:
+        response: HTTP response to inspect
+        attempt: Zero-based number of the attempt that produced it
+        method: HTTP method name of the request, e.g. "get"
+
+    Returns:
+        Seconds to wait, including jitter, or None
+    """
+    status = response.status_code
+    headers = response.headers
+    if status == 403:
+        # Rate limited: primary limit exhausted, or a secondary limit
+        if headers.get("x-ratelimit-remaining") != "0" and not headers.get(
+            "retry-after"
+        ):
+            return None
+    elif status in _IDEMPOTENT_RETRY_STATUSES:
+        if method not in _IDEMPOTENT_METHODS:
+            return None
+    elif status not in _RETRY_STATUSES:
+        return None
+
+    delay = RETRY_BASE_DELAY * 2**attempt
+    try:
+        if headers.get("retry-after"):
+            delay = max(delay, float(headers["retry-after"]))
+        elif headers.get("x-ratelimit-reset"):
+            delay = max(delay, float(headers["x-ratelimit-reset"]) - time.time())
+    except ValueError:
+        # Retry-After may be an HTTP date; fall back to the backoff delay
+        pass
+
+    if delay > MAX_RETRY_DELAY:
+        return None
+    return delay + random.uniform(0, RETRY_JITTER)
+
+
+def _last_page(link_header: Optional[str]) -> Optional[int]:
+    """Return the last page number advertised by a Link header, if any."""
+    if not link_header:
+        return None
+    match = _LAST_PAGE_PATTERN.search(link_header)
+    return int(match.group(1)) if match else None
+
+
+# Times the transport retries a failed connection attempt
+HTTP_CONNECT_RETRIES = 2
+
+# Connection pools shared by every GitHubClient, one per token and event
+# loop (None outside a running loop), created on first use
+_http_clients: Dict[
+    Tuple[str, Optional[asyncio.AbstractEventLoop]], "httpx.AsyncClient"
+] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_http_client(token: str) -> "httpx.AsyncClient":
+    """
+    Return the shared GitHub HTTP client for token, creating it if needed.
+
+    All GitHubClient instances with the same token send requests through
+    one pooled client so concurrent calls reuse open connections instead
+    of each opening their own. The client carries the token's
+    Authorization header, so a different token gets its own client, and
+    pooled connections are bound to the loop that opened them, so each
+    event loop gets its own client too. Clients of closed loops are
+    dropped. HTTP/2 is used when the h2 package is installed, letting
+    concurrent requests share one connection.
+    """
+    for key in [key for key in _http_clients if key[1] and key[1].is_closed()]:
+        del _http_clients[key]
+
+    key = (token, _running_loop())
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        client = _http_clients[key] = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "muppet-platform/1.0",
+            },
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # The transport owns the pool; it retries failed connection
+            # attempts before any request is sent
+            transport=httpx.AsyncHTTPTransport(
+                retries=HTTP_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+                http2=importlib.util.find_spec("h2") is not None,
+            ),
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared GitHub HTTP clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _http_clients if key[1] in (loop, None)]
+    for key in keys:
+        await _http_clients.pop(key).aclose()
+
 
 class GitHubClient:
     """
@@ -35,20 +301,34 @@ class GitHubClient:
         self.settings = get_settings()
         self.organization = self.settings.github.organization
         self.token = self.settings.github.token
-        self.base_url = "https://api.github.com"
+        self.base_url = GITHUB_API_URL
         self.integration_mode = self.settings.integration_mode
 
+        # Read cache: (kind, repository, path, ref) -> (expires_at, value).
+        # Concurrent misses for the same key share one in-flight request.
+        # Writes bump the generation so reads started before them are not
+        # cached.
+        self._cache: Dict[Tuple[str, str, str, str], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, str, str, str], asyncio.Future] = {}
+        self._cache_generation = 0
+        # key -> (ETag, body) of the last 200 response, kept past the cache
+        # TTL so expired entries can be revalidated with If-None-Match
+        self._etags: Dict[Tuple[str, str, str, str], Tuple[str, Any]] = {}
+        # Caps in-flight requests so gathered fan-out does not trip GitHub's
+        # secondary rate limits
+        self._sem = asyncio.Semaphore(self.settings.github.max_concurrency)
+
+        # name -> repository from the last listing or muppet search, until
+        # it expires
+        self._repo_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._snapshot_expires_at = 0.0
+        # name -> mock repository, built on first use in mock mode
+        self._mock_repo_index: Optional[Dict[str, Dict[str, Any]]] = None
+
         # Initialize HTTP client based on integration mode
         self._client = None
         if self.integration_mode == "real" and HTTPX_AVAILABLE and self.token:
-            self._client = httpx.AsyncClient(
-                headers={
-                    "Authorization": f"token {self.token}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "muppet-platform/1.0",
-                },
-                timeout=30.0,
-            )
+            self._client = _get_http_client(self.token)
             logger.info(
                 f"Initialized GitHub client in REAL mode for organization: {self.organization}"
             )
@@ -58,10 +338,164 @@ class GitHubClient:
                 f"Integration mode: {self.integration_mode}, HTTPX available: {HTTPX_AVAILABLE}, Token configured: {bool(self.token)}"
             )
 
-    async def discover_muppets(self) -> List[Muppet]:
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """
+        Send a request, retrying rate-limited and transient failures.
+
+        429 responses and 403 responses caused by rate limiting are retried
+        up to GITHUB_MAX_ATTEMPTS times, as are 502, 503 and 504 responses
+        to GET and HEAD requests; writes are not repeated after a gateway
+        error since they may already have been applied. The wait
+        honours Retry-After or X-RateLimit-Reset and otherwise backs off
+        exponentially, plus random jitter.
+
+        Args:
+            method: HTTP method name, e.g. "get"
+            url: Request path
+            **kwargs: Arguments for the HTTP client call
+
+        Returns:
+            The last response received
+        """
+        send = getattr(self._client, method)
+        for attempt in range(GITHUB_MAX_ATTEMPTS):
+            async with self._sem:
+                response = await send(url, **kwargs)
+            delay = _retry_delay(response, attempt, method)
+            if delay is None or attempt == GITHUB_MAX_ATTEMPTS - 1:
+                break
+            logger.warning(
+                f"GitHub {method.upper()} {url} returned {response.status_code}, "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+        return response
+
+    async def _cached(
+        self,
+        key: Tuple[str, str, str, str],
+        fetch: Callable[[], Awaitable[T]],
+        ttl: Optional[float] = None,
+    ) -> T:
+        """
+        Return a cached read, or fetch it once for all concurrent callers.
+
+        Args:
+            key: Cache key of (kind, repository, path, ref)
+            fetch: Coroutine factory performing the uncached read
+            ttl: Seconds to keep the result (default: settings.github.cache_ttl)
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        if ttl is None:
+            ttl = self.settings.github.cache_ttl
+
+        future = self._inflight.get(key)
+        if future is None:
+            generation = self._cache_generation
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+
+            def store(done: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                if (
+                    ttl > 0
+                    and generation == self._cache_generation
+                    and not done.cancelled()
+                    and done.exception() is None
+                    and done.result() is not None
+                ):
+                    self._cache[key] = (time.monotonic() + ttl, done.result())
+
+            future.add_done_callback(store)
+
+        # Shield the shared fetch so one cancelled caller does not fail the rest
+        return await asyncio.shield(future)
+
+    async def _conditional_get(
+        self,
+        key: Tuple[str, str, str, str],
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, Any]:
+        """
+        GET a JSON resource, revalidating an earlier response by its ETag.
+
+        A 304 Not Modified does not count against the rate limit and carries
+        no body; the body stored with the ETag is returned instead.
+
+        Args:
+            key: Cache key the ETag is stored under
+            url: Request path
+            params: Query parameters
+
+        Returns:
+            Tuple of (response, decoded body); the body is None unless the
+            response was 200 or 304
+        """
+        stored = self._etags.get(key)
+        headers = {"If-None-Match": stored[0]} if stored else None
+        response = await self._request("get", url, params=params, headers=headers)
+
+        if response.status_code == 304 and stored:
+            return response, stored[1]
+        if response.status_code != 200:
+            return response, None
+
+        data = _json_loads(response.content)
+        etag = response.headers.get("etag")
+        if etag:
+            self._etags[key] = (etag, data)
+        return response, data
+
+    def _remember_repositories(self, repositories: List[Dict[str, Any]]) -> None:
+        """Index fetched repositories by name for get_repository."""
+        self._repo_snapshot = {repo["name"]: repo for repo in repositories}
+        self._snapshot_expires_at = time.monotonic() + REPOSITORY_SNAPSHOT_TTL
+
+    def _snapshot_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Return a repository from an unexpired snapshot, if present."""
+        if self._repo_snapshot is None or (
+            self._snapshot_expires_at <= time.monotonic()
+        ):
+            return None
+        return self._repo_snapshot.get(repo_name)
+
+    def _invalidate(self, repo_name: str, file_path: Optional[str] = None) -> None:
+        """
+        Drop cached reads for a repository that was just written to.
+
+        Args:
+            repo_name: Repository name, with or without the organization
+            file_path: Only drop reads of this file (default: everything)
+        """
+        self._cache_generation += 1
+        name = repo_name.removeprefix(f"{self.organization}/")
+        names = {name, f"{self.organization}/{name}"}
+        if file_path is None and self._repo_snapshot is not None:
+            self._repo_snapshot.pop(name, None)
+        for key in list(self._cache):
+            kind, repository, path, _ = key
+            if repository in names and (
+                file_path is None or (kind in ("file", "raw") and path == file_path)
+            ):
+                del self._cache[key]
+
+    async def discover_muppets(
+        self, repositories: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Muppet]:
         """
         Discover all muppets by scanning GitHub repositories.
 
+        Args:
+            repositories: Already-fetched repository data to scan instead of
+                fetching it again
+
         Returns:
             List of muppets found in the GitHub organization
 
@@ -71,26 +505,28 @@ class GitHubClient:
         try:
             logger.info(f"Discovering muppets in organization: {self.organization}")
 
-            if self._client:
-                # Real GitHub API implementation
-                repositories = await self._fetch_repositories()
-            else:
-                # Mock implementation for development/testing
-                repositories = self._get_mock_repositories()
+            if repositories is None:
+                if self._client:
+                    # Real GitHub API implementation
+                    repositories = await self._fetch_muppet_repositories()
+                else:
+                    # Mock implementation for development/testing
+                    repositories = self._get_mock_repositories()
 
             muppets = []
             for repo_data in repositories:
+                # Only process repositories that are marked as muppets
+                if "muppet" not in (repo_data.get("topics") or ()):
+                    continue
                 try:
-                    # Only process repositories that are marked as muppets
-                    topics = repo_data.get("topics", [])
-                    if "muppet" in topics:
-                        muppet = Muppet.from_github_repo(repo_data)
-                        muppets.append(muppet)
-                        logger.debug(f"Discovered muppet: {muppet.name}")
+                    muppet = Muppet.from_github_repo(repo_data)
                 except Exception as e:
                     logger.warning(
                         f"Failed to parse muppet from repo {repo_data.get('name', 'unknown')}: {e}"
                     )
+                    continue
+                muppets.append(muppet)
+                logger.debug(f"Discovered muppet: {muppet.name}")
 
             logger.info(f"Discovered {len(muppets)} muppets")
             return muppets
@@ -102,6 +538,87 @@ class GitHubClient:
                 details={"organization": self.organization},
             )
 
+    async def _fetch_muppet_repositories(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the repositories tagged with the muppet topic.
+
+        Uses the GraphQL API, which returns only the fields discovery needs
+        with topics included. When GraphQL is unavailable (e.g. the token
+        lacks GraphQL access) the REST search API is used, and the full
+        organization listing only if the search cannot return every match.
+
+        Returns:
+            List of repository data
+
+        Raises:
+            GitHubError: If the REST fallback fails
+        """
+        try:
+            repositories = await self.fetch_repositories_graphql()
+        except GitHubError as e:
+            logger.warning(f"GraphQL repository listing failed, using REST: {e}")
+        else:
+            return [repo for repo in repositories if "muppet" in repo["topics"]]
+
+        repositories = await self._search_muppet_repositories()
+        if repositories is None:
+            return await self._fetch_repositories()
+        return repositories
+
+    async def _search_muppet_repositories(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find the organization's muppet repositories with the search API.
+
+        Only matching repositories are downloaded, instead of every
+        repository in the organization. The search index can trail recent
+        topic changes by a short while.
+
+        Returns:
+            List of repository data, or None if the search failed or has
+            more matches than it can return (1000)
+        """
+        try:
+            url = "/search/repositories"
+            params = {
+                "q": f"org:{self.organization} topic:muppet",
+                "per_page": SEARCH_PER_PAGE,
+            }
+            repositories = []
+            page = 1
+            while True:
+                response = await self._request(
+                    "get", url, params={**params, "page": page}
+                )
+                if response.status_code != 200:
+                    logger.warning(
+                        f"Repository search failed: {response.status_code} - {response.text}"
+                    )
+                    return None
+
+                result = _json_loads(response.content)
+                if (
+                    result.get("incomplete_results")
+                    or result["total_count"] > SEARCH_MAX_RESULTS
+                ):
+                    logger.info("Repository search incomplete, listing all")
+                    return None
+
+                repositories.extend(result["items"])
+                if (
+                    len(result["items"]) < SEARCH_PER_PAGE
+                    or len(repositories) >= result["total_count"]
+                ):
+                    break
+                page += 1
+
+            logger.debug(f"Found {len(repositories)} muppet repositories by search")
+            self._remember_repositories(repositories)
+            return repositories
+
+        except Exception as e:
+            logger.warning(f"Repository search failed: {e}")
+            return None
+
     async def _fetch_repositories(self) -> List[Dict[str, Any]]:
         """
         Fetch repositories from GitHub API.
@@ -113,26 +630,18 @@ class GitHubClient:
             GitHubError: If API request fails
         """
         try:
-            repositories = []
-            page = 1
-            per_page = 100
-
-            while True:
-                url = f"{self.base_url}/orgs/{self.organization}/repos"
-                params = {
-                    "type": "all",
-                    "sort": "updated",
-                    "direction": "desc",
-                    "per_page": per_page,
-                    "page": page,
-                }
+            per_page = REPOSITORY_PAGE_SIZE
+            url = f"/orgs/{self.organization}/repos"
 
+            async def fetch_page(page: int) -> Optional[Any]:
                 logger.debug(f"Fetching repositories page {page}")
-                response = await self._client.get(url, params=params)
+                response = await self._request(
+                    "get", url, params=[*REPOSITORY_LIST_PARAMS, ("page", page)]
+                )
 
                 if response.status_code == 404:
                     logger.warning(f"Organization not found: {self.organization}")
-                    break
+                    return None
                 elif response.status_code != 200:
                     raise GitHubError(
                         message=f"GitHub API error: {response.status_code} - {response.text}",
@@ -141,26 +650,154 @@ class GitHubClient:
                             "response": response.text,
                         },
                     )
+                return response
 
-                page_repos = response.json()
-                if not page_repos:
-                    break
+            response = await fetch_page(1)
+            if response is None:
+                return []
+            page_repos = _json_loads(response.content)
+            repositories = list(page_repos)
+
+            last_page = _last_page(response.headers.get("link"))
+            if last_page is not None:
+                # The first page says how many there are; fetch the rest at once
+                responses = await asyncio.gather(
+                    *(fetch_page(page) for page in range(2, last_page + 1))
+                )
+                for response in responses:
+                    if response is not None:
+                        repositories.extend(_json_loads(response.content))
+            else:
+                # No Link header: page until a short page comes back
+                page = 1
+                while len(page_repos) == per_page:
+                    page += 1
+                    response = await fetch_page(page)
+                    if response is None:
+                        break
+                    page_repos = _json_loads(response.content)
+                    repositories.extend(page_repos)
+
+            logger.debug(f"Fetched {len(repositories)} repositories from GitHub API")
+            self._remember_repositories(repositories)
+            return repositories
+
+        except GitHubError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch repositories from GitHub API: {e}")
+            raise GitHubError(
+                message=f"Failed to fetch repositories: {str(e)}",
+                details={"organization": self.organization},
+            )
+
+    _REPOSITORIES_QUERY = """
+    query($org: String!, $cursor: String) {
+      organization(login: $org) {
+        repositories(first: 100, after: $cursor,
+                     orderBy: {field: UPDATED_AT, direction: DESC}) {
+          pageInfo { endCursor hasNextPage }
+          nodes {
+            name
+            nameWithOwner
+            url
+            description
+            isPrivate
+            createdAt
+            updatedAt
+            defaultBranchRef { name }
+            repositoryTopics(first: 100) { nodes { topic { name } } }
+          }
+        }
+      }
+    }
+    """
+
+    async def fetch_repositories_graphql(self) -> List[Dict[str, Any]]:
+        """
+        Fetch repositories and their topics via the GitHub GraphQL API.
+
+        Returns one request per 100 repositories, with topics included, and
+        normalises each node to the REST repository shape used elsewhere.
+
+        Returns:
+            List of repository data
+
+        Raises:
+            GitHubError: If API request fails
+        """
+        if not self._client:
+            return self._get_mock_repositories()
 
-                repositories.extend(page_repos)
+        try:
+            repositories = []
+            cursor = None
 
-                # If we got fewer than per_page results, we're done
-                if len(page_repos) < per_page:
+            while True:
+                response = await self._request(
+                    "post",
+                    f"/graphql",
+                    json={
+                        "query": self._REPOSITORIES_QUERY,
+                        "variables": {"org": self.organization, "cursor": cursor},
+                    },
+                )
+
+                if response.status_code != 200:
+                    raise GitHubError(
+                        message=f"GitHub GraphQL error: {response.status_code} - {response.text}",
+                        details={
+                            "status_code": response.status_code,
+                            "response": response.text,
+                        },
+                    )
+
+                body = _json_loads(response.content)
+                if body.get("errors"):
+                    raise GitHubError(
+                        message=f"GitHub GraphQL error: {body['errors']}",
+                        details={"organization": self.organization},
+                    )
+
+                organization = (body.get("data") or {}).get("organization")
+                if organization is None:
+                    logger.warning(f"Organization not found: {self.organization}")
                     break
 
-                page += 1
+                page = organization["repositories"]
+                for node in page["nodes"]:
+                    repositories.append(
+                        {
+                            "name": node["name"],
+                            "full_name": node["nameWithOwner"],
+                            "html_url": node["url"],
+                            "description": node["description"],
+                            "private": node["isPrivate"],
+                            "topics": [
+                                t["topic"]["name"]
+                                for t in node["repositoryTopics"]["nodes"]
+                            ],
+                            "created_at": node["createdAt"],
+                            "updated_at": node["updatedAt"],
+                            # Empty repositories have no default branch yet
+                            "default_branch": (
+                                node["defaultBranchRef"] or {"name": "main"}
+                            )["name"],
+                        }
+                    )
 
-            logger.debug(f"Fetched {len(repositories)} repositories from GitHub API")
+                if not page["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = page["pageInfo"]["endCursor"]
+
+            logger.debug(f"Fetched {len(repositories)} repositories via GraphQL")
+            self._remember_repositories(repositories)
             return repositories
 
         except GitHubError:
             raise
         except Exception as e:
-            logger.error(f"Failed to fetch repositories from GitHub API: {e}")
+            logger.error(f"Failed to fetch repositories via GraphQL: {e}")
             raise GitHubError(
                 message=f"Failed to fetch repositories: {str(e)}",
                 details={"organization": self.organization},
@@ -196,8 +833,8 @@ class GitHubClient:
             if self._client:
                 # Real GitHub API implementation
                 # First, get the current file to get its SHA
-                url = f"{self.base_url}/repos/{repo_name}/contents/{file_path}"
-                response = await self._client.get(url, params={"re": branch})
+                url = f"/repos/{repo_name}/contents/{file_path}"
+                response = await self._request("get", url, params={"ref": branch})
 
                 file_sha = None
                 if response.status_code == 200:
@@ -210,20 +847,17 @@ class GitHubClient:
                     )
 
                 # Update or create the file
-                import base64
-
-                encoded_content = base64.b64encode(content.encode()).decode()
-
                 data = {
                     "message": commit_message,
-                    "content": encoded_content,
+                    "content": _b64encode(content),
                     "branch": branch,
                 }
 
                 if file_sha:
                     data["sha"] = file_sha
 
-                response = await self._client.put(url, json=data)
+                response = await self._request("put", url, json=data)
+                self._invalidate(repo_name, file_path)
 
                 if response.status_code not in [200, 201]:
                     raise GitHubError(
@@ -247,12 +881,95 @@ class GitHubClient:
                 details={"repository": repo_name, "file_path": file_path},
             )
 
-    async def list_tags(self, repo_name: str) -> List[Dict[str, Any]]:
+    _TAGS_QUERY = """
+    query($owner: String!, $name: String!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        refs(
+          refPrefix: "refs/tags/"
+          first: 100
+          after: $cursor
+          orderBy: {field: TAG_COMMIT_DATE, direction: DESC}
+        ) {
+          pageInfo { endCursor hasNextPage }
+          nodes {
+            name
+            target { oid ... on Tag { target { oid } } }
+          }
+        }
+      }
+    }
+    """
+
+    async def _fetch_tag_names_graphql(self, repo_name: str) -> List[Dict[str, Any]]:
+        """
+        Fetch every tag's name and commit SHA via the GitHub GraphQL API.
+
+        Annotated tags are resolved to the commit they point at. Each tag is
+        returned in the REST shape, {"name": ..., "commit": {"sha": ...}}.
+
+        Args:
+            repo_name: Repository name (e.g., "muppet-platform/templates")
+
+        Returns:
+            List of tag data
+
+        Raises:
+            GitHubError: If API request fails
+        """
+        owner, name = repo_name.split("/", 1)
+        tags = []
+        cursor = None
+
+        while True:
+            response = await self._request(
+                "post",
+                "/graphql",
+                json={
+                    "query": self._TAGS_QUERY,
+                    "variables": {"owner": owner, "name": name, "cursor": cursor},
+                },
+            )
+            if response.status_code != 200:
+                raise GitHubError(
+                    message=f"GitHub GraphQL error: {response.status_code} - {response.text}",
+                    details={
+                        "status_code": response.status_code,
+                        "repository": repo_name,
+                    },
+                )
+
+            body = _json_loads(response.content)
+            if body.get("errors"):
+                raise GitHubError(
+                    message=f"GitHub GraphQL error: {body['errors']}",
+                    details={"repository": repo_name},
+                )
+
+            repository = (body.get("data") or {}).get("repository")
+            if repository is None:
+                logger.warning(f"Repository not found: {repo_name}")
+                return tags
+
+            page = repository["refs"]
+            for node in page["nodes"]:
+                target = node["target"]
+                sha = (target.get("target") or target)["oid"]
+                tags.append({"name": node["name"], "commit": {"sha": sha}})
+
+            if not page["pageInfo"]["hasNextPage"]:
+                return tags
+            cursor = page["pageInfo"]["endCursor"]
+
+    async def list_tags(
+        self, repo_name: str, names_only: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         List tags for a repository.
 
         Args:
             repo_name: Repository name (e.g., "muppet-platform/templates")
+            names_only: Only the tag names and commit SHAs are needed, so
+                fetch them via GraphQL without the rest of each tag object
 
         Returns:
             List of tag data
@@ -263,23 +980,36 @@ class GitHubClient:
         try:
             logger.debug(f"Listing tags for {repo_name}")
 
+            if self._client and names_only:
+                try:
+                    return await self._cached(
+                        ("tag_names", repo_name, "", ""),
+                        lambda: self._fetch_tag_names_graphql(repo_name),
+                    )
+                except GitHubError as e:
+                    logger.warning(f"GraphQL tag listing failed, using REST: {e}")
+
             if self._client:
                 # Real GitHub API implementation
-                url = f"{self.base_url}/repos/{repo_name}/tags"
-                response = await self._client.get(url)
+                key = ("tags", repo_name, "", "")
 
-                if response.status_code == 404:
-                    logger.warning(f"Repository not found: {repo_name}")
-                    return []
-                elif response.status_code != 200:
-                    raise GitHubError(
-                        message=f"Failed to list tags: {response.status_code} - {response.text}",
-                        details={"repository": repo_name},
-                    )
+                async def fetch() -> Optional[List[Dict[str, Any]]]:
+                    url = f"/repos/{repo_name}/tags"
+                    response, tags = await self._conditional_get(key, url)
 
-                tags = response.json()
-                logger.debug(f"Found {len(tags)} tags for {repo_name}")
-                return tags
+                    if response.status_code == 404:
+                        logger.warning(f"Repository not found: {repo_name}")
+                        return None
+                    elif tags is None:
+                        raise GitHubError(
+                            message=f"Failed to list tags: {response.status_code} - {response.text}",
+                            details={"repository": repo_name},
+                        )
+
+                    logger.debug(f"Found {len(tags)} tags for {repo_name}")
+                    return tags
+
+                return await self._cached(key, fetch) or []
             else:
                 # Mock implementation
                 logger.info(f"MOCK: Would list tags for {repo_name}")
@@ -327,33 +1057,44 @@ class GitHubClient:
 
             if self._client:
                 # Real GitHub API implementation
-                url = f"{self.base_url}/repos/{repo_name}/contents/{file_path}"
-                response = await self._client.get(url, params={"re": ref})
+                key = ("file", repo_name, file_path, ref)
 
-                if response.status_code == 404:
-                    raise GitHubError(
-                        message=f"File not found: {file_path}",
-                        details={
-                            "repository": repo_name,
-                            "file_path": file_path,
-                            "re": ref,
-                        },
-                    )
-                elif response.status_code != 200:
-                    raise GitHubError(
-                        message=f"Failed to get file content: {response.status_code} - {response.text}",
-                        details={"repository": repo_name, "file_path": file_path},
+                async def fetch() -> str:
+                    url = f"/repos/{repo_name}/contents/{file_path}"
+                    response, file_data = await self._conditional_get(
+                        key, url, params={"ref": ref}
                     )
 
-                file_data = response.json()
+                    if response.status_code == 404:
+                        raise GitHubError(
+                            message=f"File not found: {file_path}",
+                            details={
+                                "repository": repo_name,
+                                "file_path": file_path,
+                                "ref": ref,
+                            },
+                        )
+                    elif file_data is None:
+                        raise GitHubError(
+                            message=f"Failed to get file content: {response.status_code} - {response.text}",
+                            details={"repository": repo_name, "file_path": file_path},
+                        )
 
-                # Decode base64 content
-                import base64
+                    # Decode base64 content
+                    content = base64.b64decode(file_data["content"]).decode()
 
-                content = base64.b64decode(file_data["content"]).decode()
+                    logger.debug(
+                        f"Retrieved {len(content)} characters from {file_path}"
+                    )
+                    return content
 
-                logger.debug(f"Retrieved {len(content)} characters from {file_path}")
-                return content
+                # Content at a commit SHA cannot change, so keep it longer
+                ttl = (
+                    self.settings.github.immutable_cache_ttl
+                    if _COMMIT_SHA_PATTERN.fullmatch(ref)
+                    else None
+                )
+                return await self._cached(key, fetch, ttl)
             else:
                 # Mock implementation
                 logger.info(
@@ -377,6 +1118,84 @@ class GitHubClient:
                 details={"repository": repo_name, "file_path": file_path},
             )
 
+    async def get_file_bytes(
+        self, repo_name: str, file_path: str, ref: str = "main"
+    ) -> bytes:
+        """
+        Get raw file content from a repository.
+
+        Requests the raw media type, so GitHub sends the file itself instead
+        of base64 text inside JSON. Use this when the content is handled as
+        bytes, e.g. when copying binary or template files.
+
+        Args:
+            repo_name: Repository name (e.g., "muppet-platform/templates")
+            file_path: Path to the file in the repository
+            ref: Git reference (branch, tag, or commit SHA)
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            GitHubError: If GitHub API calls fail
+        """
+        try:
+            logger.debug(f"Getting file bytes {file_path} from {repo_name} at {ref}")
+
+            if self._client:
+                # Real GitHub API implementation
+                async def fetch() -> bytes:
+                    url = f"/repos/{repo_name}/contents/{file_path}"
+                    response = await self._request(
+                        "get",
+                        url,
+                        params={"ref": ref},
+                        headers={"Accept": GITHUB_RAW_MEDIA_TYPE},
+                    )
+
+                    if response.status_code == 404:
+                        raise GitHubError(
+                            message=f"File not found: {file_path}",
+                            details={
+                                "repository": repo_name,
+                                "file_path": file_path,
+                                "ref": ref,
+                            },
+                        )
+                    elif response.status_code != 200:
+                        raise GitHubError(
+                            message=f"Failed to get file content: {response.status_code} - {response.text}",
+                            details={"repository": repo_name, "file_path": file_path},
+                        )
+
+                    logger.debug(
+                        f"Retrieved {len(response.content)} bytes from {file_path}"
+                    )
+                    return response.content
+
+                # Content at a commit SHA cannot change, so keep it longer
+                ttl = (
+                    self.settings.github.immutable_cache_ttl
+                    if _COMMIT_SHA_PATTERN.fullmatch(ref)
+                    else None
+                )
+                return await self._cached(
+                    ("raw", repo_name, file_path, ref), fetch, ttl
+                )
+            else:
+                # Mock implementation
+                content = await self.get_file_content(repo_name, file_path, ref)
+                return content.encode()
+
+        except GitHubError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get file bytes {file_path} from {repo_name}: {e}")
+            raise GitHubError(
+                message=f"Failed to get file content: {str(e)}",
+                details={"repository": repo_name, "file_path": file_path},
+            )
+
     async def update_repository_status(self, muppet_name: str, status: str) -> bool:
         """
         Update repository status (typically via topics or description).
@@ -397,12 +1216,13 @@ class GitHubClient:
             if self._client:
                 # Real GitHub API implementation
                 repo_name = f"{self.organization}/{muppet_name}"
-                url = f"{self.base_url}/repos/{repo_name}"
+                url = f"/repos/{repo_name}"
 
                 # Update repository description to include status
                 data = {"description": f"Muppet: {muppet_name} (Status: {status})"}
 
-                response = await self._client.patch(url, json=data)
+                response = await self._request("patch", url, json=data)
+                self._invalidate(muppet_name)
 
                 if response.status_code != 200:
                     raise GitHubError(
@@ -444,30 +1264,40 @@ class GitHubClient:
         try:
             logger.debug(f"Getting repository: {repo_name}")
 
+            # A recent listing or muppet search already has the repository
+            snapshot = self._snapshot_repository(repo_name)
+            if snapshot is not None:
+                return snapshot
+
             if self._client:
                 # Real GitHub API implementation
-                url = f"{self.base_url}/repos/{self.organization}/{repo_name}"
-                response = await self._client.get(url)
+                key = ("repository", repo_name, "", "")
 
-                if response.status_code == 404:
-                    return None
-                elif response.status_code != 200:
-                    raise GitHubError(
-                        message=f"GitHub API error: {response.status_code} - {response.text}",
-                        details={
-                            "status_code": response.status_code,
-                            "repository": repo_name,
-                        },
-                    )
+                async def fetch() -> Optional[Dict[str, Any]]:
+                    url = f"/repos/{self.organization}/{repo_name}"
+                    response, repository = await self._conditional_get(key, url)
 
-                return response.json()
+                    if response.status_code == 404:
+                        return None
+                    elif repository is None:
+                        raise GitHubError(
+                            message=f"GitHub API error: {response.status_code} - {response.text}",
+                            details={
+                                "status_code": response.status_code,
+                                "repository": repo_name,
+                            },
+                        )
+
+                    return repository
+
+                return await self._cached(key, fetch)
             else:
                 # Mock implementation
-                mock_repos = self._get_mock_repositories()
-                for repo in mock_repos:
-                    if repo["name"] == repo_name:
-                        return repo
-                return None
+                if self._mock_repo_index is None:
+                    self._mock_repo_index = {
+                        repo["name"]: repo for repo in self._get_mock_repositories()
+                    }
+                return self._mock_repo_index.get(repo_name)
 
         except GitHubError:
             raise
@@ -500,7 +1330,7 @@ class GitHubClient:
 
             if self._client:
                 # Real GitHub API implementation
-                url = f"{self.base_url}/orgs/{self.organization}/repos"
+                url = f"/orgs/{self.organization}/repos"
                 payload = {
                     "name": name,
                     "description": description,
@@ -514,7 +1344,7 @@ class GitHubClient:
                     "delete_branch_on_merge": True,
                 }
 
-                response = await self._client.post(url, json=payload)
+                response = await self._request("post", url, json=payload)
 
                 if response.status_code == 422:
                     raise GitHubError(
@@ -583,14 +1413,12 @@ class GitHubClient:
                 logger.info(f"Repository configuration setup (mock): {repo_name}")
                 return
 
-            # Set up branch protection rules
-            await self._setup_branch_protection(repo_name)
-
-            # Set up CI/CD workflows
-            await self._setup_workflows(repo_name, template)
-
-            # Set up issue and PR templates
-            await self._setup_templates(repo_name)
+            # Branch protection uses its own endpoint, so apply it while the
+            # workflow and template files are written
+            await asyncio.gather(
+                self._setup_branch_protection(repo_name),
+                self._setup_repository_files(repo_name, template),
+            )
 
             logger.info(f"Completed repository configuration for: {repo_name}")
 
@@ -615,7 +1443,7 @@ class GitHubClient:
                 logger.debug(f"Branch protection disabled for {repo_name}")
                 return True
 
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/branches/main/protection"
+            url = f"/repos/{self.organization}/{repo_name}/branches/main/protection"
             payload = {
                 "required_status_checks": {
                     "strict": True,
@@ -635,7 +1463,7 @@ class GitHubClient:
                 "required_conversation_resolution": True,
             }
 
-            response = await self._client.put(url, json=payload)
+            response = await self._request("put", url, json=payload)
 
             if response.status_code == 200:
                 logger.info(f"Set up branch protection for {repo_name}")
@@ -650,6 +1478,21 @@ class GitHubClient:
             logger.warning(f"Failed to set up branch protection for {repo_name}: {e}")
             return False
 
+    async def _setup_repository_files(self, repo_name: str, template: str) -> None:
+        """
+        Write the CI/CD workflows, then the issue and PR templates.
+
+        Each file is its own commit on main. They are written one at a time
+        because concurrent Contents API writes to the same branch race on
+        its head commit and fail with 409 Conflict.
+
+        Args:
+            repo_name: Repository name
+            template: Template type for workflow configuration
+        """
+        await self._setup_workflows(repo_name, template)
+        await self._setup_templates(repo_name)
+
     async def _setup_workflows(self, repo_name: str, template: str) -> bool:
         """
         Set up CI/CD workflows for the repository.
@@ -697,29 +1540,29 @@ class GitHubClient:
             True if successful
         """
         try:
-            # Create issue template
-            issue_template = self._get_issue_template()
-            await self._create_file(
-                repo_name,
-                ".github/ISSUE_TEMPLATE/bug_report.md",
-                issue_template,
-                "Add issue template",
-            )
-
-            # Create PR template
-            pr_template = self._get_pr_template()
-            await self._create_file(
-                repo_name,
-                ".github/pull_request_template.md",
-                pr_template,
-                "Add PR template",
+            templates = (
+                (
+                    ".github/ISSUE_TEMPLATE/bug_report.md",
+                    self._get_issue_template(),
+                    "Add issue template",
+                ),
+                (
+                    ".github/pull_request_template.md",
+                    self._get_pr_template(),
+                    "Add PR template",
+                ),
+                (
+                    ".github/CODEOWNERS",
+                    self._get_codeowners_template(),
+                    "Add CODEOWNERS file",
+                ),
             )
 
-            # Create CODEOWNERS file
-            codeowners = self._get_codeowners_template()
-            await self._create_file(
-                repo_name, ".github/CODEOWNERS", codeowners, "Add CODEOWNERS file"
-            )
+            for path, content, commit_message in templates:
+                if not await self._create_file(
+                    repo_name, path, content, commit_message
+                ):
+                    logger.warning(f"Failed to create {path} for {repo_name}")
 
             logger.info(f"Set up templates for {repo_name}")
             return True
@@ -729,7 +1572,11 @@ class GitHubClient:
             return False
 
     async def _create_file(
-        self, repo_name: str, path: str, content: str, commit_message: str
+        self,
+        repo_name: str,
+        path: str,
+        content: Union[str, bytes],
+        commit_message: str,
     ) -> bool:
         """
         Create a file in the repository.
@@ -737,25 +1584,21 @@ class GitHubClient:
         Args:
             repo_name: Repository name
             path: File path in repository
-            content: File content
+            content: File content (str or bytes)
             commit_message: Commit message
 
         Returns:
             True if successful
         """
         try:
-            import base64
-
-            url = (
-                f"{self.base_url}/repos/{self.organization}/{repo_name}/contents/{path}"
-            )
+            url = f"/repos/{self.organization}/{repo_name}/contents/{path}"
             payload = {
                 "message": commit_message,
-                "content": base64.b64encode(content.encode()).decode(),
+                "content": _b64encode(content),
                 "branch": "main",
             }
 
-            response = await self._client.put(url, json=payload)
+            response = await self._request("put", url, **_json_body(payload))
 
             if response.status_code == 201:
                 logger.debug(f"Created file {path} in {repo_name}")
@@ -837,7 +1680,9 @@ class GitHubClient:
         Push multiple files in a single commit using GitHub Git Data API with comprehensive validation.
 
         This approach is much more efficient and reliable than individual file creation,
-        especially for nested directories like .github/workflows.
+        especially for nested directories like .github/workflows. Files are
+        committed with one GraphQL mutation when possible, falling back to
+        the REST blob and tree endpoints.
 
         Args:
             repo_name: Repository name
@@ -850,97 +1695,94 @@ class GitHubClient:
         try:
             logger.info(f"Starting batch push of {len(files)} files to {repo_name}")
 
-            # For newly created repositories, wait a moment for GitHub to initialize
-            import asyncio
-
-            await asyncio.sleep(2)
-
-            # Step 1: Get the current branch reference (main)
-            branch_ref = await self._get_branch_ref(repo_name, "main")
-            if not branch_ref:
+            # Step 1: Get the head commit (and usually its tree) of main
+            branch_head = await self._get_branch_head(repo_name, "main")
+            if not branch_head:
                 logger.error(f"Failed to get branch reference for {repo_name}")
                 return False
 
-            parent_commit_sha = branch_ref["object"]["sha"]
-            logger.debug(f"Parent commit SHA: {parent_commit_sha}")
-
-            # Step 2: Get the current tree SHA
-            base_tree_sha = await self._get_commit_tree_sha(
-                repo_name, parent_commit_sha
-            )
-            if not base_tree_sha:
-                logger.error(f"Failed to get base tree SHA for {repo_name}")
-                return False
-
-            logger.debug(f"Base tree SHA: {base_tree_sha}")
+            branch, parent_commit_sha, base_tree_sha = branch_head
+            logger.debug("Parent commit SHA: %s", parent_commit_sha)
 
-            # Step 3: Validate and create blobs for all files with comprehensive validation
+            # Step 2: Validate all files
             tree_entries = []
             blob_failures = []
             large_files = []
             invalid_paths = []
+            pending = []
 
             for file_path, content in files.items():
-                try:
-                    # Validate file path
-                    if not self._is_valid_file_path(file_path):
-                        logger.warning(f"Invalid file path: {file_path}")
-                        invalid_paths.append(file_path)
-                        continue
-
-                    # Check file size limits
-                    content_size = (
-                        len(content) if isinstance(content, (str, bytes)) else 0
+                # Validate file path
+                if not self._is_valid_file_path(file_path):
+                    logger.warning(f"Invalid file path: {file_path}")
+                    invalid_paths.append(file_path)
+                    continue
+
+                # Check file size limits
+                content_size = len(content) if isinstance(content, (str, bytes)) else 0
+                if content_size > 100 * 1024 * 1024:  # 100MB GitHub limit
+                    logger.warning(
+                        f"File too large: {file_path} ({content_size} bytes)"
                     )
-                    if content_size > 100 * 1024 * 1024:  # 100MB GitHub limit
-                        logger.warning(
-                            f"File too large: {file_path} ({content_size} bytes)"
-                        )
-                        large_files.append(file_path)
-                        continue
-
-                    # Create blob with validation
-                    blob_sha = await self._create_blob_validated(
-                        repo_name, content, file_path
+                    large_files.append(file_path)
+                    continue
+
+                pending.append((file_path, content))
+
+            # Step 3: Commit everything in one GraphQL mutation when possible
+            if pending:
+                if await self._push_files_graphql(
+                    repo_name, pending, commit_message, branch, parent_commit_sha
+                ):
+                    logger.info(
+                        f"Successfully pushed {len(pending)} files to {repo_name} in one GraphQL commit"
                     )
-                    if not blob_sha:
-                        logger.error(f"Failed to create blob for {file_path}")
-                        blob_failures.append(file_path)
-                        continue
-
-                    # Validate blob SHA format
-                    if not self._is_valid_sha(blob_sha):
-                        logger.error(f"Invalid blob SHA for {file_path}: {blob_sha}")
-                        blob_failures.append(file_path)
-                        continue
-
-                    # Determine file mode with validation
-                    mode = self._get_file_mode(file_path)
-                    if not mode:
-                        logger.error(f"Could not determine file mode for {file_path}")
-                        blob_failures.append(file_path)
-                        continue
-
-                    # Create validated tree entry
-                    tree_entry = {
-                        "path": file_path,
-                        "mode": mode,
-                        "type": "blob",
-                        "sha": blob_sha,
-                    }
+                    return True
 
-                    # Validate tree entry structure
-                    if self._validate_tree_entry(tree_entry):
-                        tree_entries.append(tree_entry)
-                    else:
+            # Step 4: Get the current tree SHA if the branch lookup lacked it
+            if not base_tree_sha:
+                base_tree_sha = await self._get_commit_tree_sha(
+                    repo_name, parent_commit_sha
+                )
+            if not base_tree_sha:
+                logger.error(f"Failed to get base tree SHA for {repo_name}")
+                return False
+
+            logger.debug("Base tree SHA: %s", base_tree_sha)
+
+            # Step 5: Create blobs concurrently, stopping the remaining
+            # uploads as soon as one is rejected for authorization
+            tasks = [
+                asyncio.create_task(
+                    self._prepare_tree_entry(repo_name, file_path, content)
+                )
+                for file_path, content in pending
+            ]
+            waiting = set(tasks)
+            while waiting:
+                done, waiting = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_EXCEPTION
+                )
+                for task in done:
+                    if _is_auth_failure(task.exception()):
+                        for other in waiting:
+                            other.cancel()
+                        await asyncio.gather(*waiting, return_exceptions=True)
                         logger.error(
-                            f"Invalid tree entry for {file_path}: {tree_entry}"
+                            f"Aborting batch push to {repo_name}: {task.exception()}"
                         )
-                        blob_failures.append(file_path)
+                        return False
 
-                except Exception as e:
-                    logger.error(f"Exception processing {file_path}: {e}")
+            for (file_path, _), task in zip(pending, tasks):
+                if task.exception():
+                    logger.error(
+                        f"Exception processing {file_path}: {task.exception()}"
+                    )
+                    blob_failures.append(file_path)
+                elif task.result() is None:
                     blob_failures.append(file_path)
+                else:
+                    tree_entries.append(task.result())
 
             # Report validation results
             if blob_failures:
@@ -962,7 +1804,7 @@ class GitHubClient:
                 f"Successfully validated {len(tree_entries)} files for tree creation"
             )
 
-            # Step 4: Create tree with batch size limits and retry logic
+            # Step 6: Create tree with batch size limits and retry logic
             success = await self._create_tree_with_retry(
                 repo_name,
                 tree_entries,
@@ -984,6 +1826,134 @@ class GitHubClient:
             logger.error(f"Batch push failed for {repo_name}: {e}")
             return False
 
+    _CREATE_COMMIT_MUTATION = """
+    mutation($input: CreateCommitOnBranchInput!) {
+      createCommitOnBranch(input: $input) { commit { oid } }
+    }
+    """
+
+    async def _push_files_graphql(
+        self,
+        repo_name: str,
+        files: List[Tuple[str, Union[str, bytes]]],
+        commit_message: str,
+        branch: str,
+        head_sha: str,
+    ) -> bool:
+        """
+        Commit files in a single createCommitOnBranch GraphQL mutation.
+
+        This replaces the blob, tree, commit and ref update REST calls with
+        one request. File additions cannot carry a file mode, so pushes with
+        executable files are left to the REST path, as are pushes whose
+        encoded content exceeds GRAPHQL_COMMIT_MAX_BYTES.
+
+        Args:
+            repo_name: Repository name
+            files: (file path, content) pairs to add
+            commit_message: Commit message
+            branch: Branch to commit to
+            head_sha: Commit SHA the branch is expected to point at
+
+        Returns:
+            True if the commit was created, False if the REST path should be used
+        """
+        if any(self._get_file_mode(file_path) != "100644" for file_path, _ in files):
+            logger.info(f"Skipping GraphQL commit for {repo_name}: executable files")
+            return False
+
+        content_size = sum(len(content) for _, content in files)
+        if content_size > ENCODE_IN_THREAD_BYTES:
+            additions = await asyncio.to_thread(_commit_additions, files)
+        else:
+            additions = _commit_additions(files)
+        payload_size = sum(len(addition["contents"]) for addition in additions)
+        if payload_size > GRAPHQL_COMMIT_MAX_BYTES:
+            logger.info(
+                f"Skipping GraphQL commit for {repo_name}: {payload_size} bytes exceeds limit"
+            )
+            return False
+
+        response = await self._request(
+            "post",
+            "/graphql",
+            **_json_body(
+                {
+                    "query": self._CREATE_COMMIT_MUTATION,
+                    "variables": {
+                        "input": {
+                            "branch": {
+                                "repositoryNameWithOwner": f"{self.organization}/{repo_name}",
+                                "branchName": branch,
+                            },
+                            "message": {"headline": commit_message},
+                            "fileChanges": {"additions": additions},
+                            "expectedHeadOid": head_sha,
+                        }
+                    },
+                }
+            ),
+        )
+        if response.status_code != 200:
+            logger.warning(
+                f"GraphQL commit failed for {repo_name}: {response.status_code} - {response.text}"
+            )
+            return False
+
+        body = _json_loads(response.content)
+        if body.get("errors"):
+            logger.warning(f"GraphQL commit failed for {repo_name}: {body['errors']}")
+            return False
+
+        return True
+
+    async def _prepare_tree_entry(
+        self, repo_name: str, file_path: str, content: Union[str, bytes]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Create the blob for one file and build its validated tree entry.
+
+        Blob uploads share the client's request semaphore, so callers can
+        schedule every file at once without exceeding max_concurrency.
+
+        Args:
+            repo_name: Repository name
+            file_path: Path of the file in the repository
+            content: File content
+
+        Returns:
+            Tree entry dictionary, or None if the file could not be processed
+        """
+        blob_sha = await self._create_blob_validated(repo_name, content, file_path)
+        if not blob_sha:
+            logger.error(f"Failed to create blob for {file_path}")
+            return None
+
+        # Validate blob SHA format
+        if not self._is_valid_sha(blob_sha):
+            logger.error(f"Invalid blob SHA for {file_path}: {blob_sha}")
+            return None
+
+        # Determine file mode with validation
+        mode = self._get_file_mode(file_path)
+        if not mode:
+            logger.error(f"Could not determine file mode for {file_path}")
+            return None
+
+        tree_entry = {
+            "path": file_path,
+            "mode": mode,
+            "type": "blob",
+            "sha": blob_sha,
+        }
+
+        # Validate tree entry structure
+        if not self._validate_tree_entry(tree_entry):
+            logger.error(f"Invalid tree entry for {file_path}: {tree_entry}")
+            return None
+
+        return tree_entry
+
     async def _push_files_individual(
         self, repo_name: str, files: Dict[str, any], template: str
     ) -> bool:
@@ -1008,32 +1978,16 @@ class GitHubClient:
 
             for file_path, content in files.items():
                 try:
-                    # Handle binary files properly
-                    if isinstance(content, bytes):
-                        # For binary files, we need to use base64 encoding
-                        import base64
-
-                        encoded_content = base64.b64encode(content).decode()
-
-                        # Create the file using raw API call for binary content
-                        success = await self._create_file_binary(
-                            repo_name,
-                            file_path,
-                            encoded_content,
-                            f"Add {file_path} from {template} template",
-                        )
-                    else:
-                        # For text files, use the existing method
-                        success = await self._create_file(
-                            repo_name,
-                            file_path,
-                            content,
-                            f"Add {file_path} from {template} template",
-                        )
+                    success = await self._create_file(
+                        repo_name,
+                        file_path,
+                        content,
+                        f"Add {file_path} from {template} template",
+                    )
 
                     if success:
                         success_count += 1
-                        logger.debug(f"Successfully pushed {file_path}")
+                        logger.debug("Successfully pushed %s", file_path)
                     else:
                         failed_files.append(file_path)
                         logger.warning(f"Failed to push {file_path}")
@@ -1059,129 +2013,52 @@ class GitHubClient:
             logger.error(f"Individual push failed for {repo_name}: {e}")
             return False
 
-    async def _create_file_binary(
-        self, repo_name: str, path: str, base64_content: str, commit_message: str
-    ) -> bool:
-        """
-        Create a binary file in the repository using base64 content.
-
-        Args:
-            repo_name: Repository name
-            path: File path in repository
-            base64_content: Base64 encoded file content
-            commit_message: Commit message
-
-        Returns:
-            True if successful
-        """
-        try:
-            url = (
-                f"{self.base_url}/repos/{self.organization}/{repo_name}/contents/{path}"
-            )
-            payload = {
-                "message": commit_message,
-                "content": base64_content,
-                "branch": "main",
-            }
-
-            response = await self._client.put(url, json=payload)
-
-            if response.status_code == 201:
-                logger.debug(f"Created binary file {path} in {repo_name}")
-                return True
-            else:
-                logger.warning(
-                    f"Failed to create binary file {path} in {repo_name}: {response.status_code}"
-                )
-                return False
-
-        except Exception as e:
-            logger.warning(f"Failed to create binary file {path} in {repo_name}: {e}")
-            return False
-
     def _is_valid_file_path(self, file_path: str) -> bool:
         """Validate that a file path is acceptable for GitHub tree API."""
         if not file_path or not isinstance(file_path, str):
             return False
 
-        # Check for invalid characters
-        invalid_chars = ["\\", "\0", "\r", "\n"]
-        if any(char in file_path for char in invalid_chars):
-            return False
-
-        # Check path length (GitHub has limits)
-        if len(file_path) > 4096:
-            return False
-
-        # Check for relative path components
-        if ".." in file_path or file_path.startswith("/"):
-            return False
-
-        # Check for empty path components
-        if "//" in file_path or file_path.endswith("/"):
-            return False
-
-        return True
+        return (
+            len(file_path) <= MAX_FILE_PATH_LENGTH
+            and _INVALID_PATH_PATTERN.search(file_path) is None
+        )
 
     def _is_valid_sha(self, sha: str) -> bool:
         """Validate that a SHA is properly formatted."""
         if not sha or not isinstance(sha, str):
             return False
 
-        if len(sha) != 40:
-            return False
-
-        # Check if all characters are valid hex
-        try:
-            int(sha, 16)
-            return True
-        except ValueError:
-            return False
+        return _COMMIT_SHA_PATTERN.fullmatch(sha) is not None
 
     def _get_file_mode(self, file_path: str) -> Optional[str]:
         """Get the appropriate Git file mode for a file path."""
         if not file_path:
             return None
 
-        # Executable files
-        if file_path.endswith((".sh", "gradlew")) or "/bin/" in file_path:
+        if file_path.endswith(_EXECUTABLE_SUFFIXES) or _EXECUTABLE_DIR in file_path:
             return "100755"
-
-        # Regular files
         return "100644"
 
     def _validate_tree_entry(self, entry: Dict[str, str]) -> bool:
         """Validate a tree entry structure."""
-        required_fields = ["path", "mode", "type", "sha"]
-
         # Check all required fields are present
-        for field in required_fields:
-            if field not in entry:
-                return False
-
-        # Validate field values
-        if not self._is_valid_file_path(entry["path"]):
-            return False
-
-        if entry["mode"] not in ["100644", "100755", "040000", "120000", "160000"]:
-            return False
-
-        if entry["type"] not in ["blob", "tree", "commit"]:
-            return False
-
-        if not self._is_valid_sha(entry["sha"]):
+        if not all(field in entry for field in _TREE_ENTRY_FIELDS):
             return False
 
-        return True
+        # Validate field values
+        return (
+            entry["mode"] in _VALID_TREE_MODES
+            and entry["type"] in _VALID_TREE_TYPES
+            and self._is_valid_file_path(entry["path"])
+            and self._is_valid_sha(entry["sha"])
+        )
 
     async def _create_blob_validated(
         self, repo_name: str, content: any, file_path: str
     ) -> Optional[str]:
         """Create a blob with enhanced validation and error handling."""
         try:
-            import base64
-
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/blobs"
+            url = f"/repos/{self.organization}/{repo_name}/git/blobs"
 
             # Handle both string and bytes content with size validation
             if isinstance(content, bytes):
@@ -1192,27 +2069,25 @@ class GitHubClient:
                     )
                     return None
 
-                encoded_content = base64.b64encode(content).decode()
-                encoding = "base64"
             else:
                 # For text files, validate encoding
                 try:
-                    content_bytes = content.encode("utf-8")
-                    if len(content_bytes) > 100 * 1024 * 1024:  # 100MB limit for text
+                    content_size = len(content.encode("utf-8"))
+                    if content_size > 100 * 1024 * 1024:  # 100MB limit for text
                         logger.warning(
-                            f"Text file too large: {file_path} ({len(content_bytes)} bytes)"
+                            f"Text file too large: {file_path} ({content_size} bytes)"
                         )
                         return None
-
-                    encoded_content = base64.b64encode(content_bytes).decode()
-                    encoding = "base64"
                 except UnicodeEncodeError as e:
                     logger.error(f"Failed to encode text file {file_path}: {e}")
                     return None
 
-            payload = {"content": encoded_content, "encoding": encoding}
+            if isinstance(content, bytes) and len(content) > ENCODE_IN_THREAD_BYTES:
+                payload = await asyncio.to_thread(_blob_payload, content)
+            else:
+                payload = _blob_payload(content)
 
-            response = await self._client.post(url, json=payload)
+            response = await self._request("post", url, **_json_body(payload))
 
             if response.status_code == 201:
                 blob_data = response.json()
@@ -1226,15 +2101,30 @@ class GitHubClient:
                     return None
 
                 logger.debug(
-                    f"Created blob for {file_path}: {blob_sha[:8]}... (size: {len(encoded_content)} chars)"
+                    "Created blob for %s: %.8s... (size: %d chars)",
+                    file_path,
+                    blob_sha,
+                    len(payload["content"]),
                 )
                 return blob_sha
+            elif response.status_code in _AUTH_FAILURE_STATUSES:
+                # Every other upload in the push would be rejected too
+                raise GitHubError(
+                    message=f"GitHub rejected blob upload: {response.status_code} - {response.text}",
+                    details={
+                        "status_code": response.status_code,
+                        "repository": repo_name,
+                        "file_path": file_path,
+                    },
+                )
             else:
                 logger.error(
                     f"Failed to create blob for {file_path}: {response.status_code} - {response.text}"
                 )
                 return None
 
+        except GitHubError:
+            raise
         except Exception as e:
             logger.error(f"Error creating blob for {file_path}: {e}")
             return None
@@ -1247,36 +2137,41 @@ class GitHubClient:
         parent_commit_sha: str,
         commit_message: str,
     ) -> bool:
-        """Create tree with comprehensive retry logic and batch size management."""
+        """
+        Create tree and commit it, splitting it into batches if it is too large.
 
-        # Try full batch first
+        The full tree is sent once (_create_tree itself retries without
+        base_tree). Only a 422 for more than TREE_BATCH_SIZE entries falls
+        back to _create_tree_in_batches; any other failure fails the push.
+
+        tree_entries must already have passed _validate_tree_entry.
+        """
         logger.info(f"Attempting to create tree with {len(tree_entries)} entries")
 
         # Log sample entries for debugging
-        logger.debug(f"Sample tree entries: {tree_entries[:3]}")
+        logger.debug("Sample tree entries: %s", tree_entries[:3])
 
-        # Attempt 1: Full tree with base_tree
-        new_tree_sha = await self._create_tree(repo_name, tree_entries, base_tree_sha)
+        new_tree_sha, status_code = await self._create_tree(
+            repo_name, tree_entries, base_tree_sha, validated=True
+        )
 
         if new_tree_sha:
             return await self._complete_commit(
                 repo_name, new_tree_sha, parent_commit_sha, commit_message
             )
 
-        # Attempt 2: Full tree without base_tree
-        logger.warning("Retrying tree creation without base_tree")
-        new_tree_sha = await self._create_tree(repo_name, tree_entries, None)
-
-        if new_tree_sha:
-            return await self._complete_commit(
-                repo_name, new_tree_sha, parent_commit_sha, commit_message
+        if status_code == 422 and len(tree_entries) > TREE_BATCH_SIZE:
+            logger.warning("Attempting tree creation with smaller batches")
+            return await self._create_tree_in_batches(
+                repo_name,
+                tree_entries,
+                base_tree_sha,
+                parent_commit_sha,
+                commit_message,
             )
 
-        # Attempt 3: Split into smaller batches
-        logger.warning("Attempting tree creation with smaller batches")
-        return await self._create_tree_in_batches(
-            repo_name, tree_entries, base_tree_sha, parent_commit_sha, commit_message
-        )
+        logger.error(f"Failed to create tree for {repo_name}: {status_code}")
+        return False
 
     async def _complete_commit(
         self, repo_name: str, tree_sha: str, parent_commit_sha: str, commit_message: str
@@ -1291,7 +2186,7 @@ class GitHubClient:
             logger.error(f"Failed to create commit for {repo_name}")
             return False
 
-        logger.debug(f"Created commit: {new_commit_sha}")
+        logger.debug("Created commit: %s", new_commit_sha)
 
         # Update branch reference
         success = await self._update_branch_ref(repo_name, "main", new_commit_sha)
@@ -1309,116 +2204,149 @@ class GitHubClient:
         parent_commit_sha: str,
         commit_message: str,
     ) -> bool:
-        """Create tree in smaller batches if full tree creation fails."""
+        """
+        Create tree in batches if full tree creation fails.
 
-        batch_size = 20  # Start with smaller batches
+        Each batch of TREE_BATCH_SIZE entries is layered onto the previous
+        batch's tree through base_tree, and only the final tree is committed,
+        so the push still produces a single commit on parent_commit_sha.
+        """
         current_tree_sha = base_tree_sha
-        current_commit_sha = parent_commit_sha
+        total_batches = (len(tree_entries) + TREE_BATCH_SIZE - 1) // TREE_BATCH_SIZE
 
-        # Split entries into batches
-        for i in range(0, len(tree_entries), batch_size):
-            batch = tree_entries[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(tree_entries) + batch_size - 1) // batch_size
+        for i in range(0, len(tree_entries), TREE_BATCH_SIZE):
+            batch = tree_entries[i : i + TREE_BATCH_SIZE]
+            batch_num = (i // TREE_BATCH_SIZE) + 1
 
             logger.info(
                 f"Processing batch {batch_num}/{total_batches} ({len(batch)} files)"
             )
 
-            # Create tree for this batch
-            new_tree_sha = await self._create_tree(repo_name, batch, current_tree_sha)
+            # Only the first batch may drop base_tree; later batches would
+            # lose the entries already layered onto it
+            new_tree_sha, _ = await self._create_tree(
+                repo_name,
+                batch,
+                current_tree_sha,
+                validated=True,
+                retry_without_base=batch_num == 1,
+            )
 
             if not new_tree_sha:
                 logger.error(f"Failed to create tree for batch {batch_num}")
-
-                # Try without base_tree for this batch
-                new_tree_sha = await self._create_tree(repo_name, batch, None)
-
-                if not new_tree_sha:
-                    logger.error(
-                        f"Failed to create tree for batch {batch_num} even without base_tree"
-                    )
-                    return False
-
-            # Create commit for this batch
-            batch_commit_message = (
-                f"{commit_message} (batch {batch_num}/{total_batches})"
-            )
-            new_commit_sha = await self._create_commit(
-                repo_name, new_tree_sha, current_commit_sha, batch_commit_message
-            )
-
-            if not new_commit_sha:
-                logger.error(f"Failed to create commit for batch {batch_num}")
                 return False
 
-            # Update for next iteration
             current_tree_sha = new_tree_sha
-            current_commit_sha = new_commit_sha
+            logger.debug("Completed batch %d: tree %.8s...", batch_num, new_tree_sha)
 
-            logger.debug(f"Completed batch {batch_num}: commit {new_commit_sha[:8]}...")
-
-        # Update branch reference to final commit
-        success = await self._update_branch_ref(repo_name, "main", current_commit_sha)
-        if not success:
-            logger.error("Failed to update branch reference after batch processing")
+        if not await self._complete_commit(
+            repo_name, current_tree_sha, parent_commit_sha, commit_message
+        ):
             return False
 
         logger.info(f"Successfully created tree in {total_batches} batches")
         return True
 
+    async def _get_branch_head(
+        self, repo_name: str, branch: str
+    ) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Get a branch's name, head commit SHA and tree SHA.
+
+        The branches endpoint returns the commit and its tree in one response.
+        When it does not answer (a new, empty or renamed branch), this falls
+        back to _get_branch_ref, and the tree SHA is returned as None.
+
+        Args:
+            repo_name: Repository name
+            branch: Branch name
+
+        Returns:
+            (branch name, commit SHA, tree SHA or None), or None if no branch was found
+        """
+        url = f"/repos/{self.organization}/{repo_name}/branches/{branch}"
+        response = await self._request("get", url)
+        if response.status_code == 200:
+            data = response.json()
+            commit = data["commit"]
+            return data["name"], commit["sha"], commit["commit"]["tree"]["sha"]
+
+        branch_ref = await self._get_branch_ref(repo_name, branch)
+        if not branch_ref:
+            return None
+        ref_branch = branch_ref.get("ref", f"refs/heads/{branch}")
+        return ref_branch.removeprefix("refs/heads/"), branch_ref["object"]["sha"], None
+
     async def _get_branch_ref(
         self, repo_name: str, branch: str
     ) -> Optional[Dict[str, Any]]:
-        """Get branch reference information."""
-        try:
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/refs/heads/{branch}"
-            response = await self._client.get(url)
+        """
+        Get branch reference information, falling back to the default branch.
+
+        A branch that is missing (404) or a repository that is still empty
+        (409) is retried with backoff, since a just-created repository may
+        not have its initial commit yet.
+        """
+        for attempt in range(BRANCH_REF_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(BRANCH_REF_RETRY_DELAY * 2 ** (attempt - 1))
+            try:
+                url = f"/repos/{self.organization}/{repo_name}/git/refs/heads/{branch}"
+                response = await self._request("get", url)
+
+                if response.status_code == 200:
+                    return response.json()
+                elif response.status_code not in (404, 409):
+                    logger.error(
+                        f"Failed to get branch ref: {response.status_code} - {response.text}"
+                    )
+                    return None
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
                 # Branch doesn't exist yet, try to get the default branch
                 logger.warning(
                     f"Branch {branch} not found, checking repository default branch"
                 )
-                repo_url = f"{self.base_url}/repos/{self.organization}/{repo_name}"
-                repo_response = await self._client.get(repo_url)
+                default_ref = await self._get_default_branch_ref(repo_name, branch)
+                if default_ref:
+                    return default_ref
 
-                if repo_response.status_code == 200:
-                    repo_data = repo_response.json()
-                    default_branch = repo_data.get("default_branch")
+            except Exception as e:
+                logger.error(f"Error getting branch ref: {e}")
+                return None
 
-                    if default_branch and default_branch != branch:
-                        # Try the default branch
-                        default_url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/refs/heads/{default_branch}"
-                        default_response = await self._client.get(default_url)
+        logger.error(f"No valid branch found for {repo_name}")
+        return None
 
-                        if default_response.status_code == 200:
-                            logger.info(
-                                f"Using default branch {default_branch} instead of {branch}"
-                            )
-                            return default_response.json()
+    async def _get_default_branch_ref(
+        self, repo_name: str, branch: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get the default branch reference when it differs from branch."""
+        repo_url = f"/repos/{self.organization}/{repo_name}"
+        repo_response = await self._request("get", repo_url)
+        if repo_response.status_code != 200:
+            return None
 
-                logger.error(f"No valid branch found for {repo_name}")
-                return None
-            else:
-                logger.error(
-                    f"Failed to get branch ref: {response.status_code} - {response.text}"
-                )
-                return None
+        default_branch = repo_response.json().get("default_branch")
+        if not default_branch or default_branch == branch:
+            return None
 
-        except Exception as e:
-            logger.error(f"Error getting branch ref: {e}")
+        default_url = (
+            f"/repos/{self.organization}/{repo_name}/git/refs/heads/{default_branch}"
+        )
+        default_response = await self._request("get", default_url)
+        if default_response.status_code != 200:
             return None
 
+        logger.info(f"Using default branch {default_branch} instead of {branch}")
+        return default_response.json()
+
     async def _get_commit_tree_sha(
         self, repo_name: str, commit_sha: str
     ) -> Optional[str]:
         """Get tree SHA from commit."""
         try:
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/commits/{commit_sha}"
-            response = await self._client.get(url)
+            url = f"/repos/{self.organization}/{repo_name}/git/commits/{commit_sha}"
+            response = await self._request("get", url)
 
             if response.status_code == 200:
                 commit_data = response.json()
@@ -1436,29 +2364,19 @@ class GitHubClient:
     async def _create_blob(self, repo_name: str, content: any) -> Optional[str]:
         """Create a blob for file content."""
         try:
-            import base64
-
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/blobs"
-
-            # Handle both string and bytes content
-            if isinstance(content, bytes):
-                # For binary files, encode as base64
-                encoded_content = base64.b64encode(content).decode()
-                encoding = "base64"
-            else:
-                # For text files, use UTF-8
-                encoded_content = base64.b64encode(content.encode("utf-8")).decode()
-                encoding = "base64"
+            url = f"/repos/{self.organization}/{repo_name}/git/blobs"
 
-            payload = {"content": encoded_content, "encoding": encoding}
+            payload = _blob_payload(content)
 
-            response = await self._client.post(url, json=payload)
+            response = await self._request("post", url, **_json_body(payload))
 
             if response.status_code == 201:
                 blob_data = response.json()
                 blob_sha = blob_data["sha"]
                 logger.debug(
-                    f"Created blob: {blob_sha[:8]}... (size: {len(encoded_content)} chars)"
+                    "Created blob: %.8s... (size: %d chars)",
+                    blob_sha,
+                    len(payload["content"]),
                 )
                 return blob_sha
             else:
@@ -1476,10 +2394,23 @@ class GitHubClient:
         repo_name: str,
         tree_entries: List[Dict[str, str]],
         base_tree_sha: Optional[str],
-    ) -> Optional[str]:
-        """Create a new tree with the given entries."""
+        validated: bool = False,
+        retry_without_base: bool = True,
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Create a new tree with the given entries.
+
+        Entries are checked with _validate_tree_entry first unless validated
+        is set, for callers that built them through _prepare_tree_entry.
+        A request with base_tree that fails is retried without it unless
+        retry_without_base is False, for callers whose base tree holds
+        entries that must not be dropped.
+
+        Returns:
+            (tree SHA or None, status code of the last response or None)
+        """
         try:
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/trees"
+            url = f"/repos/{self.organization}/{repo_name}/git/trees"
 
             # Build payload - only include base_tree if it's valid
             payload = {"tree": tree_entries}
@@ -1492,28 +2423,25 @@ class GitHubClient:
                 f"Base tree SHA: {base_tree_sha} (valid: {self._is_valid_sha(base_tree_sha) if base_tree_sha else False})"
             )
             logger.info(f"Tree entries count: {len(tree_entries)}")
-            logger.debug(
-                f"Sample tree entries: {tree_entries[:3] if tree_entries else []}"
-            )
+            logger.debug("Sample tree entries: %s", tree_entries[:3])
 
             # Validate all tree entries before sending
-            invalid_entries = []
-            for i, entry in enumerate(tree_entries):
-                if not self._validate_tree_entry(entry):
-                    invalid_entries.append(f"Entry {i}: {entry}")
-
-            if invalid_entries:
-                logger.error(f"Invalid tree entries found: {invalid_entries}")
-                return None
-
-            logger.debug(f"Tree creation payload: {payload}")
+            if not validated:
+                invalid_entries = [
+                    f"Entry {i}: {entry}"
+                    for i, entry in enumerate(tree_entries)
+                    if not self._validate_tree_entry(entry)
+                ]
+                if invalid_entries:
+                    logger.error(f"Invalid tree entries found: {invalid_entries}")
+                    return None, None
 
-            response = await self._client.post(url, json=payload)
+            response = await self._request("post", url, **_json_body(payload))
 
             if response.status_code == 201:
                 tree_data = response.json()
                 logger.info(f"Successfully created tree: {tree_data['sha']}")
-                return tree_data["sha"]
+                return tree_data["sha"], response.status_code
             else:
                 logger.error(
                     f"Failed to create tree: {response.status_code} - {response.text}"
@@ -1522,41 +2450,42 @@ class GitHubClient:
                 logger.error(f"Payload was: {payload}")
 
                 # If we used base_tree, try without it
-                if "base_tree" in payload:
+                if retry_without_base and "base_tree" in payload:
                     logger.warning("Retrying tree creation without base_tree")
                     payload_no_base = {"tree": tree_entries}
-                    retry_response = await self._client.post(url, json=payload_no_base)
+                    retry_response = await self._request(
+                        "post", url, **_json_body(payload_no_base)
+                    )
 
                     if retry_response.status_code == 201:
                         tree_data = retry_response.json()
                         logger.info(
                             f"Successfully created tree without base_tree: {tree_data['sha']}"
                         )
-                        return tree_data["sha"]
+                        return tree_data["sha"], retry_response.status_code
                     else:
                         logger.error(
                             f"Retry without base_tree also failed: {retry_response.status_code} - {retry_response.text}"
                         )
+                        return None, retry_response.status_code
 
-                return None
+                return None, response.status_code
 
         except Exception as e:
             logger.error(f"Exception creating tree: {e}")
-            import traceback
-
             logger.error(f"Traceback: {traceback.format_exc()}")
-            return None
+            return None, None
 
     async def _create_commit(
         self, repo_name: str, tree_sha: str, parent_sha: str, message: str
     ) -> Optional[str]:
         """Create a new commit."""
         try:
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/commits"
+            url = f"/repos/{self.organization}/{repo_name}/git/commits"
 
             payload = {"message": message, "tree": tree_sha, "parents": [parent_sha]}
 
-            response = await self._client.post(url, json=payload)
+            response = await self._request("post", url, **_json_body(payload))
 
             if response.status_code == 201:
                 commit_data = response.json()
@@ -1576,11 +2505,11 @@ class GitHubClient:
     ) -> bool:
         """Update branch reference to point to new commit."""
         try:
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/git/refs/heads/{branch}"
+            url = f"/repos/{self.organization}/{repo_name}/git/refs/heads/{branch}"
 
             payload = {"sha": commit_sha}
 
-            response = await self._client.patch(url, json=payload)
+            response = await self._request("patch", url, json=payload)
 
             if response.status_code == 200:
                 return True
@@ -2168,10 +3097,11 @@ terraform/ @muppet-platform/infrastructure-team
             if not self._client:
                 return True  # Mock mode
 
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/topics"
+            url = f"/repos/{self.organization}/{repo_name}/topics"
             payload = {"names": topics}
 
-            response = await self._client.put(url, json=payload)
+            response = await self._request("put", url, json=payload)
+            self._invalidate(repo_name)
 
             if response.status_code != 200:
                 logger.warning(
@@ -2250,10 +3180,10 @@ terraform/ @muppet-platform/infrastructure-team
             True if successful
         """
         try:
-            url = f"{self.base_url}/orgs/{self.organization}/teams/{team_name}/repos/{self.organization}/{repo_name}"
+            url = f"/orgs/{self.organization}/teams/{team_name}/repos/{self.organization}/{repo_name}"
             payload = {"permission": permission}
 
-            response = await self._client.put(url, json=payload)
+            response = await self._request("put", url, json=payload)
 
             if response.status_code == 204:
                 return True
@@ -2293,10 +3223,10 @@ terraform/ @muppet-platform/infrastructure-team
                 logger.info(f"Add collaborator (mock): {username} to {repo_name}")
                 return True
 
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/collaborators/{username}"
+            url = f"/repos/{self.organization}/{repo_name}/collaborators/{username}"
             payload = {"permission": permission}
 
-            response = await self._client.put(url, json=payload)
+            response = await self._request("put", url, json=payload)
 
             if response.status_code in [201, 204]:
                 logger.info(f"Added collaborator {username} to {repo_name}")
@@ -2331,8 +3261,8 @@ terraform/ @muppet-platform/infrastructure-team
                 logger.info(f"Remove collaborator (mock): {username} from {repo_name}")
                 return True
 
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/collaborators/{username}"
-            response = await self._client.delete(url)
+            url = f"/repos/{self.organization}/{repo_name}/collaborators/{username}"
+            response = await self._request("delete", url)
 
             if response.status_code == 204:
                 logger.info(f"Removed collaborator {username} from {repo_name}")
@@ -2377,8 +3307,8 @@ terraform/ @muppet-platform/infrastructure-team
                     },
                 ]
 
-            url = f"{self.base_url}/repos/{self.organization}/{repo_name}/collaborators"
-            response = await self._client.get(url)
+            url = f"/repos/{self.organization}/{repo_name}/collaborators"
+            response = await self._request("get", url)
 
             if response.status_code == 200:
                 return response.json()
@@ -2415,8 +3345,9 @@ terraform/ @muppet-platform/infrastructure-team
 
             if self._client:
                 # Real GitHub API implementation
-                url = f"{self.base_url}/repos/{self.organization}/{name}"
-                response = await self._client.delete(url)
+                url = f"/repos/{self.organization}/{name}"
+                response = await self._request("delete", url)
+                self._invalidate(name)
 
                 if response.status_code == 404:
                     logger.warning(f"Repository not found for deletion: {name}")
@@ -2447,10 +3378,15 @@ terraform/ @muppet-platform/infrastructure-team
             )
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """
+        Close the client.
+
+        The HTTP connection pool is shared with other GitHubClient
+        instances and stays open; close_http_client() closes it at
+        application shutdown.
+        """
         if self._client:
-            await self._client.aclose()
-            logger.debug("Closed GitHub HTTP client")
+            logger.debug("GitHub HTTP client stays open for other clients")
 
     def _get_mock_repositories(self) -> List[Dict[str, Any]]:
         """
@@ -66,10 +66,16 @@ async def lifespan(app: FastAPI):
 
     # Start background services
     logger.info("Starting background services...")
+    import asyncio
+
+    if settings.integration_mode != "mock":
+        # Resolve AWS credentials and endpoints before the first request needs them
+        from .integrations.aws import warmup
+
+        app.state.aws_warmup = asyncio.create_task(warmup())
+
     try:
         # Start TLS auto-enhancement service in background
-        import asyncio
-
         asyncio.create_task(tls_auto_service.start())
         logger.info("TLS auto-enhancement service started")
     except Exception as e:
@@ -81,11 +87,18 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down async clients")
 
     # Stop background services
+    if hasattr(app.state, "aws_warmup"):
+        app.state.aws_warmup.cancel()
+
     if hasattr(app.state, "tls_auto_service"):
         await app.state.tls_auto_service.stop()
 
     if hasattr(app.state, "github_client"):
         await app.state.github_client.close()
+
+    from .integrations.github import close_http_client
+
+    await close_http_client()
     logger.info("Shutting down Muppet Platform service")
 
 
@@ -101,7 +114,7 @@ def create_app() -> FastAPI:
     )
 
     # Add CORS middleware
-    cors_origins = ["*"] if settings.debug else settings.cors_origins.split(",")
+    cors_origins = ["*"] if settings.debug else list(settings.cors_origin_list)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=cors_origins,
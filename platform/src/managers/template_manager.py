@@ -22,6 +22,24 @@ from .auto_generator import TemplateMetadata as AutoGenTemplateMetadata
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Safely load a YAML file using the fastest available loader.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)  # nosec B506
+
 
 class TemplateValidationError(PlatformException):
     """Raised when template validation fails."""
@@ -440,8 +458,7 @@ class TemplateManager:
         # Load template config to check structure
         config_path = template_metadata.config_path
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
         except Exception as e:
             errors.append(f"Could not load template config: {e}")
             template_metadata.validation_errors = errors
@@ -664,8 +681,7 @@ class TemplateManager:
         template_yaml = template_dir / "template.yaml"
 
         try:
-            with open(template_yaml, "r") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(template_yaml)
 
             # Create Template object from config
             template = Template(
@@ -722,8 +738,7 @@ class TemplateManager:
         # Load template config to check auto-generation settings
         config_path = template_metadata.config_path
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
         except Exception as e:
             logger.warning(f"Could not load template config: {e}")
             # Process all files if config can't be loaded
@@ -803,8 +818,7 @@ class TemplateManager:
         # Load template config to check auto-generation settings
         config_path = template_metadata.config_path
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
         except Exception as e:
             logger.warning(f"Could not load template config for auto-generation: {e}")
             return
@@ -1024,7 +1024,7 @@ class MCPToolRegistry:
             # Get tags from the templates repository that match the template type
             repo_name = "muppet-platform/templates"
             try:
-                tags = await github_client.list_tags(repo_name)
+                tags = await github_client.list_tags(repo_name, names_only=True)
                 self.logger.info(f"Retrieved {len(tags)} tags from {repo_name}")
             except Exception as e:
                 self.logger.warning(f"Failed to get tags from {repo_name}: {e}")
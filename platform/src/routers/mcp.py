@@ -5,8 +5,10 @@ This module provides HTTP endpoints for executing MCP tools,
 allowing external clients to interact with the platform's MCP functionality.
 """
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -23,6 +25,18 @@ class MCPToolRequest(BaseModel):
     arguments: Dict[str, Any] = {}
 
 
+class MCPBatchToolRequest(MCPToolRequest):
+    """A single tool call within a batch, tagged with a caller-chosen id."""
+
+    id: Any = None
+
+
+class MCPBatchRequest(BaseModel):
+    """Request model for batched MCP tool execution."""
+
+    batch: List[MCPBatchToolRequest]
+
+
 class MCPToolResponse(BaseModel):
     """Response model for MCP tool execution."""
 
@@ -65,8 +79,6 @@ async def execute_mcp_tool(request: MCPToolRequest) -> Dict[str, Any]:
         result_json = await tool_registry.execute_tool(request.tool, request.arguments)
 
         # Parse the JSON result
-        import json
-
         result = json.loads(result_json)
 
         logger.info(f"MCP tool {request.tool} executed successfully")
@@ -83,6 +95,36 @@ async def execute_mcp_tool(request: MCPToolRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Tool execution failed: {str(e)}")
 
 
+@router.post("/tools/execute_batch", response_model=Dict[str, Any])
+async def execute_mcp_tool_batch(request: MCPBatchRequest) -> Dict[str, Any]:
+    """
+    Execute several MCP tools in one request.
+
+    Tools run concurrently. Each entry in the response carries the id of its
+    request and either a "result" or an "error", so one failing tool does not
+    fail the whole batch.
+
+    Args:
+        request: The batch of tool execution requests
+
+    Returns:
+        Dictionary with a "results" list in request order
+    """
+    logger.info(f"Executing batch of {len(request.batch)} MCP tools")
+    tool_registry = get_mcp_tool_registry()
+
+    async def execute(item: MCPBatchToolRequest) -> Dict[str, Any]:
+        try:
+            result_json = await tool_registry.execute_tool(item.tool, item.arguments)
+            return {"id": item.id, "result": json.loads(result_json)}
+        except Exception as e:
+            logger.error(f"MCP tool {item.tool} failed in batch: {e}")
+            return {"id": item.id, "error": str(e)}
+
+    results = await asyncio.gather(*(execute(item) for item in request.batch))
+    return {"results": list(results)}
+
+
 @router.get("/tools/list")
 async def list_mcp_tools() -> Dict[str, Any]:
     """
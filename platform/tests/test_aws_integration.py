@@ -0,0 +1,326 @@
+"""
+Tests for the AWS service integrations.
+
+These tests exercise the Parameter Store, ECS and ECR clients against
+mocked boto3 clients, without talking to AWS.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.exceptions import AWSError
+from src.integrations import aws
+from src.integrations.aws import ECRClient, ECSClient, ParameterStoreClient, ServiceInfo
+
+
+@pytest.fixture
+def parameter_store():
+    """Create a ParameterStoreClient with a mocked SSM client."""
+    client = ParameterStoreClient()
+    client.ssm_client = Mock()
+    return client
+
+
+@pytest.fixture
+def ecr_client():
+    """Create an ECRClient with a mocked ECR client."""
+    client = ECRClient()
+    client.ecr_client = Mock()
+    return client
+
+
+@pytest.fixture
+def ecs_client():
+    """Create an ECSClient with a mocked ECS client."""
+    client = ECSClient()
+    client.ecs_client = Mock()
+    return client
+
+
+def _ecs_service(arn, status="ACTIVE", running=1, desired=1):
+    """Build a describe_services entry for a service ARN."""
+    return {
+        "serviceName": arn.rsplit("/", 1)[-1],
+        "serviceArn": arn,
+        "status": status,
+        "runningCount": running,
+        "desiredCount": desired,
+        "taskDefinition": "task:1",
+    }
+
+
+def _get_parameters_response(values, invalid=()):
+    """Build a GetParameters response for the given full names."""
+    return {
+        "Parameters": [
+            {"Name": name, "Value": value} for name, value in values.items()
+        ],
+        "InvalidParameters": list(invalid),
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_parameter_batches_concurrent_reads(parameter_store):
+    """Test that concurrent reads share a single GetParameters request."""
+    parameter_store.ssm_client.get_parameters.return_value = _get_parameters_response(
+        {"/muppet-platform/a": "1", "/muppet-platform/b": "2"},
+        invalid=["/muppet-platform/missing"],
+    )
+
+    values = await asyncio.gather(
+        parameter_store.get_parameter("a"),
+        parameter_store.get_parameter("b"),
+        parameter_store.get_parameter("missing"),
+    )
+
+    assert values == ["1", "2", None]
+    parameter_store.ssm_client.get_parameters.assert_called_once()
+    parameter_store.ssm_client.get_parameter.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_parameter_batches_split_by_decrypt(parameter_store):
+    """Test that decrypted and plain reads are sent as separate requests."""
+    parameter_store.ssm_client.get_parameters.side_effect = [
+        _get_parameters_response({"/muppet-platform/plain": "p"}),
+        _get_parameters_response({"/muppet-platform/secret": "s"}),
+    ]
+
+    values = await asyncio.gather(
+        parameter_store.get_parameter("plain"),
+        parameter_store.get_parameter("secret", decrypt=True),
+    )
+
+    assert values == ["p", "s"]
+    calls = parameter_store.ssm_client.get_parameters.call_args_list
+    assert [c.kwargs["WithDecryption"] for c in calls] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_get_parameter_served_from_cache(parameter_store):
+    """Test that a repeated read is answered from the cache."""
+    parameter_store.ssm_client.get_parameters.return_value = _get_parameters_response(
+        {"/muppet-platform/github/org": "muppets"}
+    )
+
+    assert await parameter_store.get_parameter("github/org") == "muppets"
+    assert await parameter_store.get_parameter("github/org") == "muppets"
+
+    parameter_store.ssm_client.get_parameters.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_put_parameter_invalidates_cache(parameter_store):
+    """Test that writing a parameter drops its cached reads."""
+    parameter_store.ssm_client.get_parameters.side_effect = [
+        _get_parameters_response({"/muppet-platform/github/org": "old"}),
+        _get_parameters_response({"/muppet-platform/github/org": "new"}),
+    ]
+
+    assert await parameter_store.get_parameter("github/org") == "old"
+    await parameter_store.put_parameter("github/org", "new")
+
+    assert await parameter_store.get_parameter("github/org") == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_parameters_by_path_single_flight(parameter_store):
+    """Test that concurrent path reads share one paginated fetch."""
+    paginator = parameter_store.ssm_client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {"Parameters": [{"Name": "/muppet-platform/terraform/a", "Value": "1"}]}
+    ]
+
+    first, second = await asyncio.gather(
+        parameter_store.get_parameters_by_path("terraform"),
+        parameter_store.get_parameters_by_path("terraform"),
+    )
+
+    assert first == second == {"terraform/a": "1"}
+    paginator.paginate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_list_services_paginates_and_chunks_describe(ecs_client):
+    """Test that all ARN pages are read and described 10 at a time."""
+    arns = [f"arn:aws:ecs:us-west-2:123:service/cluster/svc-{i}" for i in range(25)]
+    paginator = ecs_client.ecs_client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {"serviceArns": arns[:20]},
+        {"serviceArns": arns[20:]},
+    ]
+    ecs_client.ecs_client.describe_services.side_effect = lambda cluster, services: {
+        "services": [_ecs_service(arn) for arn in services]
+    }
+
+    services = await ecs_client.list_services()
+
+    assert [s.service_arn for s in services] == arns
+    chunks = [
+        c.kwargs["services"]
+        for c in ecs_client.ecs_client.describe_services.call_args_list
+    ]
+    assert sorted(len(c) for c in chunks) == [5, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_get_active_deployments_filters_and_caches(ecs_client):
+    """Test that only running services are returned and reused briefly."""
+    arns = [
+        "arn:aws:ecs:us-west-2:123:service/cluster/running",
+        "arn:aws:ecs:us-west-2:123:service/cluster/scaled-down",
+    ]
+    paginator = ecs_client.ecs_client.get_paginator.return_value
+    paginator.paginate.return_value = [{"serviceArns": arns}]
+    ecs_client.ecs_client.describe_services.return_value = {
+        "services": [_ecs_service(arns[0]), _ecs_service(arns[1], running=0)]
+    }
+
+    first = await ecs_client.get_active_deployments()
+    second = await ecs_client.get_active_deployments()
+
+    assert first == second == {"running": arns[0]}
+    assert paginator.paginate.call_args.kwargs["schedulingStrategy"] == "REPLICA"
+    paginator.paginate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_iter_parameters_by_path_yields_across_pages(parameter_store):
+    """Test that iteration yields relative names from every page in order."""
+    paginator = parameter_store.ssm_client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {"Parameters": [{"Name": "/muppet-platform/terraform/a", "Value": "1"}]},
+        {"Parameters": [{"Name": "/muppet-platform/terraform/b", "Value": "2"}]},
+    ]
+
+    items = [
+        item async for item in parameter_store.iter_parameters_by_path("terraform")
+    ]
+
+    assert items == [("terraform/a", "1"), ("terraform/b", "2")]
+
+
+@pytest.mark.asyncio
+async def test_get_parameter_mock_mode_values():
+    """Test that mock mode returns the canned parameter values."""
+    client = ParameterStoreClient()
+    client.ssm_client = None
+
+    assert await client.get_parameter("terraform/modules/fargate/version") == "1.0.0"
+    assert await client.get_parameter("github/token") == "mock-github-token"
+    assert await client.get_parameter("other") == "mock-value-for-other"
+
+
+@pytest.mark.asyncio
+async def test_client_error_wrapped_with_error_code(parameter_store):
+    """Test that unexpected AWS errors surface as AWSError with the code."""
+    parameter_store.ssm_client.delete_parameter.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+        "DeleteParameter",
+    )
+
+    with pytest.raises(AWSError) as exc_info:
+        await parameter_store.delete_parameter("github/token")
+
+    assert exc_info.value.message == "Failed to delete parameter: denied"
+    assert exc_info.value.details["error_code"] == "AccessDeniedException"
+    assert exc_info.value.details["parameter"] == "github/token"
+
+
+@pytest.mark.asyncio
+async def test_warmup_calls_each_service_and_tolerates_failures(monkeypatch):
+    """Test that warmup touches every client and swallows their errors."""
+    ssm, ecs, ecr = Mock(), Mock(), Mock()
+    ecs.list_clusters.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+        "ListClusters",
+    )
+    clients = {
+        "get_parameter_store_client": Mock(ssm_client=ssm),
+        "get_ecs_client": Mock(ecs_client=ecs),
+        "get_ecr_client": Mock(ecr_client=ecr),
+    }
+    for getter, client in clients.items():
+
+        async def get_client(client=client):
+            return client
+
+        monkeypatch.setattr(aws, getter, get_client)
+
+    await aws.warmup()
+
+    ssm.describe_parameters.assert_called_once_with(MaxResults=1)
+    ecs.list_clusters.assert_called_once_with(maxResults=1)
+    ecr.describe_repositories.assert_called_once_with(maxResults=1)
+
+
+@pytest.mark.asyncio
+async def test_get_service_returns_service_info(ecs_client):
+    """Test that a described service is returned as a ServiceInfo."""
+    arn = "arn:aws:ecs:us-west-2:123:service/cluster/api"
+    ecs_client.ecs_client.describe_services.return_value = {
+        "services": [_ecs_service(arn)]
+    }
+
+    service = await ecs_client.get_service("api")
+
+    assert service == ServiceInfo(
+        service_name="api",
+        service_arn=arn,
+        status="ACTIVE",
+        running_count=1,
+        desired_count=1,
+        task_definition="task:1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_repository_concurrent_calls_share_request(ecr_client):
+    """Test that concurrent create-or-get calls send one CreateRepository."""
+    repository = {"repositoryName": "api", "repositoryUri": "123.dkr/api"}
+    ecr_client.ecr_client.create_repository.return_value = {"repository": repository}
+
+    results = await asyncio.gather(
+        ecr_client.create_repository("api"), ecr_client.create_repository("api")
+    )
+
+    assert results == [repository, repository]
+    ecr_client.ecr_client.create_repository.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_repository_existing_is_described_once(ecr_client):
+    """Test that an existing repository is described once and then cached."""
+    repository = {"repositoryName": "api", "repositoryUri": "123.dkr/api"}
+    ecr_client.ecr_client.create_repository.side_effect = ClientError(
+        {"Error": {"Code": "RepositoryAlreadyExistsException", "Message": "exists"}},
+        "CreateRepository",
+    )
+    ecr_client.ecr_client.describe_repositories.return_value = {
+        "repositories": [repository]
+    }
+
+    assert await ecr_client.create_repository("api") == repository
+    assert await ecr_client.create_repository("api") == repository
+    assert await ecr_client.describe_repositories(["api"]) == [repository]
+
+    ecr_client.ecr_client.create_repository.assert_called_once()
+    ecr_client.ecr_client.describe_repositories.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_repository_evicts_cache(ecr_client):
+    """Test that a deleted repository is fetched again on the next describe."""
+    repository = {"repositoryName": "api", "repositoryUri": "123.dkr/api"}
+    ecr_client.ecr_client.describe_repositories.return_value = {
+        "repositories": [repository]
+    }
+
+    await ecr_client.describe_repositories(["api"])
+    await ecr_client.delete_repository("api")
+    await ecr_client.describe_repositories(["api"])
+
+    assert ecr_client.ecr_client.describe_repositories.call_count == 2
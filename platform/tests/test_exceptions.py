@@ -0,0 +1,51 @@
+"""
+Tests for the platform exception hierarchy.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.exceptions import (
+    AuthenticationError,
+    GitHubError,
+    PlatformException,
+    ValidationError,
+)
+
+
+def test_details_default_is_shared_and_empty():
+    """Test that exceptions without details share one empty default."""
+    first = ValidationError("bad input")
+    second = AuthenticationError()
+
+    assert first.details == {}
+    assert first.details is second.details
+
+
+def test_ensure_details_returns_private_dict():
+    """Test that ensure_details gives each exception its own writable dict."""
+    exc = PlatformException("boom")
+    details = exc.ensure_details()
+    details["key"] = "value"
+
+    assert exc.details == {"key": "value"}
+    assert PlatformException("other").details == {}
+    assert exc.ensure_details() is details
+
+
+@pytest.mark.parametrize(
+    "round_trip", [copy.copy, lambda exc: pickle.loads(pickle.dumps(exc))]
+)
+def test_copy_and_pickle_keep_error_context(round_trip):
+    """Test that copied and unpickled exceptions keep all their fields."""
+    exc = GitHubError("x", details={"status_code": 403})
+
+    restored = round_trip(exc)
+
+    assert type(restored) is GitHubError
+    assert restored.message == "x"
+    assert restored.error_type == exc.error_type
+    assert restored.status_code == exc.status_code
+    assert restored.details == {"status_code": 403}
@@ -0,0 +1,877 @@
+"""
+Tests for the GitHub API client.
+
+These tests exercise GitHubClient request handling against a mocked
+HTTP client, without talking to the real GitHub API.
+"""
+
+import asyncio
+import base64
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.exceptions import GitHubError
+from src.integrations import github
+from src.integrations.github import GitHubClient
+
+
+def _response(status_code=200, json_data=None, text="", headers=None):
+    """Build a mock httpx response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_data
+    response.content = json.dumps(json_data).encode()
+    response.text = text
+    return response
+
+
+def _request_body(kwargs):
+    """Decode the JSON body of a mocked HTTP client call."""
+    if "content" in kwargs:
+        return json.loads(kwargs["content"])
+    return kwargs["json"]
+
+
+def _graphql_page(names, has_next_page=False, end_cursor=None):
+    """Build a GraphQL organization repositories page."""
+    return {
+        "data": {
+            "organization": {
+                "repositories": {
+                    "pageInfo": {
+                        "endCursor": end_cursor,
+                        "hasNextPage": has_next_page,
+                    },
+                    "nodes": [
+                        {
+                            "name": name,
+                            "nameWithOwner": f"test-org/{name}",
+                            "url": f"https://github.com/test-org/{name}",
+                            "description": None,
+                            "isPrivate": True,
+                            "createdAt": "2024-01-01T10:00:00Z",
+                            "updatedAt": "2024-01-01T12:00:00Z",
+                            "defaultBranchRef": {"name": "main"},
+                            "repositoryTopics": {
+                                "nodes": [{"topic": {"name": "muppet"}}]
+                            },
+                        }
+                        for name in names
+                    ],
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def github_client():
+    """Create a GitHubClient with a mocked HTTP client."""
+    client = GitHubClient()
+    client.organization = "test-org"
+    client._client = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_graphql_follows_cursor(github_client):
+    """Test that GraphQL pagination follows endCursor until the last page."""
+    github_client._client.post.side_effect = [
+        _response(json_data=_graphql_page(["a", "b"], True, "cursor-1")),
+        _response(json_data=_graphql_page(["c"])),
+    ]
+
+    repos = await github_client.fetch_repositories_graphql()
+
+    assert [r["name"] for r in repos] == ["a", "b", "c"]
+    assert repos[0]["topics"] == ["muppet"]
+    assert repos[0]["html_url"] == "https://github.com/test-org/a"
+    second_call = github_client._client.post.call_args_list[1]
+    assert second_call.kwargs["json"]["variables"]["cursor"] == "cursor-1"
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_graphql_errors(github_client):
+    """Test that GraphQL errors are surfaced as GitHubError."""
+    github_client._client.post.return_value = _response(
+        json_data={"errors": [{"message": "Bad credentials"}]}
+    )
+
+    with pytest.raises(GitHubError):
+        await github_client.fetch_repositories_graphql()
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_graphql_mock_mode():
+    """Test that mock mode returns the mock repositories."""
+    client = GitHubClient()
+    client._client = None
+
+    repos = await client.fetch_repositories_graphql()
+
+    assert repos == client._get_mock_repositories()
+
+
+@pytest.mark.asyncio
+async def test_discover_muppets_reuses_given_repositories(github_client):
+    """Test that discover_muppets scans a provided listing without fetching."""
+    repos = github_client._get_mock_repositories()
+    repos.append({**repos[0], "name": "not-a-muppet", "topics": []})
+    repos.append({**repos[0], "name": "no-topics", "topics": None})
+
+    muppets = await github_client.discover_muppets(repositories=repos)
+
+    assert [m.name for m in muppets] == ["test-muppet-1", "demo-api"]
+    github_client._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_setup_templates_continues_after_failed_file(github_client):
+    """Test that one failed template write does not stop the others."""
+    github_client._client.put.side_effect = [
+        _response(status_code=409),
+        _response(status_code=201),
+        _response(status_code=201),
+    ]
+
+    assert await github_client._setup_templates("repo") is True
+
+    paths = [
+        c.args[0].rsplit("/contents/", 1)[1]
+        for c in github_client._client.put.call_args_list
+    ]
+    assert paths == [
+        ".github/ISSUE_TEMPLATE/bug_report.md",
+        ".github/pull_request_template.md",
+        ".github/CODEOWNERS",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_uses_link_header_for_remaining_pages(
+    github_client,
+):
+    """Test that pages after the first are requested up to rel=last."""
+    link = (
+        '<https://api.github.com/organizations/1/repos?per_page=100&page=2>; rel="next", '
+        '<https://api.github.com/organizations/1/repos?per_page=100&page=3>; rel="last"'
+    )
+    pages = {
+        1: _response(json_data=[{"name": "a"}], headers={"link": link}),
+        2: _response(json_data=[{"name": "b"}]),
+        3: _response(json_data=[{"name": "c"}]),
+    }
+    github_client._client.get.side_effect = lambda url, params: pages[
+        dict(params)["page"]
+    ]
+
+    repos = await github_client._fetch_repositories()
+
+    assert [r["name"] for r in repos] == ["a", "b", "c"]
+    assert github_client._client.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_without_link_header_pages_sequentially(
+    github_client,
+):
+    """Test that a full page without a Link header is followed by the next."""
+    github_client._client.get.side_effect = [
+        _response(json_data=[{"name": f"r{i}"} for i in range(100)]),
+        _response(json_data=[{"name": "last"}]),
+    ]
+
+    repos = await github_client._fetch_repositories()
+
+    assert len(repos) == 101
+    assert dict(github_client._client.get.call_args.kwargs["params"])["page"] == 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_until_closed():
+    """Test that clients share one HTTP pool and a new one follows close."""
+    first = github._get_http_client("token")
+    assert github._get_http_client("token") is first
+    assert str(first.base_url) == "https://api.github.com"
+
+    await github.close_http_client()
+
+    second = github._get_http_client("token")
+    assert second is not first
+    await github.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_per_token():
+    """Test that a different token never reuses another token's client."""
+    first = github._get_http_client("token-a")
+    second = github._get_http_client("token-b")
+
+    assert second is not first
+    assert first.headers["Authorization"] == "token token-a"
+    assert second.headers["Authorization"] == "token token-b"
+    await github.close_http_client()
+
+
+def test_http_client_is_per_event_loop(monkeypatch):
+    """Test that each event loop gets its own client and closed ones are dropped."""
+    monkeypatch.setattr(github, "_http_clients", {})
+
+    async def get_client():
+        return github._get_http_client("token")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert second is not first
+    assert list(github._http_clients.values()) == [second]
+
+
+@pytest.mark.asyncio
+async def test_get_repository_served_from_cache(github_client):
+    """Test that concurrent and repeated lookups share one request."""
+    github_client._client.get.return_value = _response(json_data={"name": "repo"})
+
+    results = await asyncio.gather(
+        github_client.get_repository("repo"), github_client.get_repository("repo")
+    )
+    again = await github_client.get_repository("repo")
+
+    assert results == [again, again] == [{"name": "repo"}, {"name": "repo"}]
+    github_client._client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_file_invalidates_cached_content(github_client):
+    """Test that writing a file drops its cached content."""
+    github_client._client.get.side_effect = [
+        _response(json_data={"content": base64.b64encode(b"old").decode()}),
+        _response(json_data={"sha": "abc"}),
+        _response(json_data={"content": base64.b64encode(b"new").decode()}),
+    ]
+    github_client._client.put.return_value = _response(status_code=200)
+
+    assert await github_client.get_file_content("org/repo", "README.md") == "old"
+    await github_client.update_file("org/repo", "README.md", "new", "Update")
+
+    assert await github_client.get_file_content("org/repo", "README.md") == "new"
+
+
+@pytest.mark.asyncio
+async def test_expired_read_revalidated_with_etag(github_client, monkeypatch):
+    """Test that an expired entry is revalidated and a 304 reuses its body."""
+    monkeypatch.setattr(github_client.settings.github, "cache_ttl", 0)
+    github_client._client.get.side_effect = [
+        _response(json_data=[{"name": "v1"}], headers={"etag": '"abc"'}),
+        _response(status_code=304),
+    ]
+
+    first = await github_client.list_tags("org/repo")
+    second = await github_client.list_tags("org/repo")
+
+    assert first == second == [{"name": "v1"}]
+    revalidation = github_client._client.get.call_args_list[1]
+    assert revalidation.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+@pytest.mark.asyncio
+async def test_push_files_batch_aborts_uploads_on_auth_failure(github_client):
+    """Test that a rejected blob upload cancels the remaining uploads."""
+    github_client._get_branch_head = AsyncMock(
+        return_value=("main", "c" * 40, "t" * 40)
+    )
+    github_client._create_tree_with_retry = AsyncMock()
+    blocked = asyncio.Event()
+    cancelled = []
+
+    async def post(url, **kwargs):
+        content = _request_body(kwargs).get("content")
+        if url == "/graphql":
+            return _response(json_data={"errors": [{"message": "unsupported"}]})
+        if content == "denied":
+            return _response(status_code=403, text="Resource not accessible")
+        try:
+            await blocked.wait()
+        except asyncio.CancelledError:
+            cancelled.append(content)
+            raise
+
+    github_client._client.post.side_effect = post
+
+    files = {"a.txt": "slow", "b.txt": "denied"}
+    assert not await github_client._push_files_batch("repo", files, "Add files")
+
+    assert cancelled == ["slow"]
+    github_client._create_tree_with_retry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_branch_ref_retries_until_repository_initialized(
+    github_client, monkeypatch
+):
+    """Test that a missing ref on a new repository is retried with backoff."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(github.asyncio, "sleep", sleep)
+    ref = {"object": {"sha": "c" * 40}}
+    github_client._client.get.side_effect = [
+        _response(status_code=409),
+        _response(json_data={"default_branch": "main"}),
+        _response(json_data=ref),
+    ]
+
+    assert await github_client._get_branch_ref("repo", "main") == ref
+    assert delays == [github.BRANCH_REF_RETRY_DELAY]
+
+
+@pytest.mark.asyncio
+async def test_get_branch_head_reads_commit_and_tree_in_one_request(github_client):
+    """Test that the branches endpoint supplies both the commit and tree SHA."""
+    github_client._client.get.return_value = _response(
+        json_data={
+            "name": "main",
+            "commit": {"sha": "c" * 40, "commit": {"tree": {"sha": "t" * 40}}},
+        }
+    )
+
+    head = await github_client._get_branch_head("repo", "main")
+
+    assert head == ("main", "c" * 40, "t" * 40)
+    github_client._client.get.assert_called_once()
+    assert github_client._client.get.call_args.args[0] == (
+        "/repos/test-org/repo/branches/main"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_branch_head_falls_back_to_ref_lookup(github_client):
+    """Test that a missing branch falls back to the ref and default branch."""
+    github_client._get_branch_ref = AsyncMock(
+        return_value={"ref": "refs/heads/master", "object": {"sha": "c" * 40}}
+    )
+    github_client._client.get.return_value = _response(status_code=404)
+
+    head = await github_client._get_branch_head("repo", "main")
+
+    assert head == ("master", "c" * 40, None)
+
+
+@pytest.mark.asyncio
+async def test_push_files_batch_commits_through_graphql(github_client):
+    """Test that a batch push is one createCommitOnBranch mutation."""
+    github_client._get_branch_head = AsyncMock(return_value=("main", "c" * 40, None))
+    github_client._get_commit_tree_sha = AsyncMock()
+    github_client._client.post.return_value = _response(
+        json_data={"data": {"createCommitOnBranch": {"commit": {"oid": "d" * 40}}}}
+    )
+
+    files = {"README.md": "hello", "logo.png": b"\x89PNG"}
+    assert await github_client._push_files_batch("repo", files, "Add files")
+
+    github_client._client.post.assert_called_once()
+    url = github_client._client.post.call_args.args[0]
+    commit_input = _request_body(github_client._client.post.call_args.kwargs)[
+        "variables"
+    ]["input"]
+    assert url == "/graphql"
+    assert commit_input["branch"] == {
+        "repositoryNameWithOwner": "test-org/repo",
+        "branchName": "main",
+    }
+    assert commit_input["expectedHeadOid"] == "c" * 40
+    assert commit_input["fileChanges"]["additions"] == [
+        {"path": "README.md", "contents": base64.b64encode(b"hello").decode()},
+        {"path": "logo.png", "contents": base64.b64encode(b"\x89PNG").decode()},
+    ]
+    github_client._get_commit_tree_sha.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_push_files_batch_keeps_executable_mode(github_client):
+    """Test that pushes with executable files skip GraphQL and keep 100755."""
+    github_client._get_branch_head = AsyncMock(
+        return_value=("main", "c" * 40, "t" * 40)
+    )
+    github_client._create_tree_with_retry = AsyncMock(return_value=True)
+    github_client._client.post.return_value = _response(
+        status_code=201, json_data={"sha": "b" * 40}
+    )
+
+    files = {"gradlew": "#!/bin/sh", "README.md": "hello"}
+    assert await github_client._push_files_batch("repo", files, "Add files")
+
+    urls = [c.args[0] for c in github_client._client.post.call_args_list]
+    assert "/graphql" not in urls
+    tree_entries = github_client._create_tree_with_retry.call_args.args[1]
+    modes = {e["path"]: e["mode"] for e in tree_entries}
+    assert modes == {"gradlew": "100755", "README.md": "100644"}
+
+
+@pytest.mark.asyncio
+async def test_push_files_batch_creates_blobs_concurrently(github_client):
+    """Test that blobs are uploaded together and committed as one tree."""
+    github_client._get_branch_head = AsyncMock(
+        return_value=("main", "c" * 40, "t" * 40)
+    )
+    github_client._get_commit_tree_sha = AsyncMock()
+    github_client._create_tree_with_retry = AsyncMock(return_value=True)
+
+    in_flight = 0
+    peak = 0
+    payloads = []
+
+    async def post(url, **kwargs):
+        nonlocal in_flight, peak
+        if url == "/graphql":
+            return _response(json_data={"errors": [{"message": "unsupported"}]})
+        payloads.append(_request_body(kwargs))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _response(status_code=201, json_data={"sha": "b" * 40})
+
+    github_client._client.post.side_effect = post
+
+    files = {"README.md": "hello", "src/app.py": "print()", "logo.png": b"\x89PNG"}
+    assert await github_client._push_files_batch("repo", files, "Add files")
+
+    assert peak == 3
+    assert payloads[0] == {"content": "hello", "encoding": "utf-8"}
+    assert payloads[2] == {
+        "content": base64.b64encode(b"\x89PNG").decode(),
+        "encoding": "base64",
+    }
+    github_client._get_commit_tree_sha.assert_not_called()
+    tree_entries = github_client._create_tree_with_retry.call_args.args[1]
+    assert [e["path"] for e in tree_entries] == list(files)
+
+
+@pytest.mark.asyncio
+async def test_create_file_encodes_text_and_bytes(github_client):
+    """Test that text and binary content are both sent base64-encoded."""
+    github_client._client.put.return_value = _response(status_code=201)
+
+    assert await github_client._create_file("repo", "a.txt", "héllo", "Add a")
+    assert await github_client._create_file("repo", "b.bin", b"\x00\xff", "Add b")
+
+    contents = [
+        _request_body(c.kwargs)["content"]
+        for c in github_client._client.put.call_args_list
+    ]
+    assert contents == [
+        base64.b64encode("héllo".encode()).decode(),
+        base64.b64encode(b"\x00\xff").decode(),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_retries_rate_limited_responses(github_client, monkeypatch):
+    """Test that 429 and rate-limited 403 responses are retried with backoff."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(github.asyncio, "sleep", sleep)
+    monkeypatch.setattr(github.random, "uniform", lambda a, b: 0)
+    github_client._client.get.side_effect = [
+        _response(status_code=429, headers={"retry-after": "3"}),
+        _response(status_code=403, headers={"x-ratelimit-remaining": "0"}),
+        _response(json_data={"name": "repo"}),
+    ]
+
+    assert await github_client.get_repository("repo") == {"name": "repo"}
+
+    assert [c.args[0] for c in sleep.call_args_list] == [3.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_gateway_errors_for_writes(
+    github_client, monkeypatch
+):
+    """Test that 5xx responses to POSTs are returned, but 429s retried."""
+    monkeypatch.setattr(github.asyncio, "sleep", AsyncMock())
+    github_client._client.post.return_value = _response(status_code=502)
+
+    response = await github_client._request("post", "/orgs/test-org/repos")
+
+    assert response.status_code == 502
+    github_client._client.post.assert_called_once()
+
+    github_client._client.post.side_effect = [
+        _response(status_code=429),
+        _response(status_code=201),
+    ]
+    response = await github_client._request("post", "/orgs/test-org/repos")
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_attempts(github_client, monkeypatch):
+    """Test that persistent server errors are returned after five attempts."""
+    monkeypatch.setattr(github.asyncio, "sleep", AsyncMock())
+    github_client._client.get.return_value = _response(status_code=503)
+
+    with pytest.raises(GitHubError):
+        await github_client.get_repository("repo")
+
+    assert github_client._client.get.call_count == github.GITHUB_MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_permission_errors(github_client):
+    """Test that a 403 unrelated to rate limits is returned immediately."""
+    github_client._client.get.return_value = _response(status_code=403)
+
+    with pytest.raises(GitHubError):
+        await github_client.get_repository("repo")
+
+    github_client._client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_discover_muppets_uses_graphql(github_client):
+    """Test that discovery reads repositories via GraphQL when it works."""
+    github_client._client.post.return_value = _response(
+        json_data=_graphql_page(["api", "worker"])
+    )
+
+    muppets = await github_client.discover_muppets()
+
+    assert [m.name for m in muppets] == ["api", "worker"]
+    github_client._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_discover_muppets_falls_back_to_search(github_client):
+    """Test that discovery searches by topic when GraphQL fails."""
+    repos = github_client._get_mock_repositories()
+    github_client._client.post.return_value = _response(status_code=401)
+    github_client._client.get.return_value = _response(
+        json_data={"total_count": 2, "incomplete_results": False, "items": repos}
+    )
+
+    muppets = await github_client.discover_muppets()
+
+    assert [m.name for m in muppets] == ["test-muppet-1", "demo-api"]
+    search = github_client._client.get.call_args
+    assert search.args[0] == "/search/repositories"
+    assert search.kwargs["params"]["q"] == "org:test-org topic:muppet"
+
+
+@pytest.mark.asyncio
+async def test_discover_muppets_lists_all_when_search_is_capped(github_client):
+    """Test that the full listing is used when search cannot return everything."""
+    github_client._client.post.return_value = _response(status_code=401)
+    github_client._client.get.side_effect = [
+        _response(
+            json_data={"total_count": 1500, "incomplete_results": False, "items": []}
+        ),
+        _response(json_data=github_client._get_mock_repositories()),
+    ]
+
+    muppets = await github_client.discover_muppets()
+
+    assert [m.name for m in muppets] == ["test-muppet-1", "demo-api"]
+    assert github_client._client.get.call_args.args[0] == "/orgs/test-org/repos"
+
+
+@pytest.mark.asyncio
+async def test_file_requests_send_ref_parameter(github_client):
+    """Test that file reads and the SHA lookup target the requested ref."""
+    github_client._client.get.side_effect = [
+        _response(json_data={"content": base64.b64encode(b"v2").decode()}),
+        _response(json_data={"sha": "abc"}),
+    ]
+    github_client._client.put.return_value = _response(status_code=200)
+
+    await github_client.get_file_content("org/repo", "VERSION", ref="release")
+    await github_client.update_file("org/repo", "VERSION", "v3", "Bump", "release")
+
+    params = [c.kwargs["params"] for c in github_client._client.get.call_args_list]
+    assert params == [{"ref": "release"}, {"ref": "release"}]
+
+
+@pytest.mark.asyncio
+async def test_get_repository_uses_listing_snapshot(github_client):
+    """Test that a repository from a recent full listing needs no request."""
+    repos = github_client._get_mock_repositories()
+    github_client._client.get.return_value = _response(json_data=repos)
+
+    await github_client._fetch_repositories()
+    repository = await github_client.get_repository("demo-api")
+
+    assert repository == repos[1]
+    github_client._client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_repository_uses_discovery_snapshot(github_client):
+    """Test that repositories found by GraphQL discovery need no request."""
+    github_client._client.post.return_value = _response(
+        json_data=_graphql_page(["a", "b"])
+    )
+
+    await github_client.discover_muppets()
+    repository = await github_client.get_repository("b")
+
+    assert repository["full_name"] == "test-org/b"
+    assert repository["default_branch"] == "main"
+    github_client._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_repository_builds_mock_index_once(github_client):
+    """Test that mock lookups index the mock repositories only once."""
+    github_client._client = None
+    github_client._get_mock_repositories = Mock(
+        wraps=github_client._get_mock_repositories
+    )
+
+    assert (await github_client.get_repository("demo-api"))["name"] == "demo-api"
+    assert await github_client.get_repository("missing") is None
+
+    github_client._get_mock_repositories.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_file_bytes_requests_raw_content(github_client):
+    """Test that file bytes are requested raw and returned undecoded."""
+    response = _response()
+    response.content = b"\x89PNG\r\n"
+    github_client._client.get.return_value = response
+
+    content = await github_client.get_file_bytes("org/repo", "logo.png", ref="v1")
+
+    assert content == b"\x89PNG\r\n"
+    call = github_client._client.get.call_args
+    assert call.kwargs["headers"] == {"Accept": "application/vnd.github.raw"}
+    assert call.kwargs["params"] == {"ref": "v1"}
+
+
+@pytest.mark.asyncio
+async def test_list_tags_names_only_uses_graphql(github_client):
+    """Test that names_only tags come from GraphQL with commits resolved."""
+    github_client._client.post.return_value = _response(
+        json_data={
+            "data": {
+                "repository": {
+                    "refs": {
+                        "pageInfo": {"endCursor": None, "hasNextPage": False},
+                        "nodes": [
+                            {"name": "v2", "target": {"oid": "c2"}},
+                            {
+                                "name": "v1",
+                                "target": {"oid": "t1", "target": {"oid": "c1"}},
+                            },
+                        ],
+                    }
+                }
+            }
+        }
+    )
+
+    tags = await github_client.list_tags("org/repo", names_only=True)
+
+    assert tags == [
+        {"name": "v2", "commit": {"sha": "c2"}},
+        {"name": "v1", "commit": {"sha": "c1"}},
+    ]
+    github_client._client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_concurrency_is_capped(github_client):
+    """Test that no more than max_concurrency requests are in flight."""
+    github_client._sem = asyncio.Semaphore(2)
+    in_flight = 0
+    peak = 0
+
+    async def get(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _response(json_data={"name": url})
+
+    github_client._client.get.side_effect = get
+
+    await asyncio.gather(*(github_client.get_repository(f"r{i}") for i in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.parametrize(
+    "file_path, valid",
+    [
+        ("src/app.py", True),
+        (".github/workflows/ci.yml", True),
+        ("", False),
+        ("/etc/passwd", False),
+        ("src/../secrets", False),
+        ("src//app.py", False),
+        ("src/", False),
+        ("src\\app.py", False),
+        ("src/app\n.py", False),
+        ("src/app\0.py", False),
+        ("a" * 4097, False),
+    ],
+)
+def test_is_valid_file_path(file_path, valid):
+    """Test that tree paths are checked against GitHub's restrictions."""
+    assert GitHubClient()._is_valid_file_path(file_path) is valid
+
+
+@pytest.mark.parametrize(
+    "sha, valid",
+    [("a" * 40, True), ("a" * 39, False), ("g" * 40, False), (None, False)],
+)
+def test_is_valid_sha(sha, valid):
+    """Test that only full hex SHAs are accepted."""
+    assert GitHubClient()._is_valid_sha(sha) is valid
+
+
+@pytest.mark.asyncio
+async def test_create_tree_skips_validation_for_validated_entries(github_client):
+    """Test that entries marked validated are not checked again."""
+    github_client._validate_tree_entry = Mock(return_value=True)
+    github_client._client.post.return_value = _response(
+        status_code=201, json_data={"sha": "t" * 40}
+    )
+    entries = [{"path": "a.txt", "mode": "100644", "type": "blob", "sha": "b" * 40}]
+
+    tree = await github_client._create_tree("repo", entries, None, validated=True)
+    assert tree == ("t" * 40, 201)
+    github_client._validate_tree_entry.assert_not_called()
+
+    assert await github_client._create_tree("repo", entries, None) == ("t" * 40, 201)
+    github_client._validate_tree_entry.assert_called_once()
+
+
+def _tree_poster(trees, failing_base=None):
+    """Answer create-tree posts with the next tree SHA, failing one base."""
+    shas = iter(["1", "2", "3"])
+
+    async def post(url, **kwargs):
+        body = _request_body(kwargs)
+        trees.append((body.get("base_tree"), [e["path"] for e in body["tree"]]))
+        if failing_base and body.get("base_tree") == failing_base:
+            return _response(status_code=422, text="Unprocessable")
+        return _response(status_code=201, json_data={"sha": next(shas) * 40})
+
+    return post
+
+
+@pytest.mark.asyncio
+async def test_create_tree_in_batches_makes_one_commit(github_client, monkeypatch):
+    """Test that batched trees are layered and committed once."""
+    monkeypatch.setattr(github, "TREE_BATCH_SIZE", 2)
+    trees = []
+    github_client._client.post.side_effect = _tree_poster(trees)
+    github_client._complete_commit = AsyncMock(return_value=True)
+    entries = [
+        {"path": f"f{i}", "mode": "100644", "type": "blob", "sha": "b" * 40}
+        for i in range(5)
+    ]
+
+    assert await github_client._create_tree_in_batches(
+        "repo", entries, "a" * 40, "parent", "Initial commit"
+    )
+
+    assert trees == [
+        ("a" * 40, ["f0", "f1"]),
+        ("1" * 40, ["f2", "f3"]),
+        ("2" * 40, ["f4"]),
+    ]
+    github_client._complete_commit.assert_awaited_once_with(
+        "repo", "3" * 40, "parent", "Initial commit"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_tree_in_batches_keeps_layered_base(github_client, monkeypatch):
+    """Test that a failed layered batch is not retried without its base."""
+    monkeypatch.setattr(github, "TREE_BATCH_SIZE", 1)
+    trees = []
+    github_client._client.post.side_effect = _tree_poster(trees, "1" * 40)
+    github_client._complete_commit = AsyncMock(return_value=True)
+    entries = [
+        {"path": f"f{i}", "mode": "100644", "type": "blob", "sha": "b" * 40}
+        for i in range(2)
+    ]
+
+    assert not await github_client._create_tree_in_batches(
+        "repo", entries, "a" * 40, "parent", "Initial commit"
+    )
+
+    assert trees == [("a" * 40, ["f0"]), ("1" * 40, ["f1"])]
+    github_client._complete_commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status_code, batch_size, batched",
+    [(422, 2, False), (500, 1, False), (422, 1, True)],
+)
+async def test_create_tree_with_retry_batches_only_large_rejected_trees(
+    github_client, monkeypatch, status_code, batch_size, batched
+):
+    """Test that only a 422 for more than TREE_BATCH_SIZE entries is batched."""
+    monkeypatch.setattr(github, "TREE_BATCH_SIZE", batch_size)
+    github_client._client.post.return_value = _response(status_code=status_code)
+    github_client._create_tree_in_batches = AsyncMock(return_value=True)
+    entries = [
+        {"path": f"f{i}", "mode": "100644", "type": "blob", "sha": "b" * 40}
+        for i in range(2)
+    ]
+
+    result = await github_client._create_tree_with_retry(
+        "repo", entries, "a" * 40, "parent", "Initial commit"
+    )
+
+    assert result is batched
+    assert github_client._create_tree_in_batches.called is batched
+    # One request with base_tree and one without
+    assert github_client._client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_large_binary_blob_encoded_in_worker_thread(github_client, monkeypatch):
+    """Test that large binary content is base64-encoded off the event loop."""
+    real_to_thread = asyncio.to_thread
+    offloaded = []
+
+    async def to_thread(func, *args):
+        offloaded.append(func)
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(github.asyncio, "to_thread", to_thread)
+    github_client._client.post.return_value = _response(
+        status_code=201, json_data={"sha": "b" * 40}
+    )
+    content = b"\0" * (github.ENCODE_IN_THREAD_BYTES + 1)
+
+    assert await github_client._create_blob_validated("repo", b"small", "a.bin")
+    assert not offloaded
+    assert await github_client._create_blob_validated("repo", content, "b.bin")
+
+    assert offloaded == [github._blob_payload]
+    payload = _request_body(github_client._client.post.call_args.kwargs)
+    assert payload["content"] == base64.b64encode(content).decode()
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_json_body_matches_stdlib_encoding(monkeypatch, orjson_available):
+    """Test that push bodies decode the same with and without orjson."""
+    monkeypatch.setattr(github, "ORJSON_AVAILABLE", orjson_available)
+    payload = {"tree": [{"path": "café.txt", "sha": "b" * 40}]}
+
+    body = github._json_body(payload)
+
+    assert _request_body(body) == payload
+    if orjson_available:
+        assert body["headers"] == {"Content-Type": "application/json"}
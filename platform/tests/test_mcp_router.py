@@ -0,0 +1,74 @@
+"""
+Tests for the MCP tools HTTP API router.
+
+These tests exercise the batch execution endpoint with a mocked
+tool registry.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the FastAPI application."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_registry():
+    """Create a tool registry that echoes tool names and fails on 'broken'."""
+
+    async def execute_tool(name, arguments):
+        if name == "broken":
+            raise ValueError("Unknown tool: broken")
+        return json.dumps({"tool": name, "arguments": arguments})
+
+    registry = MagicMock()
+    registry.execute_tool = AsyncMock(side_effect=execute_tool)
+    with patch("src.routers.mcp.get_mcp_tool_registry", return_value=registry):
+        yield registry
+
+
+def test_execute_batch_returns_results_by_id(client, mock_registry):
+    """Test that batch results keep request order and ids."""
+    response = client.post(
+        "/mcp/tools/execute_batch",
+        json={
+            "batch": [
+                {"tool": "list_templates", "arguments": {}, "id": 7},
+                {"tool": "get_muppet_status", "arguments": {"name": "a"}, "id": 8},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["id"] for r in results] == [7, 8]
+    assert results[1]["result"] == {
+        "tool": "get_muppet_status",
+        "arguments": {"name": "a"},
+    }
+
+
+def test_execute_batch_reports_item_errors_inline(client, mock_registry):
+    """Test that a failing tool does not fail the rest of the batch."""
+    response = client.post(
+        "/mcp/tools/execute_batch",
+        json={
+            "batch": [
+                {"tool": "broken", "id": 1},
+                {"tool": "list_templates", "id": 2},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"id": 1, "error": "Unknown tool: broken"}
+    assert results[1]["result"]["tool"] == "list_templates"
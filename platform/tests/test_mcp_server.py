@@ -21,12 +21,12 @@ def enable_debug_mode():
     """Enable debug mode for all tests."""
     with patch.dict(os.environ, {"DEBUG": "true"}):
         # Clear the settings cache to pick up the new environment variable
-        from src.config import get_settings
+        from src.config import reset_settings
 
-        get_settings.cache_clear()
+        reset_settings()
         yield
         # Clear cache again after test
-        get_settings.cache_clear()
+        reset_settings()
 
 
 class TestMCPServer:
@@ -910,6 +910,60 @@ class TestMCPToolRegistry:
         assert response["total_versions"] > 0
         assert response["latest_version"] is not None
 
+    @pytest.mark.asyncio
+    async def test_list_workflow_versions_latest_from_graphql_tags(self, tool_registry):
+        """Test that the newest GraphQL tag is reported as the latest version."""
+        import json
+
+        from src.integrations.github import GitHubClient
+
+        github_client = GitHubClient()
+        github_client._client = AsyncMock()
+        # GitHub answers the TAG_COMMIT_DATE DESC ordering newest first
+        github_client._client.post.return_value = MagicMock(
+            status_code=200,
+            content=json.dumps(
+                {
+                    "data": {
+                        "repository": {
+                            "refs": {
+                                "pageInfo": {"endCursor": None, "hasNextPage": False},
+                                "nodes": [
+                                    {
+                                        "name": "java-micronaut-v1.10.0",
+                                        "target": {"oid": "c3"},
+                                    },
+                                    {
+                                        "name": "java-micronaut-v1.2.0",
+                                        "target": {"oid": "c2"},
+                                    },
+                                    {
+                                        "name": "java-micronaut-v1.1.0",
+                                        "target": {"oid": "c1"},
+                                    },
+                                ],
+                            }
+                        }
+                    }
+                }
+            ).encode(),
+        )
+        github_client.get_file_content = AsyncMock(
+            return_value='{"workflows": {"ci": "v1.0.0"}, "requirements": {}}'
+        )
+
+        with patch("src.platform_mcp.tools.GitHubClient", return_value=github_client):
+            result = await tool_registry.execute_tool(
+                "list_workflow_versions", {"template_type": "java-micronaut"}
+            )
+
+        response = json.loads(result)
+        assert "TAG_COMMIT_DATE, direction: DESC" in GitHubClient._TAGS_QUERY
+        assert response["latest_version"] == "java-micronaut-v1.10.0"
+        assert github_client.get_file_content.call_args.kwargs["ref"] == (
+            "java-micronaut-v1.10.0"
+        )
+
     @pytest.mark.asyncio
     async def test_execute_list_workflow_versions_invalid_template(self, tool_registry):
         """Test executing list_workflow_versions tool with invalid template type."""
@@ -187,12 +187,12 @@ class TestMCPAuthenticationProperty:
         # Disable debug mode to test actual authentication
         with patch.dict(os.environ, {"DEBUG": "false"}):
             # Clear the settings cache to pick up the new environment variable
-            from src.config import get_settings
+            from src.config import reset_settings
 
-            get_settings.cache_clear()
+            reset_settings()
             yield
             # Clear cache again after test
-            get_settings.cache_clear()
+            reset_settings()
 
     @given(authenticated_mcp_request())
     # Minimum 100 iterations as per design
@@ -493,9 +493,9 @@ class TestMCPAuthenticationProperty:
         async def async_test():
             # Enable debug mode
             with patch.dict(os.environ, {"DEBUG": "true"}):
-                from src.config import get_settings
+                from src.config import reset_settings
 
-                get_settings.cache_clear()
+                reset_settings()
 
                 authenticator = MCPAuthenticator()
 
@@ -512,6 +512,6 @@ class TestMCPAuthenticationProperty:
                     is_authenticated is True
                 ), "Debug mode should bypass authentication and allow all requests"
 
-                get_settings.cache_clear()
+                reset_settings()
 
         run_async_test(async_test())